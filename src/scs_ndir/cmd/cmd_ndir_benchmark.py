@@ -0,0 +1,132 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_ndir import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdNDIRBenchmark(object):
+    """unix command line handler"""
+
+    __MODELS = ('x1', 't1f1')
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-e MODEL [-t SCALE]] [-c REPEATS] [-s SAMPLES] "
+                                                    "[-m SECONDS] [-l REPEATS] [-r REPEATS] [-x] [-v]",
+                                              version=version())
+
+        # target...
+        self.__parser.add_option("--emulate", "-e", type="string", action="store", dest="emulate",
+                                 help="run against an emulated { x1 | t1f1 } board")
+
+        self.__parser.add_option("--time-scale", "-t", type="float", action="store", dest="time_scale", default=1.0,
+                                 help="emulator delay multiplier (default 1.0)")
+
+        # benchmarks...
+        self.__parser.add_option("--commands", "-c", type="int", action="store", dest="commands", default=20,
+                                 help="repeats of each command (default 20, 0 to skip)")
+
+        self.__parser.add_option("--samples", "-s", type="int", action="store", dest="samples", default=5,
+                                 help="samples through NDIRSampler (default 5, 0 to skip)")
+
+        self.__parser.add_option("--monitor", "-m", type="float", action="store", dest="monitor", default=10.0,
+                                 help="seconds of NDIRMonitor sampling (default 10, 0 to skip)")
+
+        self.__parser.add_option("--calib", "-l", type="int", action="store", dest="calib", default=3,
+                                 help="repeats of retrieve_calib and store_calib (default 3, 0 to skip)")
+
+        self.__parser.add_option("--recorder", "-r", type="int", action="store", dest="recorder", default=3,
+                                 help="repeats of a 250-sample record_raw, with -x only (default 3)")
+
+        self.__parser.add_option("--disruptive", "-x", action="store_true", dest="disruptive", default=False,
+                                 help="include reset, calib write, lamp, calibrate, sampler mode and recorder commands")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.emulate is not None and self.emulate not in self.__MODELS:
+            return False
+
+        if self.time_scale < 0:
+            return False
+
+        if self.commands < 0 or self.samples < 0 or self.monitor < 0 or self.calib < 0 or self.recorder < 0:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def emulate(self):
+        return self.__opts.emulate
+
+
+    @property
+    def time_scale(self):
+        return self.__opts.time_scale
+
+
+    @property
+    def commands(self):
+        return self.__opts.commands
+
+
+    @property
+    def samples(self):
+        return self.__opts.samples
+
+
+    @property
+    def monitor(self):
+        return self.__opts.monitor
+
+
+    @property
+    def calib(self):
+        return self.__opts.calib
+
+
+    @property
+    def recorder(self):
+        return self.__opts.recorder
+
+
+    @property
+    def disruptive(self):
+        return self.__opts.disruptive
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdNDIRBenchmark:{emulate:%s, time_scale:%s, commands:%s, samples:%s, monitor:%s, calib:%s, " \
+               "recorder:%s, disruptive:%s, verbose:%s}" % \
+               (self.emulate, self.time_scale, self.commands, self.samples, self.monitor, self.calib,
+                self.recorder, self.disruptive, self.verbose)
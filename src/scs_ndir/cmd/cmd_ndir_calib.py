@@ -18,14 +18,21 @@ class CmdNDIRCalib(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -d | -s PATH VALUE | -r }] [-v]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [{ -d | -s PATH VALUE [-s PATH VALUE ...] | -p | -j | -r }] "
+                                                    "[-v]", version=version())
 
         # optional...
         self.__parser.add_option("--default", "-d", action="store_true", dest="default",
                                  help="load the default settings")
 
-        self.__parser.add_option("--set", "-s", type="string", nargs=2, action="store", dest="set",
-                                 help="set the named field to VALUE")
+        self.__parser.add_option("--set", "-s", type="string", nargs=2, action="append", dest="set",
+                                 help="set the named field to VALUE (may be repeated)")
+
+        self.__parser.add_option("--patch", "-p", action="store_true", dest="patch", default=False,
+                                 help="set the fields of a partial JSON document on stdin")
+
+        self.__parser.add_option("--resume", "-j", action="store_true", dest="resume", default=False,
+                                 help="complete an interrupted store")
 
         self.__parser.add_option("--restart", "-r", action="store_true", dest="restart",
                                  help="restart sampling with updated values")
@@ -45,7 +52,10 @@ class CmdNDIRCalib(object):
         if self.default is not None:
             param_count += 1
 
-        if self.__opts.set is not None:
+        if self.__opts.set is not None or self.patch:
+            param_count += 1
+
+        if self.resume:
             param_count += 1
 
         if self.restart is not None:
@@ -58,7 +68,7 @@ class CmdNDIRCalib(object):
 
 
     def set(self):
-        return self.__opts.set is not None
+        return self.__opts.set is not None or self.patch
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -69,19 +79,18 @@ class CmdNDIRCalib(object):
 
 
     @property
-    def path(self):
-        if self.set():
-            return self.__opts.set[0]
-
-        return None
+    def fields(self):
+        return [] if self.__opts.set is None else [tuple(field) for field in self.__opts.set]
 
 
     @property
-    def value(self):
-        if self.set():
-            return self.__opts.set[1]
+    def patch(self):
+        return self.__opts.patch
+
 
-        return None
+    @property
+    def resume(self):
+        return self.__opts.resume
 
 
     @property
@@ -101,5 +110,5 @@ class CmdNDIRCalib(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNDIRCalib:{default:%s, set:%s, restart:%s, verbose:%s}" % \
-               (self.default, self.__opts.set, self.restart, self.verbose)
+        return "CmdNDIRCalib:{default:%s, set:%s, patch:%s, resume:%s, restart:%s, verbose:%s}" % \
+               (self.default, self.__opts.set, self.patch, self.resume, self.restart, self.verbose)
@@ -0,0 +1,83 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_ndir import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdNDIRCalibImage(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog { -e | -i [-s] } [-v]", version=version())
+
+        # compulsory...
+        self.__parser.add_option("--export", "-e", action="store_true", dest="export", default=False,
+                                 help="write the board's calibration image to stdout")
+
+        self.__parser.add_option("--import", "-i", action="store_true", dest="import_image", default=False,
+                                 help="write the calibration image on stdin to the board")
+
+        # optional...
+        self.__parser.add_option("--serials", "-s", action="store_true", dest="serials", default=False,
+                                 help="on import, also write the image's ndir and board serial numbers")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.export == self.import_image:
+            return False
+
+        if self.serials and not self.import_image:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def export(self):
+        return self.__opts.export
+
+
+    @property
+    def import_image(self):
+        return self.__opts.import_image
+
+
+    @property
+    def serials(self):
+        return self.__opts.serials
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdNDIRCalibImage:{export:%s, import_image:%s, serials:%s, verbose:%s}" % \
+               (self.export, self.import_image, self.serials, self.verbose)
@@ -0,0 +1,100 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_ndir import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdNDIRMultiSampler(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-i INTERVAL [-n SAMPLES] [{ -y | -p }]] [-s] [-v]",
+                                              version=version())
+
+        # compulsory...
+        self.__parser.add_option("--interval", "-i", type="float", action="store", dest="interval",
+                                 help="sampling interval in seconds")
+
+        self.__parser.add_option("--samples", "-n", type="int", action="store", dest="samples",
+                                 help="number of samples (1 if interval not specified)")
+
+        # optional...
+        self.__parser.add_option("--status", "-s", action="store_true", dest="status", default=False,
+                                 help="report the board status with each sample")
+
+        self.__parser.add_option("--ready", "-y", action="store_true", dest="ready", default=False,
+                                 help="read each sample as soon as it is ready")
+
+        self.__parser.add_option("--pipelined", "-p", action="store_true", dest="pipelined", default=False,
+                                 help="trigger each sample as the last is read, on a fixed schedule")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.__opts.samples is not None and self.__opts.interval is None:
+            return False
+
+        if self.pipelined and (self.__opts.interval is None or self.ready):
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def interval(self):
+        return 1.0 if self.__opts.interval is None else self.__opts.interval
+
+
+    @property
+    def samples(self):
+        return 1 if self.__opts.interval is None else self.__opts.samples
+
+
+    @property
+    def status(self):
+        return self.__opts.status
+
+
+    @property
+    def ready(self):
+        return self.__opts.ready
+
+
+    @property
+    def pipelined(self):
+        return self.__opts.pipelined
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdNDIRMultiSampler:{interval:%s, samples:%s, status:%s, ready:%s, pipelined:%s, verbose:%s}" % \
+               (self.interval, self.samples, self.status, self.ready, self.pipelined, self.verbose)
@@ -18,7 +18,8 @@ class CmdNDIRPressure(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-i INTERVAL [-n SAMPLES]] [-v]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-i INTERVAL [-n SAMPLES] [{ -y | -p }]] [-v]",
+                                              version=version())
 
         # compulsory...
         self.__parser.add_option("--interval", "-i", type="float", action="store", dest="interval",
@@ -27,6 +28,13 @@ class CmdNDIRPressure(object):
         self.__parser.add_option("--samples", "-n", type="int", action="store", dest="samples",
                                  help="number of samples (1 if interval not specified)")
 
+        # optional...
+        self.__parser.add_option("--ready", "-y", action="store_true", dest="ready", default=False,
+                                 help="read each sample as soon as it is ready")
+
+        self.__parser.add_option("--pipelined", "-p", action="store_true", dest="pipelined", default=False,
+                                 help="trigger each sample as the last is read, on a fixed schedule")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -40,6 +48,9 @@ class CmdNDIRPressure(object):
         if self.__opts.samples is not None and self.__opts.interval is None:
             return False
 
+        if self.pipelined and (self.__opts.interval is None or self.ready):
+            return False
+
         return True
 
 
@@ -55,6 +66,16 @@ class CmdNDIRPressure(object):
         return 1 if self.__opts.interval is None else self.__opts.samples
 
 
+    @property
+    def ready(self):
+        return self.__opts.ready
+
+
+    @property
+    def pipelined(self):
+        return self.__opts.pipelined
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -67,4 +88,5 @@ class CmdNDIRPressure(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNDIRPressure:{interval:%s, samples:%s, verbose:%s}" % (self.interval, self.samples, self.verbose)
+        return "CmdNDIRPressure:{interval:%s, samples:%s, ready:%s, pipelined:%s, verbose:%s}" % \
+               (self.interval, self.samples, self.ready, self.pipelined, self.verbose)
@@ -0,0 +1,72 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_ndir import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdNDIRProvision(object):
+    """unix command line handler"""
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog -m MANIFEST [-v] DEV_PATH_1 [.. DEV_PATH_N]",
+                                              version=version())
+
+        # compulsory...
+        self.__parser.add_option("--manifest", "-m", type="string", action="store", dest="manifest",
+                                 help="JSON file of calibration documents, keyed by ndir-serial")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.manifest is None:
+            return False
+
+        if not self.dev_paths:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def manifest(self):
+        return self.__opts.manifest
+
+
+    @property
+    def dev_paths(self):
+        return self.__args
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdNDIRProvision:{manifest:%s, dev_paths:%s, verbose:%s}" % \
+               (self.manifest, self.dev_paths, self.verbose)
@@ -18,8 +18,8 @@ class CmdNDIRSampler(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { [-i INTERVAL [-n SAMPLES] [-r]] | -o } [-v]",
-                                              version=version())
+        self.__parser = optparse.OptionParser(usage="%prog { [-i INTERVAL [-n SAMPLES] [-r] [{ -y | -p }]] | "
+                                                    "-c [-n SAMPLES] | -o } [-v]", version=version())
 
         # compulsory...
         self.__parser.add_option("--interval", "-i", type="float", action="store", dest="interval",
@@ -31,6 +31,15 @@ class CmdNDIRSampler(object):
         self.__parser.add_option("--raw", "-r", action="store_true", dest="raw", default=False,
                                  help="report voltages instead of concentrations")
 
+        self.__parser.add_option("--ready", "-y", action="store_true", dest="ready", default=False,
+                                 help="read each sample as soon as it is ready")
+
+        self.__parser.add_option("--pipelined", "-p", action="store_true", dest="pipelined", default=False,
+                                 help="trigger each sample as the last is read, on a fixed schedule")
+
+        self.__parser.add_option("--continuous", "-c", action="store_true", dest="continuous", default=False,
+                                 help="stream every sample of the board in continuous mode (x1 only)")
+
         self.__parser.add_option("--offsets", "-o", action="store_true", dest="offsets",
                                  help="get the latest min / max offsets")
 
@@ -49,12 +58,24 @@ class CmdNDIRSampler(object):
         if self.__opts.interval is not None:
             param_count += 1
 
+        if self.continuous:
+            param_count += 1
+
         if self.__opts.offsets is not None:
             param_count += 1
 
         if param_count > 1:
             return False
 
+        if self.continuous and (self.raw or self.ready or self.pipelined):
+            return False
+
+        if self.continuous:
+            return True
+
+        if self.pipelined and (self.__opts.interval is None or self.ready):
+            return False
+
         if self.__opts.samples is not None and self.__opts.interval is None:
             return False
 
@@ -70,6 +91,9 @@ class CmdNDIRSampler(object):
 
     @property
     def samples(self):
+        if self.continuous:
+            return self.__opts.samples
+
         return 1 if self.__opts.interval is None else self.__opts.samples
 
 
@@ -78,6 +102,21 @@ class CmdNDIRSampler(object):
         return self.__opts.raw
 
 
+    @property
+    def ready(self):
+        return self.__opts.ready
+
+
+    @property
+    def pipelined(self):
+        return self.__opts.pipelined
+
+
+    @property
+    def continuous(self):
+        return self.__opts.continuous
+
+
     @property
     def offsets(self):
         return self.__opts.offsets
@@ -95,5 +134,7 @@ class CmdNDIRSampler(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNDIRSampler:{interval:%s, samples:%s, raw:%s, offsets:%s, verbose:%s}" % \
-               (self.interval, self.samples, self.offsets, self.raw, self.verbose)
+        return "CmdNDIRSampler:{interval:%s, samples:%s, raw:%s, ready:%s, pipelined:%s, continuous:%s, " \
+               "offsets:%s, verbose:%s}" % \
+               (self.interval, self.samples, self.raw, self.ready, self.pipelined, self.continuous, self.offsets,
+                self.verbose)
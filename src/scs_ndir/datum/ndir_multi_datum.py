@@ -0,0 +1,128 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The readings of one NDIR lamp cycle: gas, amplitude voltages and barometric pressure, with the board status if it
+was requested.
+
+document example:
+{"tag": "scs-be2-3", "rec": "2026-10-18T10:12:31.204+00:00",
+"val": {"CO2": {"tmp": 36.5, "cnc-raw": 432.1, "cnc": 468.2},
+"volts": {"pile-ref-ampl": 1.9527, "pile-act-ampl": 3.2046, "therm-avg": 0.9128}, "pA": 101.6},
+"status": {"w-rst": false, "pwr-in": 4.6, "up": {"period": "00-00:08:58.000"}}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+from scs_core.gas.ndir.ndir_datum import NDIRDatum
+from scs_core.sample.sample import Sample
+
+from scs_ndir.datum.ndir_sampler_voltage_datum import NDIRSampleVoltageDatum
+from scs_ndir.gas.ndir.spi_ndir_x1.ndir_status import NDIRStatus
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRMultiDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        tag = jdict.get('tag')
+        rec = LocalizedDatetime.construct_from_jdict(jdict.get('rec'))
+
+        val = jdict.get('val', {})
+
+        gas = NDIRDatum.construct_from_jdict(val.get('CO2'))
+        voltage = NDIRSampleVoltageDatum.construct_from_jdict(val.get('volts'))
+        p_a = val.get('pA')
+
+        status = NDIRStatus.construct_from_jdict(jdict.get('status'))
+
+        return NDIRMultiDatum(tag, rec, gas, voltage, p_a, status=status)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, rec, gas, voltage, p_a, status=None):
+        """
+        Constructor
+        """
+        self.__tag = tag                                # string
+        self.__rec = rec                                # LocalizedDatetime
+
+        self.__gas = gas                                # NDIRDatum
+        self.__voltage = voltage                        # NDIRSampleVoltageDatum
+        self.__p_a = Datum.float(p_a, 1)                # actual pressure                           kPa
+
+        self.__status = status                          # NDIRStatus, or None if not requested
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['rec'] = self.rec.as_iso8601(include_millis=Sample.INCLUDE_MILLIS)
+
+        jdict['val'] = OrderedDict()
+        jdict['val']['CO2'] = self.gas
+        jdict['val']['volts'] = self.voltage
+        jdict['val']['pA'] = self.p_a
+
+        if self.status is not None:
+            jdict['status'] = self.status
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def voltage(self):
+        return self.__voltage
+
+
+    @property
+    def p_a(self):
+        return self.__p_a
+
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRMultiDatum:{tag:%s, rec:%s, gas:%s, voltage:%s, p_a:%s, status:%s}" % \
+               (self.tag, self.rec, self.gas, self.voltage, self.p_a, self.status)
@@ -0,0 +1,137 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The reading of one board in an NDIRPool, for one tick. Each document identifies its board by dev path and, where it
+is known, NDIR serial number. A board that failed on the tick reports its error in place of a value.
+
+document example:
+{"tag": "scs-be2-3", "rec": "2026-10-18T10:12:31.204+00:00", "dev": "/dev/spidev0.1", "ndir-serial": 1234567,
+"val": {"CO2": {"tmp": 31.2, "cnc-raw": 451.3, "cnc": 463.7}}, "latency": 0.016, "error": null}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+from scs_core.gas.ndir.ndir_datum import NDIRDatum
+from scs_core.sample.sample import Sample
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRPoolDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        tag = jdict.get('tag')
+        rec = LocalizedDatetime.construct_from_jdict(jdict.get('rec'))
+
+        dev_path = jdict.get('dev')
+        ndir_serial = jdict.get('ndir-serial')
+
+        val = jdict.get('val')
+        gas = None if val is None else NDIRDatum.construct_from_jdict(val.get('CO2'))
+
+        latency = jdict.get('latency')
+        error = jdict.get('error')
+
+        return NDIRPoolDatum(tag, rec, dev_path, ndir_serial, gas, latency, error)
+
+
+    @classmethod
+    def construct_from_reading(cls, tag, rec, reading):
+        error = None if reading.error is None else repr(reading.error)
+
+        return NDIRPoolDatum(tag, rec, reading.dev_path, reading.ndir_serial, reading.datum, reading.latency, error)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, rec, dev_path, ndir_serial, gas, latency, error):
+        """
+        Constructor
+        """
+        self.__tag = tag                                # string
+        self.__rec = rec                                # LocalizedDatetime
+
+        self.__dev_path = dev_path                      # string
+        self.__ndir_serial = ndir_serial                # unsigned long or None
+
+        self.__gas = gas                                # NDIRDatum or None
+        self.__latency = Datum.float(latency, 3)        # float seconds spent in SPI transactions
+        self.__error = error                            # string or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['rec'] = self.rec.as_iso8601(include_millis=Sample.INCLUDE_MILLIS)
+
+        jdict['dev'] = self.dev_path
+        jdict['ndir-serial'] = self.ndir_serial
+
+        jdict['val'] = None if self.gas is None else OrderedDict((('CO2', self.gas), ))
+
+        jdict['latency'] = self.latency
+        jdict['error'] = self.error
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def dev_path(self):
+        return self.__dev_path
+
+
+    @property
+    def ndir_serial(self):
+        return self.__ndir_serial
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def latency(self):
+        return self.__latency
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRPoolDatum:{tag:%s, rec:%s, dev_path:%s, ndir_serial:%s, gas:%s, latency:%s, error:%s}" % \
+               (self.tag, self.rec, self.dev_path, self.ndir_serial, self.gas, self.latency, self.error)
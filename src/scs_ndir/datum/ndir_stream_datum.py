@@ -0,0 +1,101 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+One on-board sample of an x1 board in continuous mode. A repeat is a sample whose voltages did not change from those
+of the previous sample, once it was overdue - it may be a new sample with identical voltages, or the previous sample
+read again.
+
+document example:
+{"tag": "scs-be2-3", "rec": "2026-10-18T10:12:31.204+00:00", "val": {"CO2": {"tmp": 36.5, "cnc-raw": 432.1,
+"cnc": 468.2}}, "repeat": false}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+
+from scs_core.gas.ndir.ndir_datum import NDIRDatum
+from scs_core.sample.sample import Sample
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRStreamDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        tag = jdict.get('tag')
+        rec = LocalizedDatetime.construct_from_jdict(jdict.get('rec'))
+
+        val = jdict.get('val', {})
+        gas = NDIRDatum.construct_from_jdict(val.get('CO2'))
+
+        repeat = jdict.get('repeat')
+
+        return NDIRStreamDatum(tag, rec, gas, repeat)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, rec, gas, repeat):
+        """
+        Constructor
+        """
+        self.__tag = tag                                # string
+        self.__rec = rec                                # LocalizedDatetime
+
+        self.__gas = gas                                # NDIRDatum
+        self.__repeat = bool(repeat)                    # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['tag'] = self.tag
+        jdict['rec'] = self.rec.as_iso8601(include_millis=Sample.INCLUDE_MILLIS)
+
+        jdict['val'] = OrderedDict((('CO2', self.gas), ))
+        jdict['repeat'] = self.repeat
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def gas(self):
+        return self.__gas
+
+
+    @property
+    def repeat(self):
+        return self.__repeat
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRStreamDatum:{tag:%s, rec:%s, gas:%s, repeat:%s}" % (self.tag, self.rec, self.gas, self.repeat)
@@ -0,0 +1,208 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An asyncio front-end for the NDIR drivers. SPI transactions run on an executor that is shared by every device,
+while one event loop may drive several devices - calls to one device are serialised by its driver.
+
+The long waits of calibration reload, measure-calibrate, reset, sampler mode and the recorder are made by the
+front-end with asyncio.sleep, between separate transaction steps. The board is not locked during these waits, so
+commands from other tasks may be interleaved, and are re-sent by the driver if the board is busy. Other calls -
+notably store_calib and retrieve_calib, whose many short waits are made by the driver - occupy an executor thread
+for their whole duration.
+
+Implementations are in the model packages.
+"""
+
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from scs_ndir.exception.ndir_exception import NDIRException
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncNDIR(object):
+    """
+    classdocs
+    """
+
+    __COMPLETION_THRESHOLD =            0.050           # seconds - shorter execution times are simply slept
+    __COMPLETION_SETTLE =               0.010           # seconds before the first readiness probe
+    __MIN_COMPLETION_BACKOFF =          0.010           # seconds
+    __MAX_COMPLETION_BACKOFF =          0.100           # seconds
+
+    __EXECUTOR = None                                   # shared by every device
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def shared_executor(cls):
+        if cls.__EXECUTOR is None:
+            cls.__EXECUTOR = ThreadPoolExecutor(thread_name_prefix=cls.__name__)
+
+        return cls.__EXECUTOR
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir, cmd_class, executor=None):
+        """
+        Constructor
+        """
+        self.__ndir = ndir
+        self.__cmd_class = cmd_class
+
+        self.__executor = self.shared_executor() if executor is None else executor
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def power_on(self):
+        await self._call(self.__ndir.interface.power_ndir, True)
+        await asyncio.sleep(self.__ndir.boot_time())
+
+
+    async def power_off(self):
+        await self._call(self.__ndir.interface.power_ndir, False)
+
+
+    async def close(self):
+        await self._call(self.__ndir.close)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def version(self):
+        return await self._call(self.__ndir.version)
+
+
+    async def status(self):
+        return await self._call(self.__ndir.status)
+
+
+    async def batch(self, *commands):
+        return await self._call(self.__ndir.batch, *commands)
+
+
+    async def get_sample_interval(self):
+        return await self._call(self.__ndir.get_sample_interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def store_calib(self, calib, full=False):
+        return await self._call(self.__ndir.store_calib, calib, full)
+
+
+    async def retrieve_calib(self):
+        return await self._call(self.__ndir.retrieve_calib)
+
+
+    async def reload_calib(self):
+        await self._call(self.__ndir.command, 'cl')
+        await self._await_completion('cl')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def lamp_run(self, on):
+        await self._call(self.__ndir.lamp_run, on)
+
+
+    async def measure_calibrate(self):
+        await self._call(self.__ndir.command, 'mc')
+        await self._await_completion('mc')
+
+
+    async def measure_voltage(self):
+        return await self._call(self.__ndir.measure_voltage)
+
+
+    async def record_raw(self, deferral, interval, count):
+        await asyncio.sleep(await self._call(self.__ndir.record_start, deferral, interval, count))
+
+        return await self._call(self.__ndir.record_playback, count)
+
+
+    async def input_voltage(self):
+        return await self._call(self.__ndir.input_voltage)
+
+
+    async def watchdog_clear(self):
+        await self._call(self.__ndir.watchdog_clear)
+
+
+    async def reset(self):
+        await self._call(self.__ndir.command, 'wc')
+        await self._call(self.__ndir.command, 'wr')
+
+        await self._call(self.__ndir.invalidate_calib)
+
+        await self._await_completion('wr', is_complete=self.__watchdog_reset_reported)
+        await self._call(self.__ndir.command, 'wc')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def _call(self, func, *args):
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.__executor, partial(func, *args))
+
+
+    async def _await_completion(self, name, is_complete=None):
+        # as the driver's own wait, but with the readiness probes run one at a time, between asyncio sleeps...
+        cmd = self.__cmd_class.find(name)
+
+        if cmd.execution_time < self.__COMPLETION_THRESHOLD:
+            await asyncio.sleep(cmd.execution_time)
+            return
+
+        deadline = time.time() + cmd.execution_time
+        backoff = self.__MIN_COMPLETION_BACKOFF
+
+        await asyncio.sleep(self.__COMPLETION_SETTLE)
+
+        while True:
+            if await self._call(self.__ndir.is_ready) and (is_complete is None or await is_complete()):
+                return
+
+            remaining = deadline - time.time()
+
+            if remaining <= 0:
+                raise NDIRException.construct('Completion timed out', None, cmd, None, None)
+
+            await asyncio.sleep(min(backoff, remaining))
+            backoff = min(backoff * 2, self.__MAX_COMPLETION_BACKOFF)
+
+
+    async def __watchdog_reset_reported(self):
+        try:
+            return bool(await self._call(self.__ndir.command, 'ws'))
+
+        except NDIRException:
+            return False                                # busy or not responding
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ndir(self):
+        return self.__ndir
+
+
+    @property
+    def cmd_class(self):
+        return self.__cmd_class
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "%s:{ndir:%s}" % (self.__class__.__name__, self.__ndir)
@@ -0,0 +1,640 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A software emulation of the NDIR SPI microcontroller, presented as a drop-in replacement for scs_host SPI.
+
+The emulator implements the command sets of the x1 and t1f1 firmware, as listed in SPINDIRx1Cmd and SPINDIRt1f1Cmd:
+* no response (0x00) until the command response time has elapsed, then ACK / NACK
+* while a command is executing or a sample is not ready, x1 rejects a command with BUSY - the command is discarded,
+  and must be sent again - and t1f1 does not respond until the command can be served
+* EEPROM calibration blocks, initialised from the model's NDIRCalib.CALIB_IAQ
+* the firmware version tag, as reported by 'vt'
+* extension commands - 'cb' and 'cc' - are NACKed unless the tag's API level implements them - the default tag is
+  that of released firmware, which does not
+* the 250-sample recorder, with lamp-edge alignment on t1f1
+* lamp-cycle sample timing - continuous or single-shot on x1, triggered on t1f1
+
+All delays are multiplied by time_scale - a time_scale of 0.0 gives an emulator that never delays.
+
+example use:
+emulator = NDIREmulator('x1', time_scale=0.1)
+ndir = SPINDIRx1(NDIREmulatorInterface(emulator), emulator.dev_path, spi=emulator)
+"""
+
+import math
+import random
+import struct
+import threading
+import time
+import zlib
+
+from scs_core.gas.ndir.ndir_version import NDIRTag
+
+from scs_ndir.gas.ndir.ndir_calib_schema import NDIRCalibSchema
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.ndir_calib import NDIRCalib as NDIRt1f1Calib
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1_cmd import SPINDIRt1f1Cmd
+
+from scs_ndir.gas.ndir.spi_ndir_x1.ndir_calib import NDIRCalib as NDIRx1Calib
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1_cmd import SPINDIRx1Cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIREmulator(object):
+    """
+    classdocs
+    """
+
+    MODELS = {
+        'x1':   (SPINDIRx1Cmd, NDIRx1Calib),
+        't1f1': (SPINDIRt1f1Cmd, NDIRt1f1Calib)
+    }
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    __RESPONSE_ACK =                    0x01
+    __RESPONSE_NACK =                   0x02
+    __RESPONSE_BUSY =                   0x03
+    __RESPONSE_NONE =                   0x00
+
+    __IDENT =                           "SCS NDIR emulator %s"
+    __TAG =                             "000.000.001"
+
+    __RECORDER_CAPACITY =               250             # samples
+    __RECORD =                          struct.Struct('<Hll')
+
+    __PARAM_COUNTS = {'cr': 2, 'cb': 1, 'lr': 1, 'll': 4, 'rs': 6, 'sm': 1}
+
+    __GAS = struct.Struct('<fff')
+    __RAW = struct.Struct('<HHH')
+    __OFFSETS = struct.Struct('<HHHH')
+    __FLOAT = struct.Struct('<f')
+    __UNSIGNED_INT = struct.Struct('<H')
+    __UNSIGNED_LONG = struct.Struct('<L')
+
+    __V_REF =                           3.3             # ADC reference voltage
+    __ADC_MAX =                         65535
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, model, dev_path=None, time_scale=1.0, cnc=420.0, seed=0, tag=None):
+        """
+        Constructor
+        """
+        if model not in self.MODELS:
+            raise ValueError("NDIREmulator: unrecognised model: %s." % model)
+
+        self.__model = model                            # string
+        self.__dev_path = dev_path if dev_path else '/dev/ndir-emulator-%s' % model
+        self.__time_scale = float(time_scale)           # multiplier for all delays
+        self.__cnc = float(cnc)                         # ppm - the concentration presented to the sensor
+        self.__seed = int(seed)
+        self.__tag = NDIRTag.construct_from_jdict(self.__TAG if tag is None else tag)
+
+        self.__cmd_class, calib_class = self.MODELS[model]
+
+        self.__mutex = threading.RLock()
+        self.__is_open = False
+
+        self.__eeprom = dict(NDIRCalibSchema.encode(calib_class.default()))     # dict of (block, index): bytes
+
+        self.__powered = True
+        self.__boot()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # SPI...
+
+    def open(self):
+        self.__is_open = True
+
+
+    def close(self):
+        self.__is_open = False
+
+
+    def xfer(self, args):
+        with self.__mutex:
+            now = time.time()
+
+            if self.__cmd_name is None or self.__status is not None or self.__params_complete():
+                # a new command...
+                self.__cmd_name = ''.join(chr(value) for value in args[:2])
+                self.__params = list(args[2:])
+                self.__status = None
+                self.__response = []
+
+            else:
+                # parameters...
+                self.__params.extend(args)
+
+            self.__cmd_time = now
+
+
+    def read_bytes(self, count):
+        with self.__mutex:
+            if not self.__powered or time.time() < self.__offline_until:
+                return [self.__RESPONSE_NONE] * count
+
+            if self.__cmd_name is None:
+                return [self.__RESPONSE_NONE] * count
+
+            if self.__status is None:
+                return [self.__read_status()] + [self.__RESPONSE_NONE] * (count - 1)
+
+            response = self.__response[:count]
+            self.__response = self.__response[count:]
+
+            return response + [self.__RESPONSE_NONE] * (count - len(response))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # interface...
+
+    def power(self, on):
+        with self.__mutex:
+            if on and not self.__powered:
+                self.__powered = True
+                self.__boot()
+
+            elif not on:
+                self.__powered = False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # firmware...
+
+    def __boot(self):
+        now = time.time()
+
+        self.__boot_time = now
+        self.__offline_until = now
+
+        self.__cmd_name = None
+        self.__params = []
+        self.__cmd_time = now
+        self.__status = None
+        self.__response = []
+
+        self.__busy_from = now
+        self.__busy_until = now
+        self.__watchdog_reset = False
+
+        self.__lamp_run = True
+        self.__lamp_voltage = self.__eeprom_value(0, 3)
+        self.__load_timing()
+
+        self.__single_shot = self.__model == 't1f1'     # t1f1 samples on trigger only
+        self.__instant_index = 0
+        self.__sample_index = 0
+        self.__sample_ready_at = now
+
+        self.__recording = []
+
+
+    def __load_timing(self):
+        lamp_period = self.__eeprom_value(0, 4)
+        sample_end = self.__eeprom_value(0, 6)
+
+        self.__lamp_period = (1000 if lamp_period == 0xffff else lamp_period) / 1000
+        self.__sample_end = (0 if sample_end == 0xffff else sample_end) / 1000
+
+
+    def __busy(self, start, end):
+        self.__busy_from = start
+        self.__busy_until = end
+
+
+    def __params_complete(self):
+        if self.__cmd_name == 'cw':
+            field = self.__field(*self.__params[:2]) if len(self.__params) >= 2 else None
+            return field is not None and len(self.__params) >= 2 + field.size
+
+        return len(self.__params) >= self.__PARAM_COUNTS.get(self.__cmd_name, 0)
+
+
+    def __read_status(self):
+        now = time.time()
+
+        try:
+            cmd = self.__cmd_class.find(self.__cmd_name)
+        except ValueError:
+            return self.__respond(self.__RESPONSE_NACK)
+
+        if not cmd.is_supported(self.__tag):
+            return self.__respond(self.__RESPONSE_NACK)    # not implemented by the emulated firmware
+
+        if now < self.__cmd_time + self.__scaled(cmd.response_time):
+            return self.__RESPONSE_NONE                 # not yet responded
+
+        if self.__busy_from <= now < self.__busy_until:
+            return self.__reject()                      # the MCU is not free
+
+        handler = getattr(self, '_NDIREmulator__cmd_' + self.__cmd_name)
+        status = handler(cmd, now)
+
+        if status is None:
+            return self.__reject()
+
+        self.__status = status
+
+        return status
+
+
+    def __reject(self):
+        if self.__model == 'x1':
+            return self.__respond(self.__RESPONSE_BUSY)     # the command is discarded
+
+        return self.__RESPONSE_NONE                     # the command is held until it can be served
+
+
+    def __respond(self, status, response=None):
+        self.__status = status
+        self.__response = [] if response is None else list(response)
+
+        return status
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # commands - each returns a status, or None if the command cannot yet be served...
+
+    def __cmd_vi(self, _cmd, _now):
+        ident = (self.__IDENT % self.__model).ljust(40)[:40]
+
+        return self.__respond(self.__RESPONSE_ACK, ident.encode('latin-1'))
+
+
+    def __cmd_vt(self, _cmd, _now):
+        tag = '%03d.%03d.%03d' % (self.__tag.device, self.__tag.api, self.__tag.patch)
+
+        return self.__respond(self.__RESPONSE_ACK, tag.encode('latin-1'))
+
+
+    def __cmd_up(self, _cmd, now):
+        return self.__respond(self.__RESPONSE_ACK, self.__UNSIGNED_LONG.pack(int(now - self.__boot_time)))
+
+
+    def __cmd_ws(self, _cmd, _now):
+        return self.__respond(self.__RESPONSE_ACK, (1 if self.__watchdog_reset else 0, ))
+
+
+    def __cmd_wc(self, _cmd, _now):
+        self.__watchdog_reset = False
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_wr(self, cmd, now):
+        self.__boot()
+
+        self.__boot_time = now + self.__scaled(cmd.execution_time)
+        self.__offline_until = self.__boot_time
+        self.__watchdog_reset = True
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_cr(self, _cmd, _now):
+        field = self.__field(*self.__params[:2]) if len(self.__params) == 2 else None
+
+        if field is None:
+            return self.__RESPONSE_NACK
+
+        block, index = self.__params
+
+        return self.__respond(self.__RESPONSE_ACK, self.__eeprom.get((block, index), b'\xff' * field.size))
+
+
+    def __cmd_cb(self, _cmd, _now):
+        fields = NDIRCalibSchema.block_fields(self.__params[0]) if len(self.__params) == 1 else ()
+
+        if not fields:
+            return self.__RESPONSE_NACK
+
+        block = self.__params[0]
+        response = b''.join(self.__eeprom.get((block, field.index), b'\xff' * field.size) for field in fields)
+
+        return self.__respond(self.__RESPONSE_ACK, response)
+
+
+    def __cmd_cc(self, _cmd, _now):
+        # the CRC-32 of the calibration in effect - the fields of unset ranges are taken as blank...
+        is_set = NDIRCalibSchema.RANGE_IS_SET.index
+
+        image = {(block, index): value_bytes for (block, index), value_bytes in self.__eeprom.items()
+                 if block == NDIRCalibSchema.COMMON_BLOCK or index == is_set or self.__eeprom_value(block, is_set)}
+
+        crc = zlib.crc32(NDIRCalibSchema.pack_image(image))
+
+        return self.__respond(self.__RESPONSE_ACK, self.__UNSIGNED_LONG.pack(crc))
+
+
+    def __cmd_cw(self, cmd, now):
+        field = self.__field(*self.__params[:2]) if len(self.__params) > 2 else None
+
+        if field is None or len(self.__params) != 2 + field.size:
+            return self.__RESPONSE_NACK
+
+        block, index = self.__params[:2]
+        self.__eeprom[(block, index)] = bytes(self.__params[2:])
+
+        self.__busy(now, now + self.__scaled(cmd.execution_time))
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_cl(self, cmd, now):
+        self.__lamp_voltage = self.__eeprom_value(0, 3)
+        self.__load_timing()
+
+        self.__busy(now, now + self.__scaled(cmd.execution_time))
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_lr(self, _cmd, _now):
+        if len(self.__params) != 1:
+            return self.__RESPONSE_NACK
+
+        self.__lamp_run = bool(self.__params[0])
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_ll(self, _cmd, _now):
+        if len(self.__params) != self.__FLOAT.size:
+            return self.__RESPONSE_NACK
+
+        self.__lamp_voltage = self.__FLOAT.unpack(bytes(self.__params))[0]
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_ir(self, _cmd, now):
+        return self.__respond(self.__RESPONSE_ACK, self.__UNSIGNED_INT.pack(self.__adc(self.__input_voltage(now) / 4)))
+
+
+    def __cmd_iv(self, _cmd, now):
+        return self.__respond(self.__RESPONSE_ACK, self.__FLOAT.pack(self.__input_voltage(now)))
+
+
+    def __cmd_mc(self, cmd, now):
+        self.__busy(now, now + self.__scaled(cmd.execution_time))
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_mr(self, _cmd, now):
+        ref, act, therm = self.__voltages(self.__lamp_index(now))
+
+        return self.__respond(self.__RESPONSE_ACK, self.__RAW.pack(self.__adc(ref), self.__adc(act), self.__adc(therm)))
+
+
+    def __cmd_mv(self, _cmd, now):
+        return self.__respond(self.__RESPONSE_ACK, self.__GAS.pack(*self.__voltages(self.__lamp_index(now))))
+
+
+    def __cmd_rs(self, _cmd, now):
+        if len(self.__params) != 6:
+            return self.__RESPONSE_NACK
+
+        deferral, interval, count = struct.unpack('<HHH', bytes(self.__params))
+
+        if count < 1 or count > self.__RECORDER_CAPACITY:
+            return self.__RESPONSE_NACK
+
+        # t1f1 recording starts on a lamp edge - until then, the MCU remains responsive...
+        start = now
+
+        if self.__model == 't1f1':
+            period = self.__scaled(self.__lamp_period)
+            start = now if period == 0 else now + period - ((now - self.__boot_time) % period)
+
+        # the MCU is busy from the start of recording...
+        self.__recording = [self.__record(deferral + i * interval) for i in range(count)]
+        self.__busy(start, start + self.__scaled((deferral + interval * count) / 1000))
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_rp(self, _cmd, _now):
+        response = b''.join(self.__RECORD.pack(*record) for record in self.__recording)
+
+        return self.__respond(self.__RESPONSE_ACK, response)
+
+
+    def __cmd_sm(self, _cmd, now):
+        if len(self.__params) != 1:
+            return self.__RESPONSE_NACK
+
+        self.__single_shot = bool(self.__params[0])
+
+        if self.__single_shot:
+            self.__trigger(now)
+            self.__busy(now, self.__sample_ready_at)
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_sp(self, _cmd, now):
+        if self.__model == 'x1':
+            return self.__respond(self.__RESPONSE_ACK, self.__FLOAT.pack(self.__pressure(now)))
+
+        self.__trigger(now)
+
+        return self.__RESPONSE_ACK
+
+
+    def __cmd_sb(self, _cmd, now):
+        return self.__respond(self.__RESPONSE_ACK, self.__FLOAT.pack(self.__pressure(now)))
+
+
+    def __cmd_sr(self, _cmd, now):
+        index = self.__current_sample(now)
+
+        if index is None:
+            return None
+
+        ref, act, therm = self.__voltages(index)
+
+        return self.__respond(self.__RESPONSE_ACK, self.__RAW.pack(self.__adc(ref), self.__adc(act), self.__adc(therm)))
+
+
+    def __cmd_sv(self, _cmd, now):
+        index = self.__current_sample(now)
+
+        if index is None:
+            return None
+
+        return self.__respond(self.__RESPONSE_ACK, self.__GAS.pack(*self.__voltages(index)))
+
+
+    def __cmd_sg(self, _cmd, now):
+        index = self.__current_sample(now)
+
+        if index is None:
+            return None
+
+        return self.__respond(self.__RESPONSE_ACK, self.__GAS.pack(*self.__gas(index)))
+
+
+    def __cmd_so(self, _cmd, now):
+        index = self.__current_sample(now)
+
+        if index is None:
+            return None
+
+        ref, act, _ = self.__voltages(index)
+        offsets = (self.__adc(ref * 0.2), self.__adc(act * 0.2), self.__adc(ref * 0.9), self.__adc(act * 0.9))
+
+        return self.__respond(self.__RESPONSE_ACK, self.__OFFSETS.pack(*offsets))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # sampling...
+
+    def __cycle(self):
+        return self.__scaled(self.__lamp_period + self.__sample_end)
+
+
+    def __trigger(self, now):
+        self.__sample_index = self.__lamp_index(now)
+        self.__sample_ready_at = now + self.__cycle()
+
+
+    def __current_sample(self, now):
+        if self.__single_shot:
+            return self.__sample_index if now >= self.__sample_ready_at else None
+
+        # continuous - a new sample at the end of each lamp cycle...
+        index = self.__lamp_index(now)
+
+        return index if index > 0 else None
+
+
+    def __lamp_index(self, now):
+        if not self.__lamp_run:
+            return 0
+
+        period = self.__scaled(self.__lamp_period)
+
+        if period > 0:
+            return int((now - self.__boot_time) / period)
+
+        # no delays - every request sees a new lamp cycle...
+        self.__instant_index += 1
+
+        return self.__instant_index
+
+
+    def __random(self, index):
+        return random.Random(self.__seed * 1000003 + index)
+
+
+    def __gas(self, index):
+        rnd = self.__random(index)
+
+        cnc_igl = self.__cnc + rnd.gauss(0.0, 2.0)
+        cnc = cnc_igl * 1.01
+        temp = 25.0 + rnd.gauss(0.0, 0.05)
+
+        return cnc, cnc_igl, temp
+
+
+    def __voltages(self, index):
+        rnd = self.__random(index)
+
+        lamp = self.__lamp_voltage if self.__lamp_run and not math.isnan(self.__lamp_voltage) else 0.0
+
+        ref = 0.25 * lamp + rnd.gauss(0.0, 0.001)
+        act = ref * math.exp(-self.__cnc / 20000.0) + rnd.gauss(0.0, 0.001)
+        therm = 1.65 + rnd.gauss(0.0, 0.001)
+
+        return ref, act, therm
+
+
+    def __record(self, rec):
+        period_ms = self.__lamp_period * 1000
+        phase = 0.0 if period_ms == 0 else 2 * math.pi * rec / period_ms
+
+        ref, act, _ = self.__voltages(rec)
+        swing = 0.5 + 0.5 * math.sin(phase)
+
+        return rec & 0xffff, self.__adc(ref * swing), self.__adc(act * swing)
+
+
+    def __pressure(self, now):
+        return 101.3 + self.__random(self.__lamp_index(now)).gauss(0.0, 0.02)
+
+
+    def __input_voltage(self, now):
+        return 12.0 + self.__random(self.__lamp_index(now)).gauss(0.0, 0.01)
+
+
+    def __adc(self, voltage):
+        return max(0, min(self.__ADC_MAX, int(voltage / self.__V_REF * self.__ADC_MAX)))
+
+
+    def __scaled(self, seconds):
+        return 0.0 if seconds is None else seconds * self.__time_scale
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # EEPROM...
+
+    def __field(self, block, index):
+        return NDIRCalibSchema.field(block, index)
+
+
+    def __eeprom_value(self, block, index):
+        field = self.__field(block, index)
+
+        return struct.unpack(field.layout, self.__eeprom.get((block, index), b'\xff' * field.size))[0]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def model(self):
+        return self.__model
+
+
+    @property
+    def dev_path(self):
+        return self.__dev_path
+
+
+    @property
+    def time_scale(self):
+        return self.__time_scale
+
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def cnc(self):
+        return self.__cnc
+
+
+    @cnc.setter
+    def cnc(self, cnc):
+        self.__cnc = float(cnc)
+
+
+    @property
+    def is_open(self):
+        return self.__is_open
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIREmulator:{model:%s, dev_path:%s, time_scale:%s, tag:%s, cnc:%s, powered:%s}" % \
+               (self.model, self.dev_path, self.time_scale, self.tag, self.cnc, self.__powered)
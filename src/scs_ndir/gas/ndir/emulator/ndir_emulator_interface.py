@@ -0,0 +1,45 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A stand-in for the DFE interface, switching the power of one or more NDIREmulators.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIREmulatorInterface(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, *emulators):
+        """
+        Constructor
+        """
+        self.__emulators = emulators                    # tuple of NDIREmulator
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def power_ndir(self, on):
+        for emulator in self.__emulators:
+            emulator.power(on)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def emulators(self):
+        return self.__emulators
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        emulators = '[' + ', '.join(str(emulator) for emulator in self.__emulators) + ']'
+
+        return "NDIREmulatorInterface:{emulators:%s}" % emulators
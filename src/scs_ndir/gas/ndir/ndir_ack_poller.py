@@ -0,0 +1,198 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Polls the NDIR microcontroller status byte on a short, bounded backoff schedule, in place of a fixed response time.
+Polling continues until the board gives a completing status - ACK or NACK - or until the deadline has passed.
+
+The first poll is made at the nominal response time of the command. The observed latency of each command is then
+recorded, so that the first poll adapts to the board in use.
+
+document example:
+{"sg": {"count": 12, "avg": 0.0062, "min": 0.0051, "max": 0.0104}, "cr": {"count": 57, "avg": 0.0009, ...}}
+"""
+
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRAckPoller(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    __MIN_BACKOFF =                     0.0002          # seconds
+    __MAX_BACKOFF =                     0.002           # seconds
+
+    __TIMEOUT_FACTOR =                  4.0             # deadline as a multiple of the command response time
+    __MIN_TIMEOUT =                     0.020           # seconds
+
+    __LEAD_FACTOR =                     0.8             # first poll as a fraction of the learned latency
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__latencies = OrderedDict()                # dict of name: NDIRLatency
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def poll(self, cmd, read_status, complete):
+        # read_status is called until it returns a status in complete - otherwise, the last status is returned...
+        start_time = time.time()
+        deadline = start_time + self.timeout(cmd)
+
+        time.sleep(self.initial_wait(cmd))
+
+        backoff = self.__MIN_BACKOFF
+
+        while True:
+            status = read_status()
+            now = time.time()
+
+            if status in complete:
+                self.__record(cmd.name, now - start_time)
+                return status
+
+            if now + backoff > deadline:
+                return status
+
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.__MAX_BACKOFF)
+
+
+    def initial_wait(self, cmd):
+        latency = self.__latencies.get(cmd.name)
+
+        if latency is None:
+            return cmd.response_time                    # nothing learned yet - the nominal response time
+
+        return min(latency.avg * self.__LEAD_FACTOR, cmd.response_time)
+
+
+    def timeout(self, cmd):
+        return max(cmd.response_time * self.__TIMEOUT_FACTOR, self.__MIN_TIMEOUT)
+
+
+    def latency(self, name):
+        return self.__latencies.get(name)
+
+
+    def reset(self):
+        self.__latencies = OrderedDict()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __record(self, name, elapsed_time):
+        if name not in self.__latencies:
+            self.__latencies[name] = NDIRLatency()
+
+        self.__latencies[name].append(elapsed_time)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        return self.__latencies
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        latencies = '{' + ', '.join(str(name) + ': ' + str(latency)
+                                    for name, latency in self.__latencies.items()) + '}'
+
+        return "NDIRAckPoller:{latencies:%s}" % latencies
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRLatency(JSONable):
+    """
+    classdocs
+    """
+
+    __SMOOTHING =                       0.2             # weight of the most recent observation
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                                # int
+        self.__avg = None                               # float seconds (exponentially smoothed)
+        self.__min = None                               # float seconds
+        self.__max = None                               # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, elapsed_time):
+        self.__count += 1
+
+        if self.__avg is None:
+            self.__avg = elapsed_time
+            self.__min = elapsed_time
+            self.__max = elapsed_time
+            return
+
+        self.__avg += (elapsed_time - self.__avg) * self.__SMOOTHING
+        self.__min = min(self.__min, elapsed_time)
+        self.__max = max(self.__max, elapsed_time)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['count'] = self.count
+        jdict['avg'] = Datum.float(self.avg, 4)
+        jdict['min'] = Datum.float(self.min, 4)
+        jdict['max'] = Datum.float(self.max, 4)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def avg(self):
+        return self.__avg
+
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRLatency:{count:%s, avg:%s, min:%s, max:%s}" % (self.count, self.avg, self.min, self.max)
@@ -0,0 +1,352 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A repeatable benchmark of an NDIR driver, run against real hardware or an NDIREmulator.
+
+Command latencies are SPI transaction times - from command transfer to the last response byte - and do not include
+completion of the command's execution. Disruptive commands (reset, calibration write, lamp run, measure-calibrate,
+sampler mode and the recorder) are only benchmarked on request; the recorder is benchmarked end-to-end by record_raw.
+
+document example (NDIRTiming):
+{"count": 20, "mean": 0.000412, "min": 0.000395, "median": 0.000408, "p90": 0.000431, "max": 0.000502}
+"""
+
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum, Encode
+from scs_core.data.json import JSONable, JSONify
+
+from scs_core.gas.ndir.ndir_datum import NDIRDatum
+
+from scs_core.sync.timed_runner import TimedRunner
+
+from scs_ndir.gas.ndir.ndir_calib_schema import NDIRCalibSchema
+from scs_ndir.gas.ndir.ndir_monitor import NDIRMonitor
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1_cmd import SPINDIRt1f1Cmd
+
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1 import SPINDIRx1
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1_cmd import SPINDIRx1Cmd
+
+from scs_ndir.sampler.ndir_sampler import NDIRSampler
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRBenchmark(object):
+    """
+    classdocs
+    """
+
+    DISRUPTIVE_COMMANDS = ('wr', 'cw', 'lr', 'mc', 'sm', 'rs', 'rp')
+
+    __CMD_CLASSES = {
+        SPINDIRx1: SPINDIRx1Cmd,
+        SPINDIRt1f1: SPINDIRt1f1Cmd
+    }
+
+    __MONITOR_POLL =                    0.010           # seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir):
+        """
+        Constructor
+        """
+        if type(ndir) not in self.__CMD_CLASSES:
+            raise ValueError("NDIRBenchmark: unrecognised NDIR: %s." % ndir)
+
+        self.__ndir = ndir
+        self.__cmd_class = self.__CMD_CLASSES[type(ndir)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def commands(self, repeats, disruptive=False):
+        timings = OrderedDict()
+
+        with self.__ndir.session():
+            params = self.__params()
+            tag = self.__ndir.version().tag
+
+            for name in self.__cmd_class.names():
+                if name in self.DISRUPTIVE_COMMANDS and not disruptive:
+                    continue
+
+                cmd = self.__cmd_class.find(name)
+
+                if not cmd.is_supported(tag):
+                    continue                            # an extension, not implemented by the firmware
+
+                param_group_1, param_group_2, return_count = params.get(name, (None, None, None))
+
+                elapsed_times = []
+
+                for _ in range(repeats):
+                    start_time = time.time()
+                    self.__ndir.command(name, param_group_1, param_group_2, return_count)
+                    elapsed_times.append(time.time() - start_time)
+
+                    self.__complete(cmd)
+
+                timings[name] = NDIRTiming.construct(elapsed_times)
+
+        return timings
+
+
+    def sampler(self, samples):
+        if not isinstance(self.__ndir, SPINDIRt1f1):
+            return None                                 # NDIRSampler drives the triggered (t1f1) sampling cycle
+
+        sampler = NDIRSampler(TimedRunner(0.0, samples), None, self.__ndir)
+
+        start_time = time.time()
+        count = sum(1 for _ in sampler.samples())
+
+        return NDIRThroughput(count, time.time() - start_time)
+
+
+    def monitor(self, conf, duration):
+        if not isinstance(self.__ndir, SPINDIRt1f1):
+            return None                                 # NDIRMonitor drives the triggered (t1f1) sampling cycle
+
+        monitor = NDIRMonitor(self.__ndir, conf)
+        monitor.start()
+
+        try:
+            count = 0
+            latest = None
+
+            start_time = time.time()
+
+            while time.time() - start_time < duration:
+                sample = monitor.sample()
+                jstr = JSONify.dumps(sample)
+
+                if isinstance(sample, NDIRDatum) and jstr != latest:
+                    count += 1
+                    latest = jstr
+
+                time.sleep(self.__MONITOR_POLL)
+
+            return NDIRThroughput(count, time.time() - start_time)
+
+        finally:
+            monitor.stop()                              # powers the board off...
+            self.__ndir.power_on()                      # ...so that later stages find it as it was
+
+
+    def retrieve_calib(self, repeats):
+        return NDIRTiming.construct([self.__timed(self.__ndir.retrieve_calib) for _ in range(repeats)])
+
+
+    def store_calib(self, repeats):
+        calib = self.__ndir.retrieve_calib()            # the board's own calibration is written back
+
+        return NDIRTiming.construct([self.__timed(self.__ndir.store_calib, calib) for _ in range(repeats)])
+
+
+    def record_raw(self, repeats, deferral, interval, count):
+        return NDIRTiming.construct([self.__timed(self.__ndir.record_raw, deferral, interval, count)
+                                     for _ in range(repeats)])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __params(self):
+        # parameters that leave the board as it was found...
+        block = NDIRCalibSchema.COMMON_BLOCK
+
+        selected_range = self.__ndir.read_calib_field(block, NDIRCalibSchema.SELECTED_RANGE)
+        lamp_voltage = self.__ndir.read_calib_field(block, NDIRCalibSchema.common_field('lamp-voltage'))
+
+        return {
+            'cr': ((block, NDIRCalibSchema.SELECTED_RANGE.index), None, 2),
+            'cw': ((block, NDIRCalibSchema.SELECTED_RANGE.index), Encode.unsigned_int(selected_range, '<'), None),
+            'cb': ((block, ), None, 20),
+            'lr': ((1, ), None, None),
+            'll': (Encode.float(lamp_voltage, '<'), None, None),
+            'sm': ((0, ), None, None),
+            'rs': (Encode.unsigned_int(0, '<') + Encode.unsigned_int(5, '<') + Encode.unsigned_int(1, '<'),
+                   None, None),
+            'rp': (None, None, self.__cmd_class.find('rp').record_size),
+        }
+
+
+    def __complete(self, cmd):
+        if cmd.execution_time is None:
+            time.sleep(self.__ndir.get_sample_interval())         # t1f1 lamp-cycle commands
+            return
+
+        self.__ndir.await_completion(cmd.name)
+
+
+    @staticmethod
+    def __timed(func, *args):
+        start_time = time.time()
+        func(*args)
+
+        return time.time() - start_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ndir(self):
+        return self.__ndir
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRBenchmark:{ndir:%s}" % self.__ndir
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRTiming(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, elapsed_times):
+        if not elapsed_times:
+            return cls(0, None, None, None, None, None)
+
+        ordered = sorted(elapsed_times)
+        count = len(ordered)
+
+        mean = sum(ordered) / count
+        median = ordered[count // 2]
+        p90 = ordered[min(count - 1, int(count * 0.9))]
+
+        return cls(count, mean, ordered[0], median, p90, ordered[-1])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, count, mean, min, median, p90, max):
+        """
+        Constructor
+        """
+        self.__count = int(count)                       # int
+        self.__mean = Datum.float(mean, 6)              # float seconds
+        self.__min = Datum.float(min, 6)                # float seconds
+        self.__median = Datum.float(median, 6)          # float seconds
+        self.__p90 = Datum.float(p90, 6)                # float seconds
+        self.__max = Datum.float(max, 6)                # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['count'] = self.count
+        jdict['mean'] = self.mean
+        jdict['min'] = self.min
+        jdict['median'] = self.median
+        jdict['p90'] = self.p90
+        jdict['max'] = self.max
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def mean(self):
+        return self.__mean
+
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def median(self):
+        return self.__median
+
+
+    @property
+    def p90(self):
+        return self.__p90
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRTiming:{count:%s, mean:%s, min:%s, median:%s, p90:%s, max:%s}" % \
+               (self.count, self.mean, self.min, self.median, self.p90, self.max)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRThroughput(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, count, elapsed_time):
+        """
+        Constructor
+        """
+        self.__count = int(count)                       # int
+        self.__elapsed_time = float(elapsed_time)       # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['count'] = self.count
+        jdict['elapsed'] = round(self.elapsed_time, 3)
+        jdict['rate'] = Datum.float(self.rate, 3)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def elapsed_time(self):
+        return self.__elapsed_time
+
+
+    @property
+    def rate(self):
+        return None if self.__elapsed_time == 0 else self.__count / self.__elapsed_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRThroughput:{count:%s, elapsed_time:%s, rate:%s}" % (self.count, self.elapsed_time, self.rate)
@@ -0,0 +1,122 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A host-side image of the NDIR EEPROM calibration, keyed by the identity of the board and its firmware version. The
+image is held as JSON, so that it can be persisted without reference to the model's NDIRCalib class. Each board has
+its own file, named for its SPI device - for example, spidev0.1_ndir_calib_cache.json.
+
+example JSON:
+{"ndir-serial": 12700000, "board-serial": 1000000,
+"version": {"id": "SCS NDIR t1f1", "tag": "001.001.001"},
+"calib": {"ndir-serial": 12700000, "board-serial": 1000000, "selected-range": 1, "lamp-voltage": 4.5, ...}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify, MultiPersistentJSONable
+
+from scs_core.gas.ndir.ndir_version import NDIRVersion
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCalibCache(MultiPersistentJSONable):
+    """
+    classdocs
+    """
+
+    __FILENAME = "ndir_calib_cache.json"
+
+    @classmethod
+    def persistence_location(cls, name):
+        filename = cls.__FILENAME if name is None else '_'.join((name, cls.__FILENAME))
+
+        return cls.conf_dir(), filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, version, calib, name=None):
+        return cls(calib.ndir_serial, calib.board_serial, version, calib.as_json(), name=name)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None, skeleton=False):
+        if not jdict:
+            return None
+
+        ndir_serial = jdict.get('ndir-serial')
+        board_serial = jdict.get('board-serial')
+
+        version = NDIRVersion.construct_from_jdict(jdict.get('version'))
+        calib = jdict.get('calib')
+
+        return cls(ndir_serial, board_serial, version, calib, name=name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir_serial, board_serial, version, calib, name=None):
+        """
+        Constructor
+        """
+        super().__init__(name)                          # the board's SPI device name, for example spidev0.1
+
+        self.__ndir_serial = ndir_serial                # unsigned long
+        self.__board_serial = board_serial              # unsigned long
+        self.__version = version                        # NDIRVersion
+
+        self.__calib = calib                            # dict - the JSON image of the model's NDIRCalib
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def matches(self, ndir_serial, board_serial, version):
+        if ndir_serial != self.ndir_serial or board_serial != self.board_serial:
+            return False
+
+        return JSONify.dumps(version) == JSONify.dumps(self.version)
+
+
+    def calib(self, calib_class):
+        return calib_class.construct_from_jdict(self.__calib)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['ndir-serial'] = self.ndir_serial
+        jdict['board-serial'] = self.board_serial
+        jdict['version'] = self.version
+        jdict['calib'] = self.__calib
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ndir_serial(self):
+        return self.__ndir_serial
+
+
+    @property
+    def board_serial(self):
+        return self.__board_serial
+
+
+    @property
+    def version(self):
+        return self.__version
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRCalibCache:{name:%s, ndir_serial:%s, board_serial:%s, version:%s, calib:%s}" % \
+               (self.name, self.ndir_serial, self.board_serial, self.version, self.__calib)
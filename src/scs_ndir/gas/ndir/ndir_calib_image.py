@@ -0,0 +1,110 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A compact binary image of an NDIR EEPROM calibration, for export, cloning and restore.
+
+The layout is fixed by NDIRCalibSchema.layout() - every field of block 0 and of ranges 1 to 5, whether set or not, in
+block and index order, little-endian. Fields of unset ranges are carried as NaN. The image is framed by a header and a
+CRC-32 of everything that precedes it:
+
+magic "NDIR" | format (unsigned char) | field count (unsigned char) | fields... | CRC-32 (unsigned long)
+
+The x1 and t1f1 calibrations share a layout, so an image may be constructed as either model's NDIRCalib.
+"""
+
+import struct
+import zlib
+
+from scs_ndir.gas.ndir.ndir_calib_schema import NDIRCalibSchema
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCalibImage(object):
+    """
+    classdocs
+    """
+
+    MAGIC =                             b'NDIR'
+    FORMAT =                            1
+
+    __HEADER =                          struct.Struct('<4sBB')
+    __CRC =                             struct.Struct('<L')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, calib):
+        return cls(len(NDIRCalibSchema.layout()), NDIRCalibSchema.pack(calib))
+
+
+    @classmethod
+    def construct_from_bytes(cls, image):
+        image = bytes(image)
+
+        if len(image) < cls.__HEADER.size + cls.__CRC.size:
+            raise ValueError("NDIRCalibImage.construct_from_bytes: image too short: %s bytes." % len(image))
+
+        magic, image_format, field_count = cls.__HEADER.unpack_from(image)
+
+        if magic != cls.MAGIC:
+            raise ValueError("NDIRCalibImage.construct_from_bytes: unrecognised magic: %s." % magic)
+
+        if image_format != cls.FORMAT:
+            raise ValueError("NDIRCalibImage.construct_from_bytes: unrecognised format: %s." % image_format)
+
+        crc = cls.__CRC.unpack_from(image, len(image) - cls.__CRC.size)[0]
+
+        if crc != zlib.crc32(image[:-cls.__CRC.size]):
+            raise ValueError("NDIRCalibImage.construct_from_bytes: CRC mismatch: 0x%08x." % crc)
+
+        return cls(field_count, image[cls.__HEADER.size:-cls.__CRC.size])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, field_count, fields):
+        """
+        Constructor
+        """
+        self.__field_count = int(field_count)           # int
+        self.__fields = bytes(fields)                   # bytes - the packed fields, in NDIRCalibSchema order
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def calib(self, calib_class):
+        if self.field_count != len(NDIRCalibSchema.layout()):
+            raise ValueError("NDIRCalibImage.calib: unrecognised field count: %s." % self.field_count)
+
+        return NDIRCalibSchema.unpack(calib_class, self.__fields)
+
+
+    def as_bytes(self):
+        return self.__framed() + self.__CRC.pack(self.crc)
+
+
+    def __framed(self):
+        return self.__HEADER.pack(self.MAGIC, self.FORMAT, self.field_count) + self.__fields
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def field_count(self):
+        return self.__field_count
+
+
+    @property
+    def crc(self):
+        return zlib.crc32(self.__framed())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRCalibImage:{field_count:%s, size:%s, crc:0x%08x}" % \
+               (self.field_count, len(self.as_bytes()), self.crc)
@@ -0,0 +1,175 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A host-side journal of an EEPROM calibration store, so that a store interrupted by power loss, a NACK or a lost session
+can be resumed from the first uncommitted field, instead of being restarted. A step is committed once its field has
+been written and verified by read-back.
+
+Steps are in NDIRCalibSchema.plan() order - a range that is in use is marked as unset before its fields are written,
+and marked as set only once they have all been committed.
+
+Each store has its own file, named for the board's SPI device and the NDIR serial number at the start of the store -
+for example, spidev0.1-12700000_ndir_calib_journal.json - so that the journal of one board is never replayed on, or
+cleared by, another.
+
+example JSON:
+{"ndir-serial": 12700000, "board-serial": 1000000, "calib": {"ndir-serial": 12700000, ...},
+"steps": [[1, 0, "0000"], [1, 2, "9e8b613e"], [1, 0, "0100"]], "committed": 1}
+"""
+
+import json
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify, MultiPersistentJSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCalibJournal(MultiPersistentJSONable):
+    """
+    classdocs
+    """
+
+    __FILENAME = "ndir_calib_journal.json"
+
+    @classmethod
+    def persistence_location(cls, name):
+        filename = cls.__FILENAME if name is None else '_'.join((name, cls.__FILENAME))
+
+        return cls.conf_dir(), filename
+
+
+    @classmethod
+    def name_for(cls, board_name, ndir_serial):
+        return '%s-%s' % (board_name, ndir_serial)
+
+
+    @classmethod
+    def names_for(cls, manager, board_name):
+        names = cls.list(manager)
+
+        return [] if names is None else [name for name in names if name.startswith(board_name + '-')]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, board_name, ndir_serial, board_serial, calib, steps):
+        calib_jdict = json.loads(JSONify.dumps(calib), object_pairs_hook=OrderedDict)
+
+        return cls(ndir_serial, board_serial, calib_jdict, steps, 0, name=cls.name_for(board_name, ndir_serial))
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None, skeleton=False):
+        if not jdict:
+            return None
+
+        ndir_serial = jdict.get('ndir-serial')
+        board_serial = jdict.get('board-serial')
+
+        calib = jdict.get('calib')
+        steps = [(block, index, bytes.fromhex(value)) for block, index, value in jdict.get('steps')]
+        committed = jdict.get('committed')
+
+        return cls(ndir_serial, board_serial, calib, steps, committed, name=name)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir_serial, board_serial, calib, steps, committed, name=None):
+        """
+        Constructor
+        """
+        super().__init__(name)                          # the board's SPI device name and NDIR serial
+
+        self.__ndir_serial = ndir_serial                # unsigned long - the board, when the store was started
+        self.__board_serial = board_serial              # unsigned long
+        self.__calib = calib                            # dict - the JSON image of the model's target NDIRCalib
+
+        self.__steps = steps                            # list of (block, index, bytes), in commit order
+        self.__committed = int(committed)               # int count of steps committed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def matches(self, ndir_serial, board_serial):
+        # each serial number is written by its own step, so each may be that at the start of the store, or its target...
+        if ndir_serial not in (self.ndir_serial, self.__calib.get('ndir-serial')):
+            return False
+
+        return board_serial in (self.board_serial, self.__calib.get('board-serial'))
+
+
+    def is_for(self, calib):
+        return JSONify.dumps(calib) == JSONify.dumps(self.__calib)
+
+
+    def remaining(self):
+        return self.__steps[self.__committed:]
+
+
+    def commit(self):
+        self.__committed += 1
+
+
+    def calib(self, calib_class):
+        return calib_class.construct_from_jdict(self.__calib)
+
+
+    def keys(self):
+        # the distinct (block, index) fields of the store, in commit order...
+        return list(OrderedDict(((block, index), None) for block, index, _ in self.__steps).keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def is_complete(self):
+        return self.__committed >= len(self.__steps)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['ndir-serial'] = self.ndir_serial
+        jdict['board-serial'] = self.board_serial
+        jdict['calib'] = self.__calib
+        jdict['steps'] = [[block, index, value_bytes.hex()] for block, index, value_bytes in self.steps]
+        jdict['committed'] = self.committed
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ndir_serial(self):
+        return self.__ndir_serial
+
+
+    @property
+    def board_serial(self):
+        return self.__board_serial
+
+
+    @property
+    def steps(self):
+        return self.__steps
+
+
+    @property
+    def committed(self):
+        return self.__committed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRCalibJournal:{name:%s, ndir_serial:%s, board_serial:%s, steps:%s, committed:%s}" % \
+               (self.name, self.ndir_serial, self.board_serial, len(self.steps), self.committed)
@@ -0,0 +1,180 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A read-only, lazy view of the NDIR EEPROM calibration. Fields are read from the board only when they are accessed, and
+are then memoised - a range is read as a whole, using a block read where the firmware supports one. The proxy offers
+the getters of the model's NDIRCalib, and calib() materialises the full calibration, through the driver's cache.
+
+The proxy is a snapshot: it is discarded by the driver whenever the calibration is stored or invalidated.
+
+example use:
+proxy = ndir.calib_proxy()
+interval = (proxy.lamp_period + proxy.sample_end) / 1000
+"""
+
+from scs_ndir.gas.ndir.ndir_calib_schema import NDIRCalibSchema
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCalibProxy(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir, range_class, calib=None):
+        """
+        Constructor
+        """
+        self.__ndir = ndir                              # SPINDIRx1 or SPINDIRt1f1
+        self.__range_class = range_class                # the model's NDIRRangeCalib class
+
+        self.__calib = calib                            # NDIRCalib - set once materialised
+        self.__values = {}                              # dict of (block, index): value, as read
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def value(self, key):
+        # a common field, by JSON key...
+        field = NDIRCalibSchema.common_field(key)
+
+        if field is None:
+            raise ValueError("NDIRCalibProxy.value: unrecognised key: %s." % key)
+
+        if self.__calib is not None:
+            return self.__calib.as_json()[key]
+
+        try:
+            self.__ndir.obtain_lock()
+
+            location = (NDIRCalibSchema.COMMON_BLOCK, field.index)
+
+            if location not in self.__values:
+                self.__values[location] = self.__ndir.read_calib_field(NDIRCalibSchema.COMMON_BLOCK, field)
+
+            return self.__values[location]
+
+        finally:
+            self.__ndir.release_lock()
+
+
+    def range(self, key):
+        # a range calibration, by JSON key - None if the range is not set...
+        block = NDIRCalibSchema.range_block(key)
+
+        if block is None:
+            raise ValueError("NDIRCalibProxy.range: unrecognised key: %s." % key)
+
+        if self.__calib is not None:
+            return self.__calib.as_json()[key]
+
+        try:
+            self.__ndir.obtain_lock()
+
+            if (block, NDIRCalibSchema.RANGE_IS_SET.index) not in self.__values:
+                self.__values.update(self.__ndir.read_calib_block(block))
+
+            return self.__range_class.construct_from_jdict(NDIRCalibSchema.range_jdict(block, self.__values))
+
+        finally:
+            self.__ndir.release_lock()
+
+
+    def calib(self):
+        if self.__calib is None:
+            self.__calib = self.__ndir.calib()
+
+        return self.__calib
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def is_materialised(self):
+        return self.__calib is not None
+
+
+    @property
+    def read_count(self):
+        return len(self.__values)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # getters: identity
+
+    @property
+    def ndir_serial(self):
+        return self.value('ndir-serial')
+
+
+    @property
+    def board_serial(self):
+        return self.value('board-serial')
+
+
+    @property
+    def selected_range(self):
+        return self.value('selected-range')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # getters: common fields
+
+    @property
+    def lamp_voltage(self):
+        return self.value('lamp-voltage')
+
+
+    @property
+    def lamp_period(self):
+        return self.value('lamp-period')
+
+
+    @property
+    def sample_start(self):
+        return self.value('sample-start')
+
+
+    @property
+    def sample_end(self):
+        return self.value('sample-end')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # getters: range fields
+
+    @property
+    def range_iaq(self):
+        return self.range('range-iaq')
+
+
+    @property
+    def range_safety(self):
+        return self.range('range-safety')
+
+
+    @property
+    def range_combustion(self):
+        return self.range('range-combustion')
+
+
+    @property
+    def range_industrial(self):
+        return self.range('range-industrial')
+
+
+    @property
+    def range_custom(self):
+        return self.range('range-custom')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRCalibProxy:{range_class:%s, materialised:%s, read_count:%s}" % \
+               (self.__range_class.__module__, self.is_materialised, self.read_count)
@@ -0,0 +1,376 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The layout of the NDIR EEPROM calibration, shared by the x1 and t1f1 models. Each field is declared once, by block,
+index, struct format, JSON key and rounding; the schema then encodes, decodes, diffs and packs calibrations of either
+model's NDIRCalib class through its JSON form.
+
+Block 0 holds the identity and common fields. Blocks 1 to 5 each hold a range calibration, headed by its is-set flag
+- the fields of an unset range are neither written nor read.
+
+Encoded fields are little-endian. A float of None is stored as NaN, and an integer of None as blank (0xff) EEPROM.
+
+A calibration is verified against a board by its digest - the CRC-32 of its packed form - where the firmware reports
+one, or by reading back a sample of its fields otherwise.
+"""
+
+import math
+import random
+import struct
+import zlib
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCalibField(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, index, layout, key, precision=None):
+        """
+        Constructor
+        """
+        self.__index = index                            # int
+        self.__layout = layout                          # struct format string
+        self.__key = key                                # string JSON key, or None for the range is-set flag
+        self.__precision = precision                    # int decimal places for floats, or None
+
+        self.__struct = struct.Struct(layout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def encode(self, value):
+        if value is None:
+            return struct.pack(self.layout, math.nan) if self.is_float else b'\xff' * self.size
+
+        return self.__struct.pack(value)
+
+
+    def decode(self, value_bytes, offset=0):
+        value = self.__struct.unpack_from(bytes(value_bytes), offset)[0]
+
+        if not self.is_float:
+            return value
+
+        return None if math.isnan(value) else Datum.float(value, self.precision)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def index(self):
+        return self.__index
+
+
+    @property
+    def layout(self):
+        return self.__layout
+
+
+    @property
+    def key(self):
+        return self.__key
+
+
+    @property
+    def precision(self):
+        return self.__precision
+
+
+    @property
+    def size(self):
+        return self.__struct.size
+
+
+    @property
+    def is_float(self):
+        return self.layout.endswith('f')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRCalibField:{index:%s, layout:%s, key:%s, precision:%s}" % \
+               (self.index, self.layout, self.key, self.precision)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCalibSchema(object):
+    """
+    classdocs
+    """
+
+    COMMON_BLOCK =                      0
+
+    SELECTED_RANGE = NDIRCalibField(2, '<H', 'selected-range')
+
+    COMMON_FIELDS = (
+        # identity...
+        NDIRCalibField(0, '<L', 'ndir-serial'),
+        NDIRCalibField(1, '<L', 'board-serial'),
+
+        SELECTED_RANGE,
+
+        # common fields...
+        NDIRCalibField(3, '<f', 'lamp-voltage', 1),
+
+        NDIRCalibField(4, '<H', 'lamp-period'),
+        NDIRCalibField(5, '<H', 'sample-start'),
+        NDIRCalibField(6, '<H', 'sample-end'),
+    )
+
+    RANGE_IS_SET = NDIRCalibField(0, '<H', None)
+
+    RANGE_FIELDS = (
+        RANGE_IS_SET,
+
+        # range fields...
+        NDIRCalibField(1, '<f', 'zero', 6),
+        NDIRCalibField(2, '<f', 'span', 6),
+
+        NDIRCalibField(3, '<f', 'linear-b', 6),
+        NDIRCalibField(4, '<f', 'linear-c', 6),
+
+        NDIRCalibField(5, '<f', 'alpha-low', 6),
+        NDIRCalibField(6, '<f', 'alpha-high', 6),
+
+        NDIRCalibField(7, '<f', 'beta-a', 6),
+        NDIRCalibField(8, '<f', 'beta-o', 6),
+
+        NDIRCalibField(9, '<f', 't-cal', 6),
+    )
+
+    RANGES = (                                          # block: JSON key
+        (1, 'range-iaq'),
+        (2, 'range-safety'),
+        (3, 'range-combustion'),
+        (4, 'range-industrial'),
+        (5, 'range-custom'),
+    )
+
+    SAMPLE_SIZE =                       8               # fields read back, in addition to the range structure
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # layout...
+
+    @classmethod
+    def blocks(cls):
+        return [cls.COMMON_BLOCK] + [block for block, _ in cls.RANGES]
+
+
+    @classmethod
+    def block_fields(cls, block):
+        if block == cls.COMMON_BLOCK:
+            return cls.COMMON_FIELDS
+
+        return cls.RANGE_FIELDS if block in dict(cls.RANGES) else ()
+
+
+    @classmethod
+    def block_size(cls, block):
+        return sum(field.size for field in cls.block_fields(block))
+
+
+    @classmethod
+    def field(cls, block, index):
+        for field in cls.block_fields(block):
+            if field.index == index:
+                return field
+
+        return None
+
+
+    @classmethod
+    def common_field(cls, key):
+        for field in cls.COMMON_FIELDS:
+            if field.key == key:
+                return field
+
+        return None
+
+
+    @classmethod
+    def range_block(cls, key):
+        for block, range_key in cls.RANGES:
+            if range_key == key:
+                return block
+
+        return None
+
+
+    @classmethod
+    def layout(cls):
+        # list of (block, NDIRCalibField) for every field, whether set or not, in storage order...
+        return [(block, field) for block in cls.blocks() for field in cls.block_fields(block)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # encoding...
+
+    @classmethod
+    def encode(cls, calib):
+        # OrderedDict of (block, index): bytes for the fields to be stored, in storage order...
+        jdict = calib.as_json()
+        image = OrderedDict()
+
+        for field in cls.COMMON_FIELDS:
+            image[(cls.COMMON_BLOCK, field.index)] = field.encode(jdict.get(field.key))
+
+        for block, key in cls.RANGES:
+            range_calib = jdict.get(key)
+
+            image[(block, cls.RANGE_IS_SET.index)] = cls.RANGE_IS_SET.encode(0 if range_calib is None else 1)
+
+            if range_calib is None:
+                continue
+
+            range_jdict = range_calib.as_json()
+
+            for field in cls.RANGE_FIELDS[1:]:
+                image[(block, field.index)] = field.encode(range_jdict.get(field.key))
+
+        return image
+
+
+    @classmethod
+    def diff(cls, calib, base=None):
+        # list of (block, index) whose encoded bytes in calib differ from those in base...
+        image = cls.encode(calib)
+        base_image = {} if base is None else cls.encode(base)
+
+        return [key for key, value_bytes in image.items() if base_image.get(key) != value_bytes]
+
+
+    @classmethod
+    def plan(cls, calib, base=None):
+        # list of (block, index, bytes) for the fields that differ from base, in commit order...
+        image = cls.encode(calib)
+        base_image = {} if base is None else cls.encode(base)
+
+        changed = [key for key, value_bytes in image.items() if base_image.get(key) != value_bytes]
+
+        unset = cls.RANGE_IS_SET.encode(0)
+        selected_range = (cls.COMMON_BLOCK, cls.SELECTED_RANGE.index)
+
+        steps = [(block, index, image[(block, index)]) for block, index in changed
+                 if block == cls.COMMON_BLOCK and (block, index) != selected_range]
+
+        for block, _ in cls.RANGES:
+            is_set = (block, cls.RANGE_IS_SET.index)
+            fields = [key for key in changed if key[0] == block and key != is_set]
+
+            # a range that may be in use is marked as unset while its fields are written...
+            if fields and base_image.get(is_set) != unset:
+                steps.append(is_set + (unset, ))
+
+            steps.extend(key + (image[key], ) for key in fields)
+
+            # ...and its is-set flag is the commit marker...
+            if fields or is_set in changed:
+                steps.append(is_set + (image[is_set], ))
+
+        # the range selection follows the range that it selects...
+        if selected_range in changed:
+            steps.append(selected_range + (image[selected_range], ))
+
+        return steps
+
+
+    @classmethod
+    def pack(cls, calib):
+        # every field in layout order - the fields of unset ranges are blank...
+        return cls.pack_image(cls.encode(calib))
+
+
+    @classmethod
+    def pack_image(cls, image):
+        # image is a dict of (block, index): bytes - absent fields are blank...
+        return b''.join(image.get((block, field.index), field.encode(None)) for block, field in cls.layout())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # verification...
+
+    @classmethod
+    def digest(cls, calib):
+        return zlib.crc32(cls.pack(calib))
+
+
+    @classmethod
+    def sample(cls, calib, count=None):
+        # list of (block, index) to be read back - the range structure, then a random selection of the other fields...
+        image = cls.encode(calib)
+        count = cls.SAMPLE_SIZE if count is None else count
+
+        structure = [(cls.COMMON_BLOCK, cls.SELECTED_RANGE.index)] + \
+                    [(block, cls.RANGE_IS_SET.index) for block, _ in cls.RANGES]
+
+        others = [key for key in image.keys() if key not in structure]
+
+        return structure + random.sample(others, min(count, len(others)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # decoding...
+
+    @classmethod
+    def decode(cls, calib_class, values):
+        # values is a dict of (block, index): value - fields of unset ranges may be absent...
+        jdict = OrderedDict()
+
+        for field in cls.COMMON_FIELDS:
+            jdict[field.key] = values.get((cls.COMMON_BLOCK, field.index))
+
+        for block, key in cls.RANGES:
+            jdict[key] = cls.range_jdict(block, values)
+
+        return calib_class.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def range_jdict(cls, block, values):
+        # the JSON form of one range, or None if the range is not set...
+        if not values.get((block, cls.RANGE_IS_SET.index)):
+            return None
+
+        return OrderedDict((field.key, values.get((block, field.index))) for field in cls.RANGE_FIELDS[1:])
+
+
+    @classmethod
+    def unpack_block(cls, block, block_bytes):
+        # OrderedDict of (block, index): value...
+        values = OrderedDict()
+        offset = 0
+
+        for field in cls.block_fields(block):
+            values[(block, field.index)] = field.decode(block_bytes, offset)
+            offset += field.size
+
+        return values
+
+
+    @classmethod
+    def unpack(cls, calib_class, packed):
+        if len(packed) != sum(field.size for _, field in cls.layout()):
+            raise ValueError("NDIRCalibSchema.unpack: unrecognised length: %s." % len(packed))
+
+        values = OrderedDict()
+        offset = 0
+
+        for block in cls.blocks():
+            values.update(cls.unpack_block(block, packed[offset:offset + cls.block_size(block)]))
+            offset += cls.block_size(block)
+
+        return cls.decode(calib_class, values)
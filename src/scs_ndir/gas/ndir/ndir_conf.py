@@ -9,6 +9,7 @@ example JSON:
 
 from scs_core.gas.ndir.ndir_conf import NDIRConf as AbstractNDIRConf
 from scs_ndir.gas.ndir.ndir_monitor import NDIRMonitor
+from scs_ndir.gas.ndir.ndir_pool import NDIRPool
 
 from scs_ndir.gas.ndir.spi_ndir_t1_f1.ndir_calib import NDIRCalib as SPINDIRv1Calib
 from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
@@ -37,13 +38,23 @@ class NDIRConf(AbstractNDIRConf):
         return NDIRMonitor(self.ndir(interface, host), self)
 
 
-    def ndir(self, interface, host):
+    def ndir(self, interface, host, persistent=False, cached=False):
         if self.model is None:
             raise ValueError('unknown model: %s' % self.model)
 
         # TODO: check against a list of supported devices
 
-        return SPINDIRt1f1(interface, host.ndir_spi_dev_path())
+        cache_manager = host if cached else None        # the calib cache is persisted only on request
+
+        return SPINDIRt1f1(interface, host.ndir_spi_dev_path(), persistent=persistent,
+                           cache_manager=cache_manager, journal_manager=host)
+
+
+    def ndir_pool(self, interface, dev_paths):
+        if self.model is None:
+            raise ValueError('unknown model: %s' % self.model)
+
+        return NDIRPool.construct(interface, [(dev_path, self.model) for dev_path in dev_paths])
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -2,12 +2,10 @@
 Created on 28 Feb 2018
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
-"""
-
-import time
 
-from collections import OrderedDict
-from multiprocessing import Manager
+The monitor process publishes the latest averaged datum through an NDIRSharedRecord - a client reads it from shared
+memory, without a server process or a lock.
+"""
 
 from scs_core.data.average import Average
 
@@ -21,6 +19,8 @@ from scs_core.sys.logging import Logging
 
 from scs_host.lock.lock_timeout import LockTimeout
 
+from scs_ndir.gas.ndir.ndir_shared_record import NDIRSharedRecord
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -29,6 +29,9 @@ class NDIRMonitor(SynchronisedProcess):
     classdocs
     """
 
+    __GAS_KEYS =                        ('tmp', 'cnc-raw', 'cnc')
+    __VOLTAGE_KEYS =                    ('ref', 'act', 'therm')
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, ndir, conf):
@@ -38,9 +41,9 @@ class NDIRMonitor(SynchronisedProcess):
         self.__logger = Logging.getLogger()
         self.__logging_specification = Logging.specification()
 
-        manager = Manager()
+        keys = self.__VOLTAGE_KEYS if conf.raw else self.__GAS_KEYS
 
-        SynchronisedProcess.__init__(self, manager.list())
+        SynchronisedProcess.__init__(self, NDIRSharedRecord(keys))
 
         self.__ndir = ndir
 
@@ -78,19 +81,22 @@ class NDIRMonitor(SynchronisedProcess):
         sleep_time = self.__ndir.get_sample_interval()
         timer = IntervalTimer(sleep_time + 0.2)
 
+        reading = 'voltage' if self.__raw else 'gas'
+
         try:
+            self.__ndir.sample()
+
             while timer.true():
-                self.__ndir.sample()
-                time.sleep(sleep_time)
+                # read the completed cycle and start the next, under one lock...
+                results = self.__ndir.batch(reading, 'sample')
 
-                datum = NDIRVoltages(*self.__ndir.get_sample_voltage()) if self.__raw else self.__ndir.get_sample_gas()
+                datum = NDIRVoltages(*results[reading]) if self.__raw else results[reading]
 
                 self.__averaging.append(datum)
                 average = self.__averaging.mid()
 
                 # report...
-                with self._lock:
-                    average.as_list(self._value)
+                self._value.write(average.as_json())
 
         except (ConnectionError, KeyboardInterrupt, LockTimeout):
             pass
@@ -108,10 +114,7 @@ class NDIRMonitor(SynchronisedProcess):
 
 
     def sample(self):
-        with self._lock:
-            value = self._value
-
-        jdict = OrderedDict(value)
+        jdict = self._value.read()
 
         return NDIRVoltages.construct_from_jdict(jdict) if self.__raw else NDIRDatum.construct_from_jdict(jdict)
 
@@ -0,0 +1,268 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A pool of NDIR boards on separate SPI chip selects. On each tick, every board's measurement cycle is started in
+parallel, so that N boards are sampled in one lamp period, rather than N lamp periods. Each board is locked on its
+own host lock, which it shares with every other tool that uses the same device.
+
+Boards that report their reading on the trigger (x1) are not waited for - the pool waits a lamp interval only if
+a board must be read out after its cycle (t1f1). Each board is identified by dev path and by the NDIR serial number
+of its calibration, which is read on the first tick.
+
+document example (NDIRPoolReading):
+{"dev": "/dev/spidev0.1", "ndir-serial": 1234567, "val": {"tmp": 31.2, "cnc-raw": 451.3, "cnc": 463.7},
+"latency": 0.016, "error": null}
+"""
+
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1 import SPINDIRx1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRPool(object):
+    """
+    classdocs
+    """
+
+    __MODELS = {
+        't1f1': SPINDIRt1f1,
+        'x1': SPINDIRx1
+    }
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, interface, devices, persistent=True):
+        ndirs = OrderedDict()
+
+        for dev_path, model in devices:
+            if model not in cls.__MODELS:
+                raise ValueError('unknown model: %s' % model)
+
+            ndirs[dev_path] = cls.__MODELS[model](interface, dev_path, persistent=persistent)
+
+        return cls(ndirs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndirs):
+        """
+        Constructor
+        """
+        self.__ndirs = ndirs                            # OrderedDict of dev_path: NDIR
+        self.__executor = ThreadPoolExecutor(max_workers=max(len(ndirs), 1))
+
+        self.__interval = None                          # float seconds - the longest interval in the pool
+        self.__serials = OrderedDict((dev_path, None) for dev_path in ndirs)      # dev_path: NDIR serial or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def power_on(self):
+        self.__first.power_on()                         # all boards share the interface power supply
+
+
+    def power_off(self):
+        self.__first.power_off()
+
+
+    def close(self):
+        for ndir in self.__ndirs.values():
+            ndir.close()
+
+        self.__executor.shutdown(wait=False)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def get_sample_interval(self):
+        # the longest interval of the boards that answered - not cached until one has...
+        if self.__interval is not None:
+            return self.__interval
+
+        futures = [self.__executor.submit(self.__timed, ndir.get_sample_interval) for ndir in self.__ndirs.values()]
+        intervals = [interval for interval, _, error in (future.result() for future in futures) if error is None]
+
+        if not intervals:
+            return 0.0
+
+        self.__interval = max(intervals)
+
+        return self.__interval
+
+
+    def sample(self):
+        interval = self.get_sample_interval()
+
+        self.__identify()
+
+        # start all measurement cycles...
+        triggers = OrderedDict((dev_path, self.__executor.submit(self.__timed, ndir.sample))
+                               for dev_path, ndir in self.__ndirs.items())
+
+        triggered = OrderedDict((dev_path, future.result()) for dev_path, future in triggers.items())
+
+        # boards to be read out after their cycle - not those that failed, or whose trigger returned the reading (x1)...
+        pending = [dev_path for dev_path, (datum, latency, error) in triggered.items()
+                   if error is None and datum is None]
+
+        if pending:
+            time.sleep(interval)
+
+        # collect...
+        readings = OrderedDict((dev_path, self.__executor.submit(self.__timed, self.__ndirs[dev_path].get_sample_gas))
+                               for dev_path in pending)
+
+        report = []
+
+        for dev_path, (datum, latency, error) in triggered.items():
+            if dev_path in readings:
+                datum, read_latency, error = readings[dev_path].result()
+                latency += read_latency
+
+            report.append(NDIRPoolReading(dev_path, self.__serials[dev_path], datum, latency, error))
+
+        return report
+
+
+    def apply(self, func):
+        # func(dev_path, ndir) is run on every board in parallel - returns dict of dev_path: (result, latency, error)
+        futures = OrderedDict((dev_path, self.__executor.submit(self.__timed, func, dev_path, ndir))
+                              for dev_path, ndir in self.__ndirs.items())
+
+        return OrderedDict((dev_path, future.result()) for dev_path, future in futures.items())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __identify(self):
+        unknown = [dev_path for dev_path, serial in self.__serials.items() if serial is None]
+
+        if not unknown:
+            return
+
+        futures = OrderedDict((dev_path, self.__executor.submit(self.__timed, self.__ndirs[dev_path].calib))
+                              for dev_path in unknown)
+
+        for dev_path, future in futures.items():
+            calib, _, error = future.result()
+
+            if error is None and calib is not None:
+                self.__serials[dev_path] = calib.ndir_serial     # a failed board is identified on a later tick
+
+
+    @staticmethod
+    def __timed(func, *args):
+        start_time = time.time()
+
+        try:
+            return func(*args), time.time() - start_time, None
+
+        except Exception as ex:
+            return None, time.time() - start_time, ex
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def __first(self):
+        return next(iter(self.__ndirs.values()))
+
+
+    @property
+    def ndirs(self):
+        return self.__ndirs
+
+
+    @property
+    def serials(self):
+        return self.__serials
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        ndirs = '[' + ', '.join(str(ndir) for ndir in self.__ndirs.values()) + ']'
+
+        return "NDIRPool:{ndirs:%s, interval:%s}" % (ndirs, self.__interval)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRPoolReading(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, dev_path, ndir_serial, datum, latency, error):
+        """
+        Constructor
+        """
+        self.__dev_path = dev_path                      # string
+        self.__ndir_serial = ndir_serial                # unsigned long or None
+        self.__datum = datum                            # NDIRDatum or None
+        self.__latency = Datum.float(latency, 3)        # float seconds spent in SPI transactions
+        self.__error = error                            # exception or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['dev'] = self.dev_path
+        jdict['ndir-serial'] = self.ndir_serial
+        jdict['val'] = self.datum
+        jdict['latency'] = self.latency
+        jdict['error'] = None if self.error is None else repr(self.error)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def dev_path(self):
+        return self.__dev_path
+
+
+    @property
+    def ndir_serial(self):
+        return self.__ndir_serial
+
+
+    @property
+    def datum(self):
+        return self.__datum
+
+
+    @property
+    def latency(self):
+        return self.__latency
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRPoolReading:{dev_path:%s, ndir_serial:%s, datum:%s, latency:%s, error:%s}" % \
+               (self.dev_path, self.ndir_serial, self.datum, self.latency, self.error)
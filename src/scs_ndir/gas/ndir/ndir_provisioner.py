@@ -0,0 +1,193 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes calibrations to a pool of NDIR boards in parallel. Each board is identified by the ndir-serial in its EEPROM,
+and is given the calibration held for that serial number in the manifest. The calibration is stored (only changed
+fields are written), loaded by the microcontroller, then verified by EEPROM checksum or sampled read-back - the
+whole calibration is read back only if these do not match.
+
+document example (NDIRProvisionReport):
+{"dev": "/dev/spidev0.1", "ndir-serial": 12701439, "ok": true, "written": 11,
+"timing": {"read": 0.112, "store": 1.265, "reload": 2.213, "verify": 0.109}, "elapsed": 3.699, "error": null}
+"""
+
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRProvisioner(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pool, manifest):
+        """
+        Constructor
+        """
+        self.__pool = pool                              # NDIRPool
+        self.__manifest = manifest                      # dict of ndir_serial: NDIRCalib
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def provision(self):
+        results = self.__pool.apply(self.__provision)
+
+        return [report if report is not None else NDIRProvisionReport(dev_path, None, None, {}, elapsed, error)
+                for dev_path, (report, elapsed, error) in results.items()]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __provision(self, dev_path, ndir):
+        ndir_serial = None
+        written = None
+        timing = OrderedDict()
+        error = None
+
+        start_time = time.time()
+
+        try:
+            with ndir.session():
+                # identify...
+                current = self.__timed(timing, 'read', ndir.retrieve_calib)
+                ndir_serial = current.ndir_serial
+
+                calib = self.__manifest.get(ndir_serial)
+
+                if calib is None:
+                    raise ValueError("NDIRProvisioner: no calibration for ndir-serial: %s." % ndir_serial)
+
+                # store...
+                written = len(self.__timed(timing, 'store', ndir.store_calib, calib))
+                self.__timed(timing, 'reload', ndir.reload_calib)
+
+                # verify...
+                if not self.__timed(timing, 'verify', ndir.verify_calib, calib):
+                    raise ValueError("NDIRProvisioner: calibration does not match on read-back: %s." % ndir_serial)
+
+        except Exception as ex:
+            error = ex
+
+        return NDIRProvisionReport(dev_path, ndir_serial, written, timing, time.time() - start_time, error)
+
+
+    @staticmethod
+    def __timed(timing, stage, func, *args):
+        start_time = time.time()
+
+        try:
+            return func(*args)
+
+        finally:
+            timing[stage] = time.time() - start_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def pool(self):
+        return self.__pool
+
+
+    @property
+    def manifest(self):
+        return self.__manifest
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRProvisioner:{pool:%s, manifest:%s}" % (self.pool, sorted(self.manifest.keys()))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRProvisionReport(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, dev_path, ndir_serial, written, timing, elapsed_time, error):
+        """
+        Constructor
+        """
+        self.__dev_path = dev_path                      # string
+        self.__ndir_serial = ndir_serial                # unsigned long or None
+        self.__written = written                        # int count of EEPROM fields written, or None
+        self.__timing = timing                          # OrderedDict of stage: float seconds
+        self.__elapsed_time = elapsed_time              # float seconds
+        self.__error = error                            # exception or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['dev'] = self.dev_path
+        jdict['ndir-serial'] = self.ndir_serial
+        jdict['ok'] = self.ok
+        jdict['written'] = self.written
+        jdict['timing'] = OrderedDict((stage, Datum.float(seconds, 3)) for stage, seconds in self.timing.items())
+        jdict['elapsed'] = Datum.float(self.elapsed_time, 3)
+        jdict['error'] = None if self.error is None else repr(self.error)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+    @property
+    def dev_path(self):
+        return self.__dev_path
+
+
+    @property
+    def ndir_serial(self):
+        return self.__ndir_serial
+
+
+    @property
+    def written(self):
+        return self.__written
+
+
+    @property
+    def timing(self):
+        return self.__timing
+
+
+    @property
+    def elapsed_time(self):
+        return self.__elapsed_time
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRProvisionReport:{dev_path:%s, ndir_serial:%s, ok:%s, written:%s, timing:%s, elapsed_time:%s, " \
+               "error:%s}" % \
+               (self.dev_path, self.ndir_serial, self.ok, self.written, self.timing, self.elapsed_time, self.error)
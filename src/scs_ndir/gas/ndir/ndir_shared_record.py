@@ -0,0 +1,129 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A fixed-layout record of float fields, held in shared memory, for a single writer process and any number of readers.
+The record is created before the writer process is started, and is inherited by it - no server process is needed.
+
+Access is protected by a sequence lock. The writer makes the sequence odd, writes the fields, then makes it even
+again. A reader copies the fields between two reads of the sequence, and retries if the sequence was odd or has
+changed - readers never block the writer. A field of None is held as NaN.
+
+The sequence is a 32-bit word, which is loaded and stored atomically on 32-bit ARM as well as on 64-bit hosts. The
+writer makes each step under a multiprocessing.Lock, whose acquire and release are full memory barriers, so that the
+odd sequence is visible before the fields, and the fields before the even sequence, on weakly-ordered CPUs. Readers
+take no lock - they assume that their loads of the sequence, the fields and the sequence again, each made by a
+separate ctypes call, are not reordered. tests/gas/ndir/ndir_shared_record_test.py checks for torn reads against a
+writer in another process.
+
+If the writer is terminated mid-write, the sequence is left odd, and read() returns None once its timeout has elapsed.
+
+example use:
+record = NDIRSharedRecord(('tmp', 'cnc-raw', 'cnc'))
+record.write(datum.as_json())                          # writer
+jdict = record.read()                                   # readers - None if nothing has been written
+"""
+
+import ctypes
+import math
+import time
+
+from collections import OrderedDict
+from multiprocessing import Lock
+from multiprocessing.sharedctypes import RawArray, RawValue
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRSharedRecord(object):
+    """
+    classdocs
+    """
+
+    __SPIN_COUNT =                      100             # retries before the reader yields
+    __YIELD_TIME =                      0.001           # seconds
+    __READ_TIMEOUT =                    0.5             # seconds - bounds a write interrupted by termination
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, keys):
+        """
+        Constructor
+        """
+        self.__keys = tuple(keys)                       # tuple of string JSON keys, in field order
+
+        self.__sequence = RawValue(ctypes.c_uint32, 0)  # even when stable, odd while being written
+        self.__fields = RawArray(ctypes.c_double, len(self.__keys))
+
+        self.__fence = Lock()                           # writer only - orders the sequence and field stores
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # writer...
+
+    def write(self, jdict):
+        values = [jdict.get(key) for key in self.__keys]
+
+        # each step is fenced, so that its stores are visible before those of the next...
+        with self.__fence:
+            self.__sequence.value += 1                  # odd: write in progress
+
+        with self.__fence:
+            self.__fields[:] = [math.nan if value is None else value for value in values]
+
+        with self.__fence:
+            self.__sequence.value += 1                  # even: stable
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # readers...
+
+    def read(self):
+        deadline = None
+        attempts = 0
+
+        while True:
+            before = self.__sequence.value
+            values = self.__fields[:]
+            after = self.__sequence.value
+
+            if before == after and before % 2 == 0:
+                break
+
+            attempts += 1
+
+            if attempts < self.__SPIN_COUNT:
+                continue
+
+            if deadline is None:
+                deadline = time.time() + self.__READ_TIMEOUT
+
+            elif time.time() > deadline:
+                return None
+
+            time.sleep(self.__YIELD_TIME)
+
+        if before == 0:
+            return None                                 # nothing written yet
+
+        return OrderedDict((key, None if math.isnan(value) else value) for key, value in zip(self.__keys, values))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def keys(self):
+        return self.__keys
+
+
+    @property
+    def sequence(self):
+        return self.__sequence.value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRSharedRecord:{keys:%s, sequence:%s}" % (self.keys, self.sequence)
@@ -0,0 +1,94 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+This package is compatible with the following microcontroller firmware:
+https://github.com/south-coast-science/scs_spi_ndir_t1_mcu_f1
+"""
+
+import asyncio
+
+from scs_ndir.gas.ndir.async_ndir import AsyncNDIR
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1_cmd import SPINDIRt1f1Cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncSPINDIRt1f1(AsyncNDIR):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, interface, dev_path, executor=None):
+        return cls(SPINDIRt1f1(interface, dev_path, persistent=True), executor=executor)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir, executor=None):
+        """
+        Constructor
+        """
+        super().__init__(ndir, SPINDIRt1f1Cmd, executor=executor)
+
+        self.__interval = None                          # float seconds, read from the device on first use
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # sampling...
+
+    async def sample(self):
+        await self._call(self.ndir.sample)
+
+
+    async def sample_gas(self):
+        await self.__sample_cycle()
+
+        return await self.get_sample_gas()
+
+
+    async def sample_voltage(self):
+        await self.__sample_cycle()
+
+        return await self.get_sample_voltage()
+
+
+    async def sample_pressure(self):
+        await self.__sample_cycle()
+
+        return await self.get_sample_pressure()
+
+
+    async def get_sample_gas(self):
+        return await self._call(self.ndir.get_sample_gas)
+
+
+    async def get_sample_raw(self):
+        return await self._call(self.ndir.get_sample_raw)
+
+
+    async def get_sample_voltage(self):
+        return await self._call(self.ndir.get_sample_voltage)
+
+
+    async def get_sample_offsets(self):
+        return await self._call(self.ndir.get_sample_offsets)
+
+
+    async def get_sample_pressure(self):
+        return await self._call(self.ndir.get_sample_pressure)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def __sample_cycle(self):
+        if self.__interval is None:
+            self.__interval = await self.get_sample_interval()
+
+        await self.sample()
+        await asyncio.sleep(self.__interval)
@@ -7,6 +7,9 @@ This package is compatible with the following microcontroller firmware:
 https://github.com/south-coast-science/scs_spi_ndir_t1_mcu_f1
 """
 
+import math
+import struct
+
 from collections import OrderedDict
 
 from scs_core.data.datum import Datum
@@ -27,39 +30,41 @@ class SPINDIRt1f1Cmd(JSONable):
     @classmethod
     def init(cls):
         cls.__COMMANDS = {
-            'vi': SPINDIRt1f1Cmd('vi', 0.001, 0.000, 40),           # version ident
-            'vt': SPINDIRt1f1Cmd('vt', 0.001, 0.000, 11),           # version tag
+            'vi': SPINDIRt1f1Cmd('vi', 0.001, 0.000, 40, '<40s'),       # version ident
+            'vt': SPINDIRt1f1Cmd('vt', 0.001, 0.000, 11, '<11s'),       # version tag
 
-            'up': SPINDIRt1f1Cmd('up', 0.001, 0.000, 4),            # uptime
+            'up': SPINDIRt1f1Cmd('up', 0.001, 0.000, 4, '<L'),          # uptime
 
-            'ws': SPINDIRt1f1Cmd('ws', 0.001, 0.000, 1),            # watchdog status
-            'wc': SPINDIRt1f1Cmd('wc', 0.001, 0.000, 0),            # watchdog clear
-            'wr': SPINDIRt1f1Cmd('wr', 0.001, 2.500, 0),            # watchdog reset
+            'ws': SPINDIRt1f1Cmd('ws', 0.001, 0.000, 1, '<?'),          # watchdog status
+            'wc': SPINDIRt1f1Cmd('wc', 0.001, 0.000, 0, None),          # watchdog clear
+            'wr': SPINDIRt1f1Cmd('wr', 0.001, 2.500, 0, None),          # watchdog reset
 
-            'cr': SPINDIRt1f1Cmd('cr', 0.002, 0.000, None),         # calib read
-            'cw': SPINDIRt1f1Cmd('cw', 0.004, 0.100, 0),            # calib write
-            'cl': SPINDIRt1f1Cmd('cl', 0.010, 2.200, 0),            # calib load
+            'cr': SPINDIRt1f1Cmd('cr', 0.002, 0.000, None, None),       # calib read
+            'cw': SPINDIRt1f1Cmd('cw', 0.004, 0.100, 0, None),          # calib write
+            'cb': SPINDIRt1f1Cmd('cb', 0.004, 0.000, None, None, api=4),  # calib block read (extension)
+            'cc': SPINDIRt1f1Cmd('cc', 0.010, 0.000, 4, '<L', api=4),     # calib checksum (extension)
+            'cl': SPINDIRt1f1Cmd('cl', 0.010, 2.200, 0, None),          # calib load
 
-            'lr': SPINDIRt1f1Cmd('lr', 0.001, 0.000, 0),            # lamp run
+            'lr': SPINDIRt1f1Cmd('lr', 0.001, 0.000, 0, None),          # lamp run
 
-            'ir': SPINDIRt1f1Cmd('ir', 0.001, 0.000, 2),            # input raw
-            'iv': SPINDIRt1f1Cmd('iv', 0.001, 0.000, 4),            # input voltage
+            'ir': SPINDIRt1f1Cmd('ir', 0.001, 0.000, 2, '<H'),          # input raw
+            'iv': SPINDIRt1f1Cmd('iv', 0.001, 0.000, 4, '<f'),          # input voltage
 
-            'mc': SPINDIRt1f1Cmd('mc', 0.001, 1.000, 0),            # measure calibrate
-            'mr': SPINDIRt1f1Cmd('mr', 0.001, 0.000, 6),            # measure raw
-            'mv': SPINDIRt1f1Cmd('mv', 0.001, 0.000, 12),           # measure voltage
+            'mc': SPINDIRt1f1Cmd('mc', 0.001, 1.000, 0, None),          # measure calibrate
+            'mr': SPINDIRt1f1Cmd('mr', 0.001, 0.000, 6, '<HHH'),        # measure raw
+            'mv': SPINDIRt1f1Cmd('mv', 0.001, 0.000, 12, '<fff'),       # measure voltage
 
-            'rs': SPINDIRt1f1Cmd('rs', 0.001, None, 0),             # recorder start (time depends on period /count)
-            'rp': SPINDIRt1f1Cmd('rp', 0.001, 0.000, None),         # recorder play
+            'rs': SPINDIRt1f1Cmd('rs', 0.001, None, 0, None),           # recorder start (time depends on period /count)
+            'rp': SPINDIRt1f1Cmd('rp', 0.001, 0.000, None, '<Hll'),     # recorder play
 
-            'sp': SPINDIRt1f1Cmd('sp', 0.001, None, 0),             # sampler mode (time depends on lamp cycle)
-            'sr': SPINDIRt1f1Cmd('sr', 0.001, 0.000, 6),            # sampler raw
-            'sv': SPINDIRt1f1Cmd('sv', 0.001, 0.000, 12),           # sampler voltage
-            'sg': SPINDIRt1f1Cmd('sg', 0.010, 0.000, 12),           # sampler gas
+            'sp': SPINDIRt1f1Cmd('sp', 0.001, None, 0, None),           # sampler mode (time depends on lamp cycle)
+            'sr': SPINDIRt1f1Cmd('sr', 0.001, 0.000, 6, '<HHH'),        # sampler raw
+            'sv': SPINDIRt1f1Cmd('sv', 0.001, 0.000, 12, '<fff'),       # sampler voltage
+            'sg': SPINDIRt1f1Cmd('sg', 0.010, 0.000, 12, '<fff'),       # sampler gas
 
-            'so': SPINDIRt1f1Cmd('so', 0.001, 0.000, 8),            # sampler offsets
+            'so': SPINDIRt1f1Cmd('so', 0.001, 0.000, 8, '<HHHH'),       # sampler offsets
 
-            'sb': SPINDIRt1f1Cmd('sb', 0.001, 0.000, 4),            # sampler actual barometric pressure
+            'sb': SPINDIRt1f1Cmd('sb', 0.001, 0.000, 4, '<f'),          # sampler actual barometric pressure
         }
 
 
@@ -71,9 +76,14 @@ class SPINDIRt1f1Cmd(JSONable):
         return cls.__COMMANDS[name]
 
 
+    @classmethod
+    def names(cls):
+        return list(cls.__COMMANDS.keys())
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, name, response_time, execution_time, return_count):
+    def __init__(self, name, response_time, execution_time, return_count, response_layout=None, api=None):
         """
         Constructor
         """
@@ -81,7 +91,13 @@ class SPINDIRt1f1Cmd(JSONable):
 
         self.__response_time = Datum.float(response_time, 3)            # float Seconds
         self.__execution_time = Datum.float(execution_time, 3)          # float Seconds
-        self.__return_count = Datum.int(return_count)                   # int or None
+        self.__return_count = Datum.int(return_count)                   # int or None (set per transaction)
+
+        self.__response_layout = response_layout                        # struct format string or None
+        self.__api = Datum.int(api)                                     # int firmware API level, for an extension
+
+        self.__response_struct = None if response_layout is None else struct.Struct(response_layout)
+        self.__has_floats = response_layout is not None and 'f' in response_layout
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -94,16 +110,40 @@ class SPINDIRt1f1Cmd(JSONable):
         jdict['response-time'] = self.response_time
         jdict['execution-time'] = self.execution_time
         jdict['return-count'] = self.return_count
+        jdict['response-layout'] = self.response_layout
+        jdict['api'] = self.api
 
         return jdict
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def is_supported(self, tag):
+        # an extension is implemented from the firmware API level that introduced it...
+        if self.api is None:
+            return True
+
+        return tag is not None and tag.api >= self.api
+
+
     def name_bytes(self):
         return ord(self.name[0]), ord(self.name[1])
 
 
+    def decode(self, response):
+        values = self.__response_struct.unpack_from(bytes(response))
+
+        if not self.__has_floats:
+            return values
+
+        return tuple(None if math.isnan(value) else value for value in values)
+
+
+    def decode_records(self, response):
+        # the response is a sequence of records, each with the response layout...
+        return list(self.__response_struct.iter_unpack(bytes(response)))
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -126,13 +166,30 @@ class SPINDIRt1f1Cmd(JSONable):
         return self.__return_count
 
 
-    @return_count.setter
-    def return_count(self, count):
-        self.__return_count = count
+    @property
+    def response_layout(self):
+        return self.__response_layout
+
+
+    @property
+    def api(self):
+        return self.__api
+
+
+    @property
+    def optional(self):
+        return self.__api is not None
+
+
+    @property
+    def record_size(self):
+        return None if self.__response_struct is None else self.__response_struct.size
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "NDIRCmd:{name:%s, response_time:%s, execution_time:%s, return_count:%s}" % \
-               (self.name, self.response_time, self.execution_time, self.return_count)
+        return "NDIRCmd:{name:%s, response_time:%s, execution_time:%s, return_count:%s, response_layout:%s, " \
+               "api:%s}" % \
+               (self.name, self.response_time, self.execution_time, self.return_count, self.response_layout,
+                self.api)
@@ -0,0 +1,70 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+from scs_ndir.gas.ndir.async_ndir import AsyncNDIR
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1 import SPINDIRx1
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1_cmd import SPINDIRx1Cmd
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncSPINDIRx1(AsyncNDIR):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, interface, dev_path, executor=None):
+        return cls(SPINDIRx1(interface, dev_path, persistent=True), executor=executor)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, ndir, executor=None):
+        """
+        Constructor
+        """
+        super().__init__(ndir, SPINDIRx1Cmd, executor=executor)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # sampling...
+
+    async def sample(self):
+        return await self._call(self.ndir.sample)
+
+
+    async def pressure(self):
+        return await self._call(self.ndir.pressure)
+
+
+    async def lamp_level(self, voltage):
+        await self._call(self.ndir.lamp_level, voltage)
+
+
+    async def get_sample_mode(self, single_shot):
+        mode_byte = 1 if single_shot else 0
+
+        await self._call(self.ndir.command, 'sm', (mode_byte, ))
+        await self._await_completion('sm')
+
+
+    async def get_sample_gas(self):
+        return await self.sample()                      # the x1 'sg' command reports the latest gas sample
+
+
+    async def get_sample_raw(self):
+        return await self._call(self.ndir.get_sample_raw)
+
+
+    async def get_sample_voltage(self):
+        return await self._call(self.ndir.get_sample_voltage)
+
+
+    async def get_sample_offsets(self):
+        return await self._call(self.ndir.get_sample_offsets)
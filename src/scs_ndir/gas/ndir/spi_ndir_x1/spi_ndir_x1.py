@@ -4,9 +4,16 @@ Created on 11 Dec 2017
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
+import math
+import os
+import struct
+import threading
 import time
 
-from scs_core.data.datum import Decode, Encode
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from scs_core.data.datum import Encode
 
 from scs_core.gas.ndir.ndir import NDIR
 from scs_core.gas.ndir.ndir_datum import NDIRDatum
@@ -16,6 +23,11 @@ from scs_host.bus.spi import SPI
 from scs_host.lock.lock import Lock
 
 from scs_ndir.exception.ndir_exception import NDIRException
+from scs_ndir.gas.ndir.ndir_ack_poller import NDIRAckPoller
+from scs_ndir.gas.ndir.ndir_calib_cache import NDIRCalibCache
+from scs_ndir.gas.ndir.ndir_calib_journal import NDIRCalibJournal
+from scs_ndir.gas.ndir.ndir_calib_proxy import NDIRCalibProxy
+from scs_ndir.gas.ndir.ndir_calib_schema import NDIRCalibSchema
 
 from scs_ndir.gas.ndir.spi_ndir_x1.ndir_calib import NDIRCalib, NDIRRangeCalib
 from scs_ndir.gas.ndir.spi_ndir_x1.ndir_status import NDIRStatus
@@ -43,10 +55,36 @@ class SPINDIRx1(NDIR):
     __BOOT_DELAY =                      3.500           # seconds to first sample available
     __PARAM_DELAY =                     0.001           # seconds between SPI sessions
 
+    __COMPLETION_THRESHOLD =            0.050           # seconds - shorter execution times are simply slept
+    __COMPLETION_SETTLE =               0.010           # seconds before the first readiness probe
+    __MIN_COMPLETION_BACKOFF =          0.010           # seconds
+    __MAX_COMPLETION_BACKOFF =          0.100           # seconds
+
     __RESPONSE_ACK =                    0x01
     __RESPONSE_NACK =                   0x02
     __RESPONSE_BUSY =                   0x03
     __RESPONSE_NONE =                   (0x00, 0xff)
+    __RESPONSE_COMPLETE =               (__RESPONSE_ACK, __RESPONSE_NACK, __RESPONSE_BUSY)
+
+    __BUSY_TIMEOUT =                    0.100           # seconds - a command rejected as BUSY is re-sent until then
+    __MIN_BUSY_BACKOFF =                0.005           # seconds
+    __MAX_BUSY_BACKOFF =                0.020           # seconds
+
+    __BATCH_COMMANDS = {
+        'sample':           'sample',                   # gas, on x1
+        'gas':              'sample',                   # as for t1f1
+        'voltage':          'get_sample_voltage',
+        'raw':              'get_sample_raw',
+        'offsets':          'get_sample_offsets',
+        'pressure':         'pressure',
+        'input-voltage':    'input_voltage',
+        'status':           'status',
+        'version':          'version',
+    }
+
+    __CALIB_UNSIGNED_INT =              struct.Struct('<H')
+    __CALIB_UNSIGNED_LONG =             struct.Struct('<L')
+    __CALIB_FLOAT =                     struct.Struct('<f')
 
     __SPI_CLOCK =                       488000
     __SPI_MODE =                        1
@@ -54,16 +92,6 @@ class SPINDIRx1(NDIR):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    @classmethod
-    def obtain_lock(cls):
-        Lock.acquire(cls.__name__, SPINDIRx1.__LOCK_TIMEOUT)
-
-
-    @classmethod
-    def release_lock(cls):
-        Lock.release(cls.__name__)
-
-
     @classmethod
     def get_sample_interval(cls):
         return cls.SAMPLE_INTERVAL
@@ -78,13 +106,117 @@ class SPINDIRx1(NDIR):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, interface, dev_path):
+    def __init__(self, interface, dev_path, persistent=False, spi=None, cache_manager=None,
+                 journal_manager=None):
         """
         Constructor
         """
         super().__init__(interface)
 
-        self.__spi = SPI(dev_path, SPINDIRx1.__SPI_MODE, SPINDIRx1.__SPI_CLOCK)
+        self.__spi = SPI(dev_path, SPINDIRx1.__SPI_MODE, SPINDIRx1.__SPI_CLOCK) if spi is None else spi
+        self.__spi_is_open = False
+
+        self.__persistent = persistent                  # if True, the SPI device is held open between transactions
+        self.__ack_poller = NDIRAckPoller()
+
+        self.__mutex = threading.Lock()                 # serialises threads sharing this driver
+        self.__lock_name = '%s-%s' % (self.__class__.__name__, os.path.basename(dev_path))     # per board
+        self.__local = threading.local()                # lock depth, per thread
+
+        self.__board_name = os.path.basename(dev_path)  # names the board's host-side files
+
+        self.__cache_manager = cache_manager            # if set, the calib cache is persisted
+        self.__journal_manager = journal_manager        # if set, the calib journal is persisted
+        self.__calib = None                             # NDIRCalib - the cached calibration
+        self.__proxy = None                             # NDIRCalibProxy - fields read, while not cached
+        self.__firmware = None                          # NDIRVersion, read when an extension is first needed
+        self.__journal = None                           # NDIRCalibJournal - an uncompleted store, if any
+
+        self.__uptime = None                            # int seconds - the most recently observed uptime
+        self.__watchdog_reset = False                   # bool - the most recently observed watchdog status
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # lock...
+
+    def obtain_lock(self):
+        if self.__lock_depth == 0:
+            self.__mutex.acquire()
+
+            try:
+                Lock.acquire(self.__lock_name, self.__LOCK_TIMEOUT)
+
+            except BaseException:
+                self.__mutex.release()
+                raise
+
+        self.__local.depth = self.__lock_depth + 1
+
+
+    def release_lock(self):
+        if self.__lock_depth == 0:
+            return                                      # the lock was not obtained by this thread
+
+        self.__local.depth = self.__lock_depth - 1
+
+        if self.__lock_depth > 0:
+            return
+
+        try:
+            if not self.__persistent:
+                self.__close_spi()
+
+            Lock.release(self.__lock_name)
+
+        finally:
+            self.__mutex.release()
+
+
+    @property
+    def __lock_depth(self):
+        return getattr(self.__local, 'depth', 0)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # sessions...
+
+    @contextmanager
+    def session(self):
+        # commands within the session share one lock acquisition and one SPI session...
+        try:
+            self.obtain_lock()
+            yield self
+
+        finally:
+            self.release_lock()
+
+
+    def batch(self, *commands):
+        for command in commands:
+            if command not in self.__BATCH_COMMANDS:
+                raise ValueError("%s.batch: unrecognised command: %s." % (self.__class__.__name__, command))
+
+        results = OrderedDict()
+
+        with self.session():
+            for command in commands:
+                results[command] = getattr(self, self.__BATCH_COMMANDS[command])()
+
+        return results
+
+
+    def close(self):
+        self.__close_spi()
+
+
+    @property
+    def persistent(self):
+        return self.__persistent
+
+
+    @property
+    def ack_poller(self):
+        return self.__ack_poller
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -97,9 +229,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('sg')
             response = self._transact(cmd)
 
-            cnc = Decode.float(response[0:4], '<')
-            cnc_igl = Decode.float(response[4:8], '<')
-            temp = Decode.float(response[8:12], '<')
+            cnc, cnc_igl, temp = cmd.decode(response)
 
             return NDIRDatum(temp, cnc, cnc_igl)
 
@@ -114,12 +244,12 @@ class SPINDIRx1(NDIR):
             # version ident...
             cmd = SPINDIRx1Cmd.find('vi')
             response = self._transact(cmd)
-            id = ''.join([chr(byte) for byte in response]).strip()
+            id = cmd.decode(response)[0].decode('latin-1').strip()
 
             # version tag...
             cmd = SPINDIRx1Cmd.find('vt')
             response = self._transact(cmd)
-            tag = ''.join([chr(byte) for byte in response]).strip()
+            tag = cmd.decode(response)[0].decode('latin-1').strip()
 
             version = NDIRVersion(id, NDIRTag.construct_from_jdict(tag))
 
@@ -139,7 +269,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('sp')
             response = self._transact(cmd)
 
-            p_a = Decode.float(response[0:4], '<')
+            p_a = cmd.decode(response)[0]
 
             return round(p_a, 1)
 
@@ -159,15 +289,22 @@ class SPINDIRx1(NDIR):
             response = self._transact(cmd)
             watchdog_reset = bool(response)
 
+            if watchdog_reset and not self.__watchdog_reset:
+                self.invalidate_calib()                 # the board has restarted
+
+            self.__watchdog_reset = watchdog_reset
+
             # input voltage...
             cmd = SPINDIRx1Cmd.find('iv')
             response = self._transact(cmd)
-            pwr_in = Decode.float(response, '<')
+            pwr_in = cmd.decode(response)[0]
 
             # uptime...
             cmd = SPINDIRx1Cmd.find('up')
             response = self._transact(cmd)
-            seconds = Decode.unsigned_long(response, '<')
+            seconds = cmd.decode(response)[0]
+
+            self.__observe_uptime(seconds)
 
             status = NDIRStatus(watchdog_reset, pwr_in, NDIRUptime(seconds))
 
@@ -180,111 +317,253 @@ class SPINDIRx1(NDIR):
     # ----------------------------------------------------------------------------------------------------------------
     # calib...
 
-    def store_calib(self, calib):
+    def store_calib(self, calib, full=False):
+        # only changed fields are written, in journal order - an interrupted store of the same calib is resumed...
         try:
             self.obtain_lock()
 
-            # identity...
-            self._calib_w_unsigned_long(0, NDIRCalib.INDEX_NDIR_SERIAL, calib.ndir_serial)
-            self._calib_w_unsigned_long(0, NDIRCalib.INDEX_BOARD_SERIAL, calib.board_serial)
+            journal = self.__pending_journal()
+
+            if journal is None or not journal.is_for(calib):
+                if journal is not None:
+                    self.__close_journal(journal)       # superseded by a store of a different calib
+
+                current = None if full else self.calib()
 
-            self._calib_w_unsigned_int(0, NDIRCalib.INDEX_SELECTED_RANGE, calib.selected_range)
+                if current is None:
+                    ndir_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_NDIR_SERIAL)
+                    board_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_BOARD_SERIAL)
+                else:
+                    ndir_serial, board_serial = current.ndir_serial, current.board_serial
 
-            # common fields...
-            self._calib_w_float(0, NDIRCalib.INDEX_LAMP_VOLTAGE, calib.lamp_voltage)
+                journal = NDIRCalibJournal.construct(self.__board_name, ndir_serial, board_serial, calib,
+                                                     NDIRCalibSchema.plan(calib, current))
 
-            self._calib_w_unsigned_int(0, NDIRCalib.INDEX_LAMP_PERIOD, calib.lamp_period)
-            self._calib_w_unsigned_int(0, NDIRCalib.INDEX_SAMPLE_START, calib.sample_start)
-            self._calib_w_unsigned_int(0, NDIRCalib.INDEX_SAMPLE_END, calib.sample_end)
+            self.__run_journal(journal)
+            self.__cache_calib(calib)
 
-            # range calibrations...
-            self._store_range_calib(NDIRCalib.RANGE_IAQ, calib.range_iaq)
-            self._store_range_calib(NDIRCalib.RANGE_SAFETY, calib.range_safety)
-            self._store_range_calib(NDIRCalib.RANGE_COMBUSTION, calib.range_combustion)
-            self._store_range_calib(NDIRCalib.RANGE_INDUSTRIAL, calib.range_industrial)
-            self._store_range_calib(NDIRCalib.RANGE_CUSTOM, calib.range_custom)
+            return journal.keys()
 
         finally:
             self.release_lock()
 
 
-    def _store_range_calib(self, rng, calib):
-        # range check...
-        if calib is None:
-            self._calib_w_unsigned_int(rng, NDIRRangeCalib.INDEX_RANGE_IS_SET, 0)
-            return
+    def resume_calib(self):
+        # completes an interrupted store - returns the fields of the store, or None if there is none pending...
+        try:
+            self.obtain_lock()
+
+            journal = self.__pending_journal()
+
+            if journal is None:
+                return None
+
+            self.__run_journal(journal)
+            self.__cache_calib(journal.calib(NDIRCalib))
+
+            return journal.keys()
+
+        finally:
+            self.release_lock()
+
+
+    def __pending_journal(self):
+        # the uncompleted store of the board now on this device, if any - the journals of other boards are left alone...
+        journals = [] if self.__journal is None else [self.__journal]
+
+        if not journals and self.__journal_manager is not None:
+            names = NDIRCalibJournal.names_for(self.__journal_manager, self.__board_name)
+            journals = [NDIRCalibJournal.load(self.__journal_manager, name=name) for name in names]
+
+        journals = [journal for journal in journals if journal is not None]
+
+        if not journals:
+            return None
+
+        ndir_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_NDIR_SERIAL)
+        board_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_BOARD_SERIAL)
+
+        for journal in journals:
+            if journal.matches(ndir_serial, board_serial):
+                return journal
+
+        return None
+
+
+    def __run_journal(self, journal):
+        self.invalidate_calib()
+        self.__save_journal(journal)
+
+        for block, index, value_bytes in journal.remaining():
+            self._calib_w_bytes(block, index, value_bytes)
+
+            # verify...
+            if self._calib_r_bytes(block, index, len(value_bytes)) != value_bytes:
+                raise NDIRException('Verify failed', None, SPINDIRx1Cmd.find('cw'),
+                                    ((block, index), tuple(value_bytes)))
+
+            journal.commit()
+            self.__save_journal(journal)
+
+        self.__close_journal(journal)
 
-        self._calib_w_unsigned_int(rng, NDIRRangeCalib.INDEX_RANGE_IS_SET, 1)
 
-        # range fields...
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_ZERO, calib.zero)
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_SPAN, calib.span)
+    def __save_journal(self, journal):
+        self.__journal = journal
 
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_LINEAR_B, calib.linear_b)
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_LINEAR_C, calib.linear_c)
+        if self.__journal_manager is not None:
+            journal.save(self.__journal_manager)
 
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_ALPHA_LOW, calib.alpha_low)
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_ALPHA_HIGH, calib.alpha_high)
 
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_BETA_A, calib.beta_a)
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_BETA_O, calib.beta_o)
+    def __close_journal(self, journal):
+        self.__journal = None
 
-        self._calib_w_float(rng, NDIRRangeCalib.INDEX_T_CAL, calib.t_cal)
+        manager = self.__journal_manager
+
+        if manager is not None and NDIRCalibJournal.exists(manager, name=journal.name):
+            NDIRCalibJournal.delete(manager, name=journal.name)
 
 
     def retrieve_calib(self):
         try:
             self.obtain_lock()
 
-            # identity...
-            ndir_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_NDIR_SERIAL)
-            board_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_BOARD_SERIAL)
+            values = OrderedDict()
+
+            for block in NDIRCalibSchema.blocks():
+                values.update(self._calib_r_block(block))
+
+            calib = NDIRCalibSchema.decode(NDIRCalib, values)
+
+            self.__cache_calib(calib)
+
+            return calib
+
+        finally:
+            self.release_lock()
 
-            selected_range = self._calib_r_unsigned_int(0, NDIRCalib.INDEX_SELECTED_RANGE)
 
-            # common fields...
-            lamp_voltage = self._calib_r_float(0, NDIRCalib.INDEX_LAMP_VOLTAGE)
+    def verify_calib(self, calib):
+        # by firmware checksum or sampled read-back - the whole calibration is read if these disagree or are not
+        # available...
+        try:
+            self.obtain_lock()
 
-            lamp_period = self._calib_r_unsigned_int(0, NDIRCalib.INDEX_LAMP_PERIOD)
-            sample_start = self._calib_r_unsigned_int(0, NDIRCalib.INDEX_SAMPLE_START)
-            sample_end = self._calib_r_unsigned_int(0, NDIRCalib.INDEX_SAMPLE_END)
+            if self.__calib_confirmed(calib):
+                self.__cache_calib(calib)
+                return True
 
-            # range calibrations...
-            range_iaq = self._retrieve_range_calib(NDIRCalib.RANGE_IAQ)
-            range_safety = self._retrieve_range_calib(NDIRCalib.RANGE_SAFETY)
-            range_combustion = self._retrieve_range_calib(NDIRCalib.RANGE_COMBUSTION)
-            range_industrial = self._retrieve_range_calib(NDIRCalib.RANGE_INDUSTRIAL)
-            range_custom = self._retrieve_range_calib(NDIRCalib.RANGE_CUSTOM)
+            self.invalidate_calib()
 
-            return NDIRCalib(ndir_serial, board_serial, selected_range,
-                             lamp_voltage, lamp_period, sample_start, sample_end,
-                             range_iaq, range_safety, range_combustion, range_industrial, range_custom)
+            return NDIRCalibSchema.digest(self.retrieve_calib()) == NDIRCalibSchema.digest(calib)
 
         finally:
             self.release_lock()
 
 
-    def _retrieve_range_calib(self, rng):
-        # range check...
-        if not self._calib_r_unsigned_int(rng, NDIRRangeCalib.INDEX_RANGE_IS_SET):
-            return None
+    def __calib_confirmed(self, calib):
+        # the EEPROM checksum where the firmware reports one, a sampled read-back otherwise...
+        cmd = SPINDIRx1Cmd.find('cc')
+        response = self.__transact_extension(cmd)
+
+        if response is not None:
+            return cmd.decode(response)[0] == NDIRCalibSchema.digest(calib)
+
+        image = NDIRCalibSchema.encode(calib)
+
+        for block, index in NDIRCalibSchema.sample(calib):
+            if self._calib_r_bytes(block, index, len(image[(block, index)])) != image[(block, index)]:
+                return False
+
+        return True
+
+
+    def calib(self):
+        # the cached calibration - EEPROM is read only if the cache is empty or invalid...
+        try:
+            self.obtain_lock()
+
+            if self.__calib is None:
+                self.__calib = self.__restore_calib()
+
+            return self.__calib
+
+        finally:
+            self.release_lock()
+
+
+    def calib_proxy(self):
+        # a lazy view of the calibration - EEPROM fields are read only as they are accessed...
+        try:
+            self.obtain_lock()
+
+            if self.__proxy is None:
+                self.__proxy = NDIRCalibProxy(self, NDIRRangeCalib, self.__calib)
+
+            return self.__proxy
+
+        finally:
+            self.release_lock()
+
+
+    def read_calib_field(self, block, field):
+        # a single NDIRCalibSchema field, read from EEPROM and decoded - the cache is neither used nor updated...
+        try:
+            self.obtain_lock()
+
+            return field.decode(self._calib_r_bytes(block, field.index, field.size))
+
+        finally:
+            self.release_lock()
+
+
+    def read_calib_block(self, block):
+        # dict of (block, index): value, read from EEPROM - the fields of an unset range are not read...
+        try:
+            self.obtain_lock()
+
+            return self._calib_r_block(block)
 
-        # range fields...
-        zero = self._calib_r_float(rng, NDIRRangeCalib.INDEX_ZERO)
-        span = self._calib_r_float(rng, NDIRRangeCalib.INDEX_SPAN)
+        finally:
+            self.release_lock()
+
+
+    def invalidate_calib(self):
+        self.__calib = None
+        self.__proxy = None
+
+        if self.__cache_manager is not None and NDIRCalibCache.exists(self.__cache_manager, name=self.__board_name):
+            NDIRCalibCache.delete(self.__cache_manager, name=self.__board_name)
 
-        linear_b = self._calib_r_float(rng, NDIRRangeCalib.INDEX_LINEAR_B)
-        linear_c = self._calib_r_float(rng, NDIRRangeCalib.INDEX_LINEAR_C)
 
-        alpha_low = self._calib_r_float(rng, NDIRRangeCalib.INDEX_ALPHA_LOW)
-        alpha_high = self._calib_r_float(rng, NDIRRangeCalib.INDEX_ALPHA_HIGH)
+    def __restore_calib(self):
+        manager = self.__cache_manager
+        cache = None if manager is None else NDIRCalibCache.load(manager, name=self.__board_name)
+
+        if cache is not None:
+            ndir_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_NDIR_SERIAL)
+            board_serial = self._calib_r_unsigned_long(0, NDIRCalib.INDEX_BOARD_SERIAL)
+
+            if cache.matches(ndir_serial, board_serial, self.version()):
+                return cache.calib(NDIRCalib)
 
-        beta_a = self._calib_r_float(rng, NDIRRangeCalib.INDEX_BETA_A)
-        beta_o = self._calib_r_float(rng, NDIRRangeCalib.INDEX_BETA_O)
+        return self.retrieve_calib()
 
-        t_cal = self._calib_r_float(rng, NDIRRangeCalib.INDEX_T_CAL)
 
-        return NDIRRangeCalib(zero, span, linear_b, linear_c, alpha_low, alpha_high, beta_a, beta_o, t_cal)
+    def __cache_calib(self, calib):
+        self.__calib = calib
+        self.__proxy = None
+
+        if self.__cache_manager is not None:
+            NDIRCalibCache.construct(self.version(), calib, name=self.__board_name).save(self.__cache_manager)
+
+
+    def __observe_uptime(self, seconds):
+        if self.__uptime is not None and seconds < self.__uptime:
+            self.__firmware = None                      # the board has restarted - perhaps with new firmware
+            self.invalidate_calib()
+
+        self.__uptime = seconds
 
 
     def reload_calib(self):
@@ -294,7 +573,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('cl')
             self._transact(cmd)
 
-            time.sleep(cmd.execution_time)
+            self._await_completion(cmd)
 
         finally:
             self.release_lock()
@@ -341,7 +620,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('sm')
             self._transact(cmd, (mode_byte, ))
 
-            time.sleep(cmd.execution_time)
+            self._await_completion(cmd)
 
         finally:
             self.release_lock()
@@ -355,9 +634,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('sr')
             response = self._transact(cmd)
 
-            pile_ref_amplitude = Decode.unsigned_int(response[0:2], '<')
-            pile_act_amplitude = Decode.unsigned_int(response[2:4], '<')
-            thermistor_average = Decode.unsigned_int(response[4:6], '<')
+            pile_ref_amplitude, pile_act_amplitude, thermistor_average = cmd.decode(response)
 
             return pile_ref_amplitude, pile_act_amplitude, thermistor_average
 
@@ -373,9 +650,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('sv')
             response = self._transact(cmd)
 
-            pile_ref_amplitude = Decode.float(response[0:4], '<')
-            pile_act_amplitude = Decode.float(response[4:8], '<')
-            thermistor_average = Decode.float(response[8:12], '<')
+            pile_ref_amplitude, pile_act_amplitude, thermistor_average = cmd.decode(response)
 
             # print("pile_ref_amplitude: %s pile_act_amplitude: %s thermistor_average: %s" % \
             #       (pile_ref_amplitude, pile_act_amplitude, thermistor_average))
@@ -394,10 +669,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('so')
             response = self._transact(cmd)
 
-            min_ref_offset = Decode.unsigned_int(response[0:2], '<')
-            min_act_offset = Decode.unsigned_int(response[2:4], '<')
-            max_ref_offset = Decode.unsigned_int(response[4:6], '<')
-            max_act_offset = Decode.unsigned_int(response[6:8], '<')
+            min_ref_offset, min_act_offset, max_ref_offset, max_act_offset = cmd.decode(response)
 
             return min_ref_offset, min_act_offset, max_ref_offset, max_act_offset
 
@@ -414,7 +686,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('mc')
             self._transact(cmd)
 
-            time.sleep(cmd.execution_time)
+            self._await_completion(cmd)
 
         finally:
             self.release_lock()
@@ -427,9 +699,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('mr')
             response = self._transact(cmd)
 
-            pile_ref_value = Decode.unsigned_int(response[0:2], '<')
-            pile_act_value = Decode.unsigned_int(response[2:4], '<')
-            thermistor_value = Decode.unsigned_int(response[4:6], '<')
+            pile_ref_value, pile_act_value, thermistor_value = cmd.decode(response)
 
             return pile_ref_value, pile_act_value, thermistor_value
 
@@ -444,9 +714,7 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('mv')
             response = self._transact(cmd)
 
-            pile_ref_voltage = Decode.float(response[0:4], '<')
-            pile_act_voltage = Decode.float(response[4:8], '<')
-            thermistor_voltage = Decode.float(response[8:12], '<')
+            pile_ref_voltage, pile_act_voltage, thermistor_voltage = cmd.decode(response)
 
             return pile_ref_voltage, pile_act_voltage, thermistor_voltage
 
@@ -457,6 +725,19 @@ class SPINDIRx1(NDIR):
     # ----------------------------------------------------------------------------------------------------------------
 
     def record_raw(self, deferral, interval, count):
+        try:
+            self.obtain_lock()
+
+            time.sleep(self.record_start(deferral, interval, count))
+
+            return self.record_playback(count)
+
+        finally:
+            self.release_lock()
+
+
+    def record_start(self, deferral, interval, count):
+        # returns the time in seconds before the recording may be played back...
         try:
             self.obtain_lock()
 
@@ -473,28 +754,24 @@ class SPINDIRx1(NDIR):
             cmd = SPINDIRx1Cmd.find('rs')
             self._transact(cmd, param_bytes)
 
-            # wait...
+            # wait - a readiness probe cannot tell a recording that has not started from one that has finished...
             execution_time = cmd.execution_time + (((interval * count) + deferral) / 1000)
             # print("execution time: %s" % execution_time, file=sys.stderr)
 
-            time.sleep(execution_time)
-
-            # playback...
-            cmd = SPINDIRx1Cmd.find('rp')
-            cmd.return_count = count * 10
+            return execution_time
 
-            response = self._transact(cmd)
+        finally:
+            self.release_lock()
 
-            values = []
 
-            for i in range(0, cmd.return_count, 10):
-                timestamp = Decode.unsigned_int(response[i:i + 2], '<')
-                pile_ref = Decode.long(response[i + 2:i + 6], '<')
-                pile_act = Decode.long(response[i + 6:i + 10], '<')
+    def record_playback(self, count):
+        try:
+            self.obtain_lock()
 
-                values.append((timestamp, pile_ref, pile_act))
+            cmd = SPINDIRx1Cmd.find('rp')
+            response = self._transact(cmd, return_count=count * cmd.record_size)
 
-            return values
+            return cmd.decode_records(response)
 
         finally:
             self.release_lock()
@@ -508,7 +785,7 @@ class SPINDIRx1(NDIR):
 
             cmd = SPINDIRx1Cmd.find('ir')
             response = self._transact(cmd)
-            v_in_value = Decode.unsigned_int(response, '<')
+            v_in_value = cmd.decode(response)[0]
 
             return v_in_value
 
@@ -522,7 +799,7 @@ class SPINDIRx1(NDIR):
 
             cmd = SPINDIRx1Cmd.find('iv')
             response = self._transact(cmd)
-            v_in_voltage = Decode.float(response, '<')
+            v_in_voltage = cmd.decode(response)[0]
 
             return v_in_voltage
 
@@ -547,11 +824,17 @@ class SPINDIRx1(NDIR):
         try:
             self.obtain_lock()
 
+            # clear status...
+            cmd = SPINDIRx1Cmd.find('wc')
+            self._transact(cmd)
+
             # force reset...
             cmd = SPINDIRx1Cmd.find('wr')
             self._transact(cmd)
 
-            time.sleep(cmd.execution_time)
+            self.invalidate_calib()
+
+            self._await_completion(cmd, is_complete=self.__watchdog_reset_reported)
 
             # clear status...
             cmd = SPINDIRx1Cmd.find('wc')
@@ -561,6 +844,56 @@ class SPINDIRx1(NDIR):
             self.release_lock()
 
 
+    def __watchdog_reset_reported(self):
+        cmd = SPINDIRx1Cmd.find('ws')
+        response = self._transact(cmd)
+
+        return bool(response)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # single commands and readiness probes, used for diagnostics, benchmarking and the asyncio front-ends...
+
+    def command(self, name, param_group_1=None, param_group_2=None, return_count=None):
+        # the SPI transaction only - execution of the command is not awaited...
+        cmd = SPINDIRx1Cmd.find(name)
+
+        try:
+            self.obtain_lock()
+
+            return self._transact(cmd, param_group_1, param_group_2, return_count)
+
+        finally:
+            self.release_lock()
+
+
+    def is_ready(self):
+        # a single readiness probe, for callers that wait for completion themselves...
+        try:
+            self.obtain_lock()
+
+            self.__probe_ready()
+            return True
+
+        except NDIRException:
+            return False                                # busy or not responding
+
+        finally:
+            self.release_lock()
+
+
+    def await_completion(self, name):
+        cmd = SPINDIRx1Cmd.find(name)
+
+        try:
+            self.obtain_lock()
+
+            self._await_completion(cmd)
+
+        finally:
+            self.release_lock()
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # arbitrary command, used for tests purposes...
 
@@ -580,12 +913,44 @@ class SPINDIRx1(NDIR):
     # ----------------------------------------------------------------------------------------------------------------
     # low-level calib functions...
 
-    def _calib_r_unsigned_int(self, block, index):
+    def _calib_r_block(self, block):
+        # a whole block in one transaction where the firmware supports it, field by field otherwise...
+        cmd = SPINDIRx1Cmd.find('cb')
+        response = self.__transact_extension(cmd, (block, ), return_count=NDIRCalibSchema.block_size(block))
+
+        if response is not None:
+            return NDIRCalibSchema.unpack_block(block, response)
+
+        values = OrderedDict()
+
+        for field in NDIRCalibSchema.block_fields(block):
+            values[(block, field.index)] = field.decode(self._calib_r_bytes(block, field.index, field.size))
+
+            if field is NDIRCalibSchema.RANGE_IS_SET and not values[(block, field.index)]:
+                break                                   # the remaining fields of an unset range are not read
+
+        return values
+
+
+    def _calib_r_bytes(self, block, index, count):
         cmd = SPINDIRx1Cmd.find('cr')
-        cmd.return_count = 2
+        response = self._transact(cmd, (block, index), return_count=count)
+
+        return bytes(response)
+
+
+    def _calib_w_bytes(self, block, index, value_bytes):
+        cmd = SPINDIRx1Cmd.find('cw')
+
+        self._transact(cmd, (block, index), tuple(value_bytes))
 
-        response = self._transact(cmd, (block, index))
-        value = Decode.unsigned_int(response, '<')
+        self._await_completion(cmd)
+
+
+    def _calib_r_unsigned_int(self, block, index):
+        cmd = SPINDIRx1Cmd.find('cr')
+        response = self._transact(cmd, (block, index), return_count=self.__CALIB_UNSIGNED_INT.size)
+        value = self.__CALIB_UNSIGNED_INT.unpack_from(bytes(response))[0]
 
         return value
 
@@ -596,15 +961,13 @@ class SPINDIRx1(NDIR):
         value_bytes = Encode.unsigned_int(value, '<')
         self._transact(cmd, (block, index), value_bytes)
 
-        time.sleep(cmd.execution_time)
+        self._await_completion(cmd)
 
 
     def _calib_r_unsigned_long(self, block, index):
         cmd = SPINDIRx1Cmd.find('cr')
-        cmd.return_count = 4
-
-        response = self._transact(cmd, (block, index))
-        value = Decode.unsigned_long(response, '<')
+        response = self._transact(cmd, (block, index), return_count=self.__CALIB_UNSIGNED_LONG.size)
+        value = self.__CALIB_UNSIGNED_LONG.unpack_from(bytes(response))[0]
 
         return value
 
@@ -615,17 +978,15 @@ class SPINDIRx1(NDIR):
         value_bytes = Encode.unsigned_long(value, '<')
         self._transact(cmd, (block, index), value_bytes)
 
-        time.sleep(cmd.execution_time)
+        self._await_completion(cmd)
 
 
     def _calib_r_float(self, block, index):
         cmd = SPINDIRx1Cmd.find('cr')
-        cmd.return_count = 4
-
-        response = self._transact(cmd, (block, index))
-        value = Decode.float(response, '<')
+        response = self._transact(cmd, (block, index), return_count=self.__CALIB_FLOAT.size)
+        value = self.__CALIB_FLOAT.unpack_from(bytes(response))[0]
 
-        return value
+        return None if math.isnan(value) else value
 
 
     def _calib_w_float(self, block, index, value):
@@ -634,58 +995,124 @@ class SPINDIRx1(NDIR):
         value_bytes = Encode.float(value, '<')
         self._transact(cmd, (block, index), value_bytes)
 
-        time.sleep(cmd.execution_time)
+        self._await_completion(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # completion...
+
+    def _await_completion(self, cmd, timeout=None, is_complete=None):
+        # returns as soon as the board responds to a readiness probe - raises NDIRException once the timeout elapses.
+        # is_complete, if set, is a further test, made each time that the board responds...
+        timeout = cmd.execution_time if timeout is None else timeout
+
+        if timeout < self.__COMPLETION_THRESHOLD:
+            time.sleep(timeout)
+            return
+
+        deadline = time.time() + timeout
+        backoff = self.__MIN_COMPLETION_BACKOFF
+
+        time.sleep(self.__COMPLETION_SETTLE)
+
+        while True:
+            try:
+                self.__probe_ready()
+
+                if is_complete is None or is_complete():
+                    return
+
+            except NDIRException:
+                pass                                    # busy or not responding - not yet complete
+
+            remaining = deadline - time.time()
+
+            if remaining <= 0:
+                raise NDIRException('Completion timed out', None, cmd, (None, None))
+
+            time.sleep(min(backoff, remaining))
+            backoff = min(backoff * 2, self.__MAX_COMPLETION_BACKOFF)
+
+
+    def __probe_ready(self):
+        # raises NDIRException if the board is busy or not responding - its uptime is observed if it responds...
+        cmd = SPINDIRx1Cmd.find('up')
+        response = self._transact(cmd)
+
+        self.__observe_uptime(cmd.decode(response)[0])
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # SPI interactions...
 
-    def _transact(self, cmd, param_group_1=None, param_group_2=None):
+    def __transact_extension(self, cmd, param_group_1=None, param_group_2=None, return_count=None):
+        # returns None if the firmware does not implement the command, as judged by its version tag...
+        if self.__firmware is None:
+            self.__firmware = self.version()
+
+        if not cmd.is_supported(self.__firmware.tag):
+            return None
+
+        return self._transact(cmd, param_group_1, param_group_2, return_count)
+
+
+    def _transact(self, cmd, param_group_1=None, param_group_2=None, return_count=None):
         # print("cmd: %s param_group_1:%s param_group_2:%s" %
         #       (cmd, str(param_group_1), str(param_group_2)), file=sys.stderr)
 
         try:
-            self.__spi.open()
+            self.__open_spi()
 
-            # start_time = time.time()
+            deadline = time.time() + self.__BUSY_TIMEOUT
+            backoff = self.__MIN_BUSY_BACKOFF
 
-            # command...
-            self.__xfer(cmd.name_bytes())
+            while True:
+                # start_time = time.time()
 
-            if param_group_1:
-                time.sleep(self.__PARAM_DELAY)
-                self.__xfer(param_group_1)
+                # command...
+                self.__xfer(cmd.name_bytes())
 
-            if param_group_2:
-                time.sleep(self.__PARAM_DELAY)
-                self.__xfer(param_group_2)
+                if param_group_1:
+                    time.sleep(self.__PARAM_DELAY)
+                    self.__xfer(param_group_1)
 
-            # elapsed_time = time.time() - start_time
-            # print("elapsed 1: %0.6f" % elapsed_time, file=sys.stderr)
+                if param_group_2:
+                    time.sleep(self.__PARAM_DELAY)
+                    self.__xfer(param_group_2)
 
-            # wait...
-            time.sleep(cmd.response_time)
+                # elapsed_time = time.time() - start_time
+                # print("elapsed 1: %0.6f" % elapsed_time, file=sys.stderr)
 
-            # start_time = time.time()
+                # ACK / NACK / BUSY...
+                status = self.__ack_poller.poll(cmd, self.__read_status, self.__RESPONSE_COMPLETE)
+                # print("response 1: 0x%02x" % status, file=sys.stderr)
 
-            # ACK / NACK...
-            response = self.__spi.read_bytes(1)
-            # print("response 1: %s" % str(response), file=sys.stderr)
+                if status != self.__RESPONSE_BUSY or time.time() + backoff > deadline:
+                    break
+
+                # the command was rejected, not queued - it is sent again...
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.__MAX_BUSY_BACKOFF)
+
+            if status in self.__RESPONSE_NONE:
+                raise NDIRException('None received', status, cmd, (param_group_1, param_group_2))
 
-            if response[0] in self.__RESPONSE_NONE:
-                raise NDIRException('None received', response[0], cmd, (param_group_1, param_group_2))
+            if status == self.__RESPONSE_NACK:
+                raise NDIRException('NACK received', status, cmd, (param_group_1, param_group_2))
 
-            if response[0] == self.__RESPONSE_NACK:
-                raise NDIRException('NACK received', response[0], cmd, (param_group_1, param_group_2))
+            if status == self.__RESPONSE_BUSY:
+                raise NDIRException('BUSY received', status, cmd, (param_group_1, param_group_2))
 
-            if response[0] == self.__RESPONSE_BUSY:
-                raise NDIRException('BUSY received', response[0], cmd, (param_group_1, param_group_2))
+            if status != self.__RESPONSE_ACK:
+                raise NDIRException('Invalid status received', status, cmd, (param_group_1, param_group_2))
 
             # elapsed_time = time.time() - start_time
             # print("elapsed 2: %0.6f" % elapsed_time, file=sys.stderr)
 
             # return values...
-            if cmd.return_count < 1:
+            count = cmd.return_count if return_count is None else return_count
+
+            if count < 1:
                 return
 
             # wait...
@@ -693,21 +1120,26 @@ class SPINDIRx1(NDIR):
 
             # start_time = time.time()
 
-            response = self.__spi.read_bytes(cmd.return_count)
+            response = self.__spi.read_bytes(count)
             # print("response 2: %s" % str(response), file=sys.stderr)
 
             # elapsed_time = time.time() - start_time
             # print("elapsed 3: %0.6f" % elapsed_time, file=sys.stderr)
 
-            return response[0] if cmd.return_count == 1 else response
+            return response[0] if count == 1 else response
+
+        except BaseException:
+            self.__close_spi()                          # the device is reopened on the next transaction
+            raise
 
         finally:
-            self.__spi.close()
+            if not self.__persistent and self.__lock_depth == 0:
+                self.__close_spi()
 
 
     def wait(self):
         try:
-            self.__spi.open()
+            self.__open_spi()
 
             start_time = time.time()
 
@@ -717,7 +1149,28 @@ class SPINDIRx1(NDIR):
             print("wait: %s: 0x%02x" % (elapsed_time, response[0]))
 
         finally:
-            self.__spi.close()
+            if not self.__persistent and self.__lock_depth == 0:
+                self.__close_spi()
+
+
+    def __open_spi(self):
+        if self.__spi_is_open:
+            return
+
+        self.__spi.open()
+        self.__spi_is_open = True
+
+
+    def __close_spi(self):
+        if not self.__spi_is_open:
+            return
+
+        self.__spi_is_open = False
+        self.__spi.close()
+
+
+    def __read_status(self):
+        return self.__spi.read_bytes(1)[0]
 
 
     def __xfer(self, values):
@@ -727,4 +1180,5 @@ class SPINDIRx1(NDIR):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "SPINDIRx1:{interface:%s, spi:%s}" % (self.interface, self.__spi)
+        return "SPINDIRx1:{interface:%s, spi:%s, persistent:%s}" % \
+               (self.interface, self.__spi, self.__persistent)
@@ -4,6 +4,9 @@ Created on 13 Feb 2018
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
+import math
+import struct
+
 from collections import OrderedDict
 
 from scs_core.data.datum import Datum
@@ -25,40 +28,42 @@ class SPINDIRx1Cmd(JSONable):
     @classmethod
     def init(cls):
         cls.__COMMANDS = {
-            'vi': SPINDIRx1Cmd('vi', 0.001, 0.000, 40),             # version ident
-            'vt': SPINDIRx1Cmd('vt', 0.001, 0.000, 11),             # version tag
+            'vi': SPINDIRx1Cmd('vi', 0.001, 0.000, 40, '<40s'),         # version ident
+            'vt': SPINDIRx1Cmd('vt', 0.001, 0.000, 11, '<11s'),         # version tag
 
-            'up': SPINDIRx1Cmd('up', 0.001, 0.000, 4),              # uptime
+            'up': SPINDIRx1Cmd('up', 0.001, 0.000, 4, '<L'),            # uptime
 
-            'ws': SPINDIRx1Cmd('ws', 0.001, 0.000, 1),              # watchdog status
-            'wc': SPINDIRx1Cmd('wc', 0.001, 0.000, 0),              # watchdog clear
-            'wr': SPINDIRx1Cmd('wr', 0.001, 2.500, 0),              # watchdog reset
+            'ws': SPINDIRx1Cmd('ws', 0.001, 0.000, 1, '<?'),            # watchdog status
+            'wc': SPINDIRx1Cmd('wc', 0.001, 0.000, 0, None),            # watchdog clear
+            'wr': SPINDIRx1Cmd('wr', 0.001, 2.500, 0, None),            # watchdog reset
 
-            'cr': SPINDIRx1Cmd('cr', 0.002, 0.000, None),           # calib read
-            'cw': SPINDIRx1Cmd('cw', 0.004, 0.010, 0),              # calib write
-            'cl': SPINDIRx1Cmd('cl', 0.010, 2.200, 0),              # calib load
+            'cr': SPINDIRx1Cmd('cr', 0.002, 0.000, None, None),         # calib read
+            'cw': SPINDIRx1Cmd('cw', 0.004, 0.010, 0, None),            # calib write
+            'cb': SPINDIRx1Cmd('cb', 0.004, 0.000, None, None, api=4),  # calib block read (extension)
+            'cc': SPINDIRx1Cmd('cc', 0.010, 0.000, 4, '<L', api=4),     # calib checksum (extension)
+            'cl': SPINDIRx1Cmd('cl', 0.010, 2.200, 0, None),            # calib load
 
-            'lr': SPINDIRx1Cmd('lr', 0.001, 0.000, 0),              # lamp run
-            'll': SPINDIRx1Cmd('ll', 0.001, 0.000, 0),              # lamp level
+            'lr': SPINDIRx1Cmd('lr', 0.001, 0.000, 0, None),            # lamp run
+            'll': SPINDIRx1Cmd('ll', 0.001, 0.000, 0, None),            # lamp level
 
-            'ir': SPINDIRx1Cmd('ir', 0.001, 0.000, 2),              # input raw
-            'iv': SPINDIRx1Cmd('iv', 0.001, 0.000, 4),              # input voltage
+            'ir': SPINDIRx1Cmd('ir', 0.001, 0.000, 2, '<H'),            # input raw
+            'iv': SPINDIRx1Cmd('iv', 0.001, 0.000, 4, '<f'),            # input voltage
 
-            'mc': SPINDIRx1Cmd('mc', 0.001, 1.000, 0),              # measure calibrate
-            'mr': SPINDIRx1Cmd('mr', 0.001, 0.000, 6),              # measure raw
-            'mv': SPINDIRx1Cmd('mv', 0.001, 0.000, 12),             # measure voltage
+            'mc': SPINDIRx1Cmd('mc', 0.001, 1.000, 0, None),            # measure calibrate
+            'mr': SPINDIRx1Cmd('mr', 0.001, 0.000, 6, '<HHH'),          # measure raw
+            'mv': SPINDIRx1Cmd('mv', 0.001, 0.000, 12, '<fff'),         # measure voltage
 
-            'rs': SPINDIRx1Cmd('rs', 0.001, 1.100, 0),              # recorder start (time depends on period /count)
-            'rp': SPINDIRx1Cmd('rp', 0.001, 0.000, None),           # recorder play
+            'rs': SPINDIRx1Cmd('rs', 0.001, 1.100, 0, None),            # recorder start (time depends on period /count)
+            'rp': SPINDIRx1Cmd('rp', 0.001, 0.000, None, '<Hll'),       # recorder play
 
-            'sm': SPINDIRx1Cmd('sm', 0.001, 2.000, 0),              # sampler mode
-            'sr': SPINDIRx1Cmd('sr', 0.001, 0.000, 6),              # sampler raw
-            'sv': SPINDIRx1Cmd('sv', 0.001, 0.000, 12),             # sampler voltage
-            'sg': SPINDIRx1Cmd('sg', 0.010, 0.000, 12),             # sampler gas
+            'sm': SPINDIRx1Cmd('sm', 0.001, 2.000, 0, None),            # sampler mode
+            'sr': SPINDIRx1Cmd('sr', 0.001, 0.000, 6, '<HHH'),          # sampler raw
+            'sv': SPINDIRx1Cmd('sv', 0.001, 0.000, 12, '<fff'),         # sampler voltage
+            'sg': SPINDIRx1Cmd('sg', 0.010, 0.000, 12, '<fff'),         # sampler gas
 
-            'so': SPINDIRx1Cmd('so', 0.001, 0.000, 8),              # sampler offsets
+            'so': SPINDIRx1Cmd('so', 0.001, 0.000, 8, '<HHHH'),         # sampler offsets
 
-            'sp': SPINDIRx1Cmd('sp', 0.001, 0.000, 4),              # sampler actual barometric pressure
+            'sp': SPINDIRx1Cmd('sp', 0.001, 0.000, 4, '<f'),            # sampler actual barometric pressure
         }
 
 
@@ -70,9 +75,14 @@ class SPINDIRx1Cmd(JSONable):
         return cls.__COMMANDS[name]
 
 
+    @classmethod
+    def names(cls):
+        return list(cls.__COMMANDS.keys())
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, name, response_time, execution_time, return_count):
+    def __init__(self, name, response_time, execution_time, return_count, response_layout=None, api=None):
         """
         Constructor
         """
@@ -80,7 +90,13 @@ class SPINDIRx1Cmd(JSONable):
 
         self.__response_time = Datum.float(response_time, 3)            # float Seconds
         self.__execution_time = Datum.float(execution_time, 3)          # float Seconds
-        self.__return_count = Datum.int(return_count)                   # int or None
+        self.__return_count = Datum.int(return_count)                   # int or None (set per transaction)
+
+        self.__response_layout = response_layout                        # struct format string or None
+        self.__api = Datum.int(api)                                     # int firmware API level, for an extension
+
+        self.__response_struct = None if response_layout is None else struct.Struct(response_layout)
+        self.__has_floats = response_layout is not None and 'f' in response_layout
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -93,16 +109,40 @@ class SPINDIRx1Cmd(JSONable):
         jdict['response-time'] = self.response_time
         jdict['execution-time'] = self.execution_time
         jdict['return-count'] = self.return_count
+        jdict['response-layout'] = self.response_layout
+        jdict['api'] = self.api
 
         return jdict
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def is_supported(self, tag):
+        # an extension is implemented from the firmware API level that introduced it...
+        if self.api is None:
+            return True
+
+        return tag is not None and tag.api >= self.api
+
+
     def name_bytes(self):
         return ord(self.name[0]), ord(self.name[1])
 
 
+    def decode(self, response):
+        values = self.__response_struct.unpack_from(bytes(response))
+
+        if not self.__has_floats:
+            return values
+
+        return tuple(None if math.isnan(value) else value for value in values)
+
+
+    def decode_records(self, response):
+        # the response is a sequence of records, each with the response layout...
+        return list(self.__response_struct.iter_unpack(bytes(response)))
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -125,13 +165,30 @@ class SPINDIRx1Cmd(JSONable):
         return self.__return_count
 
 
-    @return_count.setter
-    def return_count(self, count):
-        self.__return_count = count
+    @property
+    def response_layout(self):
+        return self.__response_layout
+
+
+    @property
+    def api(self):
+        return self.__api
+
+
+    @property
+    def optional(self):
+        return self.__api is not None
+
+
+    @property
+    def record_size(self):
+        return None if self.__response_struct is None else self.__response_struct.size
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "NDIRCmd:{name:%s, response_time:%0.3f, execution_time:%0.3f, return_count:%s}" % \
-               (self.name, self.response_time, self.execution_time, self.return_count)
+        return "NDIRCmd:{name:%s, response_time:%0.3f, execution_time:%0.3f, return_count:%s, " \
+               "response_layout:%s, api:%s}" % \
+               (self.name, self.response_time, self.execution_time, self.return_count, self.response_layout,
+                self.api)
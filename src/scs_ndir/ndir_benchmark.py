@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The ndir_benchmark utility is used to measure the performance of the NDIR driver and its SPI transport, so that
+regressions can be found before release.
+
+The benchmark reports the latency distribution of each command, the sample rate achieved by the NDIRSampler and
+NDIRMonitor, and the end-to-end times of retrieve_calib, store_calib and record_raw. store_calib writes back the
+board's own calibration. Commands that change the operating state of the board - including the recorder, and so
+record_raw - are only benchmarked if the -x flag is set. The board is powered on again after the monitor stage.
+
+If the -e flag is set, the benchmark runs against a software emulation of the given model, and no hardware is
+required. The emulator's delays may be scaled with the -t flag.
+
+The report is written to stdout as a single JSON document.
+
+SYNOPSIS
+ndir_benchmark.py [-e MODEL [-t SCALE]] [-c REPEATS] [-s SAMPLES] [-m SECONDS] [-l REPEATS] [-r REPEATS] [-x] [-v]
+
+EXAMPLES
+./ndir_benchmark.py -e t1f1 -t 0.1 -m 0
+./ndir_benchmark.py -e x1 -x -r 1
+
+DOCUMENT EXAMPLE - OUTPUT
+{"ndir": "SPINDIRt1f1", "emulated": true, "version": {"id": "SCS NDIR emulator t1f1", "tag": "000.000.001"},
+"commands": {"vi": {"count": 20, "mean": 0.000152, "min": 0.000131, "median": 0.000148, "p90": 0.000171,
+"max": 0.000201}, ...}, "sampler": {"count": 5, "elapsed": 10.461, "rate": 0.478}, "monitor": null,
+"retrieve-calib": {...}, "store-calib": {...}, "record-raw": {...}}
+
+SEE ALSO
+scs_ndir/ndir_recorder
+scs_ndir/ndir_sampler
+"""
+
+import sys
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+from scs_ndir.cmd.cmd_ndir_benchmark import CmdNDIRBenchmark
+from scs_ndir.exception.ndir_exception import NDIRException
+
+from scs_ndir.gas.ndir.emulator.ndir_emulator import NDIREmulator
+from scs_ndir.gas.ndir.emulator.ndir_emulator_interface import NDIREmulatorInterface
+
+from scs_ndir.gas.ndir.ndir_benchmark import NDIRBenchmark
+from scs_ndir.gas.ndir.ndir_conf import NDIRConf
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1 import SPINDIRx1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    ndir_classes = {'x1': SPINDIRx1, 't1f1': SPINDIRt1f1}
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdNDIRBenchmark()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("ndir_benchmark: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        if cmd.emulate:
+            # NDIR emulator...
+            emulator = NDIREmulator(cmd.emulate, time_scale=cmd.time_scale)
+
+            ndir_conf = NDIRConf(cmd.emulate, 1)
+            ndir = ndir_classes[cmd.emulate](NDIREmulatorInterface(emulator), emulator.dev_path, spi=emulator)
+
+        else:
+            I2C.Sensors.open()
+
+            # Interface...
+            interface_conf = InterfaceConf.load(Host)
+
+            if interface_conf is None:
+                print("ndir_benchmark: InterfaceConf not available.", file=sys.stderr)
+                exit(1)
+
+            interface = interface_conf.interface()
+
+            if interface is None:
+                print("ndir_benchmark: Interface not available.", file=sys.stderr)
+                exit(1)
+
+            # NDIRConf...
+            ndir_conf = NDIRConf.load(Host)
+
+            if ndir_conf is None:
+                print("ndir_benchmark: NDIRConf not available.", file=sys.stderr)
+                exit(1)
+
+            # NDIR...
+            ndir = ndir_conf.ndir(interface, Host, persistent=True)
+
+            ndir.power_on()
+
+        if cmd.verbose:
+            print("ndir_benchmark: %s" % ndir, file=sys.stderr)
+            sys.stderr.flush()
+
+        benchmark = NDIRBenchmark(ndir)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        report = OrderedDict()
+
+        report['ndir'] = ndir.__class__.__name__
+        report['emulated'] = bool(cmd.emulate)
+        report['version'] = ndir.version()
+
+        if cmd.verbose:
+            print("ndir_benchmark: commands...", file=sys.stderr)
+
+        report['commands'] = benchmark.commands(cmd.commands, cmd.disruptive) if cmd.commands else None
+
+        if cmd.verbose:
+            print("ndir_benchmark: sampler...", file=sys.stderr)
+
+        report['sampler'] = benchmark.sampler(cmd.samples) if cmd.samples else None
+
+        if cmd.verbose:
+            print("ndir_benchmark: monitor...", file=sys.stderr)
+
+        report['monitor'] = benchmark.monitor(ndir_conf, cmd.monitor) if cmd.monitor else None
+
+        if cmd.verbose:
+            print("ndir_benchmark: calib...", file=sys.stderr)
+
+        report['retrieve-calib'] = benchmark.retrieve_calib(cmd.calib) if cmd.calib else None
+        report['store-calib'] = benchmark.store_calib(cmd.calib) if cmd.calib else None
+
+        if cmd.verbose:
+            print("ndir_benchmark: recorder...", file=sys.stderr)
+
+        recorder = cmd.recorder if cmd.disruptive else 0
+        report['record-raw'] = benchmark.record_raw(recorder, 0, 4, 250) if recorder else None
+
+        print(JSONify.dumps(report))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except NDIRException as ex:
+        print(JSONify.dumps(ex), file=sys.stderr)
+        exit(1)
+
+    except KeyboardInterrupt:
+        print("")
+
+    finally:
+        if not cmd.emulate:
+            I2C.Sensors.close()
@@ -25,12 +25,25 @@ The range set to be used is specified by the selected-range field, which must be
 An initial group of settings can be written to the EEPROM using the -d flag (default). The default settings will not
 provide an accurate calibration, but will enable the NDIR board to operate.
 
+Any number of fields may be set in a single run, either with repeated -s flags, or with the -p flag and a partial
+calibration document on stdin. All the fields are applied in one read-modify-write cycle - only the fields whose
+values change are written to the EEPROM, and each is read back as it is written. A range that is not yet set must be
+given in full, as a JSON object, using the -p flag.
+
+The stored calibration is then confirmed as a whole - by the EEPROM checksum, where the firmware reports one, or by
+reading back a sample of fields otherwise. The whole calibration is read back only if these do not match.
+
+Each store is journaled on the host. If a store is interrupted - by power loss, for example - repeating the same
+command, or using the -j flag, completes it from the first field that was not confirmed. While a range is being
+written, its is-set flag is cleared, so that a partially-written range is never used.
+
 SYNOPSIS
-ndir_calib.py [{ -d | -s PATH VALUE | -r }] [-v]
+ndir_calib.py [{ -d | -s PATH VALUE [-s PATH VALUE ...] | -p | -j | -r }] [-v]
 
 EXAMPLES
 ./ndir_calib.py -s selected-range 1
-./ndir_calib.py -s range-iaq.zero 0.644
+./ndir_calib.py -s range-iaq.zero 0.644 -s range-iaq.span 0.2203
+echo '{"range-iaq": {"zero": 0.644, "span": 0.2203}, "lamp-voltage": 4.5}' | ./ndir_calib.py -p
 
 DOCUMENT EXAMPLE
 {"ndir-serial": 12701439, "board-serial": 2000001, "selected-range": 1, "lamp-voltage": 4.5, "lamp-period": 1000,
@@ -45,6 +58,8 @@ scs_ndir/ndir_reset
 
 import sys
 
+from collections import OrderedDict
+
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
@@ -68,6 +83,10 @@ if __name__ == '__main__':
 
     cmd = CmdNDIRCalib()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("ndir_calib: %s" % cmd, file=sys.stderr)
 
@@ -113,41 +132,89 @@ if __name__ == '__main__':
 
         ndir.power_on()
 
+        stored = None
+
         if cmd.default:
             calib = calib_class.default()
 
             # save...
-            ndir.store_calib(calib)
+            changed = ndir.store_calib(calib, full=True)
+            stored = calib
+
+            if cmd.verbose:
+                print("ndir_calib: fields written: %s" % len(changed), file=sys.stderr)
+
+        elif cmd.resume:
+            changed = ndir.resume_calib()
+
+            if changed is None:
+                print("ndir_calib: no interrupted store.", file=sys.stderr)
+                exit(1)
+
+            stored = ndir.calib()
+
+            if cmd.verbose:
+                print("ndir_calib: fields written: %s" % len(changed), file=sys.stderr)
 
         elif cmd.restart:
             ndir.reload_calib()
 
         elif cmd.set():
             # retrieve...
-            calib = ndir.retrieve_calib()
+            calib = ndir.calib()
             dictionary = PathDict.construct_from_jstr(JSONify.dumps(calib))
 
+            # fields...
+            fields = OrderedDict(cmd.fields)
+
+            if cmd.patch:
+                patch = PathDict.construct_from_jstr(sys.stdin.read())
+
+                if patch is None or not isinstance(patch.node(), dict):
+                    print("ndir_calib: patch is not a JSON object.", file=sys.stderr)
+                    exit(2)
+
+                for path in patch.paths():
+                    key = path.split('.')[0]
+
+                    if dictionary.has_path(key):
+                        fields[key] = patch.node(key)           # a common field, or an unset range in full
+                    else:
+                        fields[path] = patch.node(path)
+
             # validate...
-            if not dictionary.has_path(cmd.path):
-                print("ndir_calib: field name not known: %s" % cmd.path, file=sys.stderr)
-                exit(2)
+            for path in fields:
+                if not dictionary.has_path(path):
+                    print("ndir_calib: field name not known: %s" % path, file=sys.stderr)
+                    exit(2)
 
             # set...
-            dictionary.append(cmd.path, cmd.value)
+            for path, value in fields.items():
+                dictionary.append(path, value)
+
             calib = calib_class.construct_from_jdict(dictionary.as_json())
 
             # validate...
             dictionary = PathDict.construct_from_jstr(JSONify.dumps(calib))
 
-            if dictionary.node(cmd.path) is None:
-                print("ndir_calib: field value not acceptable: %s" % cmd.value, file=sys.stderr)
-                exit(2)
+            for path, value in fields.items():
+                if dictionary.node(path) is None:
+                    print("ndir_calib: field value not acceptable: %s: %s" % (path, value), file=sys.stderr)
+                    exit(2)
 
             # save...
-            ndir.store_calib(calib)
+            changed = ndir.store_calib(calib)
+            stored = calib
+
+            if cmd.verbose:
+                print("ndir_calib: fields set: %s written: %s" % (len(fields), len(changed)), file=sys.stderr)
+
+        # confirm - by checksum or sampled read-back, with a full read only on mismatch...
+        if stored is not None and not ndir.verify_calib(stored):
+            print("ndir_calib: calibration does not match on read-back.", file=sys.stderr)
+            exit(1)
 
-        # confirm...
-        calib = ndir.retrieve_calib()
+        calib = ndir.calib()
 
         # report...
         print(JSONify.dumps(calib))
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The ndir_calib_image utility is used to export the EEPROM calibration of the NDIR SPI board as a compact binary
+image, or to import such an image to the board, in order to clone or restore calibrations across boards.
+
+The image has a fixed layout, and carries a CRC-32 - an image that is truncated or corrupted is rejected before
+anything is written. On import, only the fields whose values differ from those on the board are written, and each
+written field is verified by read-back. The stored calibration is then confirmed against the image - if it does not
+match, the utility exits with status 1.
+
+By default, the importing board keeps its own ndir-serial and board-serial - the -s flag causes the serial numbers in
+the image to be written.
+
+On import, the calibration of the board is written to stdout in JSON format.
+
+SYNOPSIS
+ndir_calib_image.py { -e | -i [-s] } [-v]
+
+EXAMPLES
+./ndir_calib_image.py -e > ndir_calib.img
+./ndir_calib_image.py -i < ndir_calib.img
+
+SEE ALSO
+scs_ndir/ndir_calib
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+from scs_ndir.cmd.cmd_ndir_calib_image import CmdNDIRCalibImage
+from scs_ndir.exception.ndir_exception import NDIRException
+
+from scs_ndir.gas.ndir.ndir_calib_image import NDIRCalibImage
+from scs_ndir.gas.ndir.ndir_conf import NDIRConf
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdNDIRCalibImage()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("ndir_calib_image: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        I2C.Sensors.open()
+
+        # Interface...
+        interface_conf = InterfaceConf.load(Host)
+
+        if interface_conf is None:
+            print("ndir_calib_image: InterfaceConf not available.", file=sys.stderr)
+            exit(1)
+
+        interface = interface_conf.interface()
+
+        if interface is None:
+            print("ndir_calib_image: Interface not available.", file=sys.stderr)
+            exit(1)
+
+        # NDIRConf...
+        ndir_conf = NDIRConf.load(Host)
+
+        if ndir_conf is None:
+            print("ndir_calib_image: NDIRConf not available.", file=sys.stderr)
+            exit(1)
+
+        # calib...
+        calib_class = ndir_conf.calib_class()
+
+        # NDIR...
+        ndir = ndir_conf.ndir(interface, Host)
+
+        if cmd.verbose:
+            print("ndir_calib_image: %s" % ndir, file=sys.stderr)
+            sys.stderr.flush()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        ndir.power_on()
+
+        if cmd.export:
+            image = NDIRCalibImage.construct(ndir.calib())
+
+            if cmd.verbose:
+                print("ndir_calib_image: %s" % image, file=sys.stderr)
+
+            sys.stdout.buffer.write(image.as_bytes())
+            sys.stdout.flush()
+
+        if cmd.import_image:
+            try:
+                image = NDIRCalibImage.construct_from_bytes(sys.stdin.buffer.read())
+                calib = image.calib(calib_class)
+
+            except ValueError as ex:
+                print("ndir_calib_image: %s" % ex, file=sys.stderr)
+                exit(1)
+
+            if cmd.verbose:
+                print("ndir_calib_image: %s" % image, file=sys.stderr)
+
+            # identity...
+            if not cmd.serials:
+                current = ndir.calib()
+
+                dictionary = PathDict.construct_from_jstr(JSONify.dumps(calib))
+                dictionary.append('ndir-serial', current.ndir_serial)
+                dictionary.append('board-serial', current.board_serial)
+
+                calib = calib_class.construct_from_jdict(dictionary.as_json())
+
+            # save...
+            changed = ndir.store_calib(calib)
+
+            if cmd.verbose:
+                print("ndir_calib_image: fields written: %s" % len(changed), file=sys.stderr)
+
+            # confirm - by checksum or sampled read-back, with a full read only on mismatch...
+            if not ndir.verify_calib(calib):
+                print("ndir_calib_image: calibration does not match on read-back.", file=sys.stderr)
+                exit(1)
+
+            # report...
+            print(JSONify.dumps(ndir.calib()))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except NDIRException as ex:
+        print(JSONify.dumps(ex), file=sys.stderr)
+        exit(1)
+
+    except KeyboardInterrupt:
+        print("", file=sys.stderr)
+
+    finally:
+        I2C.Sensors.close()
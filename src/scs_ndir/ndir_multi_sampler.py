@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The ndir_multi_sampler utility is used to report gas concentrations, amplitude voltages and barometric pressure from
+a single lamp cycle, as one document. With the -s (status) flag, the board status - restart condition, input power
+voltage and uptime - is reported with each sample.
+
+The readings are taken together, under one lock acquisition, so that a single process and a single lamp cycle
+provide what would otherwise need the ndir_sampler, ndir_pressure and ndir_status utilities, each with its own cycle.
+
+The -y (ready) and -p (pipelined) flags operate as they do for the ndir_sampler utility.
+
+SYNOPSIS
+ndir_multi_sampler.py [-i INTERVAL [-n SAMPLES] [{ -y | -p }]] [-s] [-v]
+
+EXAMPLES
+./ndir_multi_sampler.py -i 10 -s
+
+DOCUMENT EXAMPLE - OUTPUT
+{"tag": "scs-be2-3", "rec": "2026-10-18T10:12:31.204+00:00",
+"val": {"CO2": {"tmp": 36.5, "cnc-raw": 432.1, "cnc": 468.2},
+"volts": {"pile-ref-ampl": 1.9527, "pile-act-ampl": 3.2046, "therm-avg": 0.9128}, "pA": 101.6},
+"status": {"w-rst": false, "pwr-in": 4.6, "up": {"period": "00-00:08:58.000"}}}
+
+SEE ALSO
+scs_ndir/ndir_pressure
+scs_ndir/ndir_sampler
+scs_ndir/ndir_status
+"""
+
+import sys
+
+from scs_core.data.json import JSONify
+from scs_core.sync.timed_runner import TimedRunner
+from scs_core.sys.system_id import SystemID
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+from scs_ndir.cmd.cmd_ndir_multi_sampler import CmdNDIRMultiSampler
+from scs_ndir.exception.ndir_exception import NDIRException
+
+from scs_ndir.gas.ndir.ndir_conf import NDIRConf
+
+from scs_ndir.sampler.ndir_multi_sampler import NDIRMultiSampler
+from scs_ndir.sampler.ndir_pipelined_runner import NDIRPipelinedRunner
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdNDIRMultiSampler()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("ndir_multi_sampler: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        # SystemID...
+        system_id = SystemID.load(Host)
+
+        tag = None if system_id is None else system_id.message_tag()
+
+        I2C.Sensors.open()
+
+        # Interface...
+        interface_conf = InterfaceConf.load(Host)
+
+        if interface_conf is None:
+            print("ndir_multi_sampler: InterfaceConf not available.", file=sys.stderr)
+            exit(1)
+
+        interface = interface_conf.interface()
+
+        if interface is None:
+            print("ndir_multi_sampler: Interface not available.", file=sys.stderr)
+            exit(1)
+
+        # NDIRConf...
+        ndir_conf =  NDIRConf.load(Host)
+
+        if ndir_conf is None:
+            print("ndir_multi_sampler: NDIRConf not available.", file=sys.stderr)
+            exit(1)
+
+        # NDIR...
+        ndir = ndir_conf.ndir(interface, Host)
+
+        if cmd.verbose:
+            print("ndir_multi_sampler: %s" % ndir, file=sys.stderr)
+            sys.stderr.flush()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        ndir.power_on()
+
+        if cmd.pipelined:
+            runner = NDIRPipelinedRunner(cmd.interval, cmd.samples, on_overrun=lambda tick, skipped, lateness:
+                                         print("ndir_multi_sampler: overrun: tick:%d skipped:%d late:%0.3f" %
+                                               (tick, skipped, lateness), file=sys.stderr))
+        else:
+            runner = TimedRunner(cmd.interval, cmd.samples)
+
+        sampler = NDIRMultiSampler(runner, tag, ndir, status=cmd.status, ready=cmd.ready)
+
+        if cmd.verbose:
+            print("ndir_multi_sampler: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
+
+        for sample in sampler.samples():
+            print(JSONify.dumps(sample))
+            sys.stdout.flush()
+
+        if cmd.verbose and sampler.poller is not None:
+            print("ndir_multi_sampler: ready: %s" % JSONify.dumps(sampler.poller), file=sys.stderr)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except NDIRException as ex:
+        print(JSONify.dumps(ex), file=sys.stderr)
+        exit(1)
+
+    except KeyboardInterrupt:
+        print("")
+
+    finally:
+        I2C.Sensors.close()
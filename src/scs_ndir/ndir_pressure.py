@@ -12,8 +12,13 @@ is actual pressure, measured in kilopascals.
 Note that barometric pressure is not currently used by the data interpretation algorithm on board the NDIR
 microcontroller.
 
+With the -y (ready) flag, the barometer is read as soon as the triggered sample is ready, rather than after the
+worst-case sample interval. With the -p (pipelined) flag, samples are read on a fixed schedule of INTERVAL seconds,
+without drift - each sample is triggered as soon as the previous one has been read. Samples that are not ready in
+time for their tick are reported to stderr as overruns.
+
 SYNOPSIS
-ndir_pressure.py [-i INTERVAL [-n SAMPLES]] [-v]
+ndir_pressure.py [-i INTERVAL [-n SAMPLES] [{ -y | -p }]] [-v]
 
 EXAMPLES
 ./ndir_pressure.py -i 2 -n 10
@@ -37,6 +42,7 @@ from scs_host.sys.host import Host
 
 from scs_ndir.cmd.cmd_ndir_pressure import CmdNDIRPressure
 from scs_ndir.exception.ndir_exception import NDIRException
+from scs_ndir.sampler.ndir_pipelined_runner import NDIRPipelinedRunner
 from scs_ndir.sampler.ndir_pressure_sampler import NDIRPressureSampler
 
 from scs_ndir.gas.ndir.ndir_conf import NDIRConf
@@ -95,8 +101,14 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        runner = TimedRunner(cmd.interval, cmd.samples)
-        sampler = NDIRPressureSampler(runner, ndir)
+        if cmd.pipelined:
+            runner = NDIRPipelinedRunner(cmd.interval, cmd.samples, on_overrun=lambda tick, skipped, lateness:
+                                         print("ndir_pressure: overrun: tick:%d skipped:%d late:%0.3f" %
+                                               (tick, skipped, lateness), file=sys.stderr))
+        else:
+            runner = TimedRunner(cmd.interval, cmd.samples)
+
+        sampler = NDIRPressureSampler(runner, ndir, ready=cmd.ready)
 
         if cmd.verbose:
             print("ndir_pressure: %s" % sampler, file=sys.stderr)
@@ -106,6 +118,9 @@ if __name__ == '__main__':
             print(JSONify.dumps(sample))
             sys.stdout.flush()
 
+        if cmd.verbose and sampler.poller is not None:
+            print("ndir_pressure: ready: %s" % JSONify.dumps(sampler.poller), file=sys.stderr)
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
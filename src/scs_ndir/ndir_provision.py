@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The ndir_provision utility is used to calibrate a tray of NDIR SPI boards in one pass. The boards are given as a list
+of SPI device paths, and must all be of the model specified by NDIRConf.
+
+The manifest is a JSON document of calibration documents, keyed by ndir-serial. Each board is identified by the
+ndir-serial in its EEPROM, and is given the corresponding calibration. All boards are written in parallel - only
+fields that change are written, the calibration is reloaded by the microcontroller, and the calibration is then
+verified by EEPROM checksum or sampled read-back. The whole calibration is read back only if these do not match.
+
+A report is written to stdout for each board, giving the result, the number of fields written, and the time taken by
+each stage. The utility exits with status 1 if any board fails.
+
+SYNOPSIS
+ndir_provision.py -m MANIFEST [-v] DEV_PATH_1 [.. DEV_PATH_N]
+
+EXAMPLES
+./ndir_provision.py -m tray_12.json /dev/spidev0.0 /dev/spidev0.1 /dev/spidev1.0 /dev/spidev1.1
+
+MANIFEST EXAMPLE
+{"12701439": {"ndir-serial": 12701439, "board-serial": 2000001, "selected-range": 1, "lamp-voltage": 4.5, ...},
+"12701440": {"ndir-serial": 12701440, "board-serial": 2000002, "selected-range": 1, "lamp-voltage": 4.5, ...}}
+
+DOCUMENT EXAMPLE - OUTPUT
+{"dev": "/dev/spidev0.1", "ndir-serial": 12701439, "ok": true, "written": 11,
+"timing": {"read": 0.112, "store": 1.265, "reload": 2.213, "verify": 0.109}, "elapsed": 3.699, "error": null}
+
+SEE ALSO
+scs_ndir/ndir_calib
+scs_ndir/ndir_calib_image
+"""
+
+import json
+import sys
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+from scs_ndir.cmd.cmd_ndir_provision import CmdNDIRProvision
+
+from scs_ndir.gas.ndir.ndir_conf import NDIRConf
+from scs_ndir.gas.ndir.ndir_provisioner import NDIRProvisioner
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    pool = None
+    reports = []
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdNDIRProvision()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("ndir_provision: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        I2C.Sensors.open()
+
+        # Interface...
+        interface_conf = InterfaceConf.load(Host)
+
+        if interface_conf is None:
+            print("ndir_provision: InterfaceConf not available.", file=sys.stderr)
+            exit(1)
+
+        interface = interface_conf.interface()
+
+        if interface is None:
+            print("ndir_provision: Interface not available.", file=sys.stderr)
+            exit(1)
+
+        # NDIRConf...
+        ndir_conf = NDIRConf.load(Host)
+
+        if ndir_conf is None:
+            print("ndir_provision: NDIRConf not available.", file=sys.stderr)
+            exit(1)
+
+        calib_class = ndir_conf.calib_class()
+
+        # manifest...
+        try:
+            with open(cmd.manifest) as file:
+                jdict = json.load(file, object_pairs_hook=OrderedDict)
+
+        except (OSError, ValueError) as ex:
+            print("ndir_provision: manifest not readable: %s" % ex, file=sys.stderr)
+            exit(2)
+
+        manifest = OrderedDict()
+
+        for key, calib_jdict in jdict.items():
+            calib = calib_class.construct_from_jdict(calib_jdict)
+
+            if calib is None or str(calib.ndir_serial) != key:
+                print("ndir_provision: manifest entry does not match its ndir-serial: %s" % key, file=sys.stderr)
+                exit(2)
+
+            manifest[calib.ndir_serial] = calib
+
+        # NDIRPool...
+        pool = ndir_conf.ndir_pool(interface, cmd.dev_paths)
+
+        provisioner = NDIRProvisioner(pool, manifest)
+
+        if cmd.verbose:
+            print("ndir_provision: %s" % provisioner, file=sys.stderr)
+            sys.stderr.flush()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        pool.power_on()
+
+        start_time = time.time()
+        reports = provisioner.provision()
+
+        for report in reports:
+            print(JSONify.dumps(report))
+            sys.stdout.flush()
+
+        if cmd.verbose:
+            passed = len([report for report in reports if report.ok])
+            print("ndir_provision: boards: %d passed: %d elapsed: %0.3f" %
+                  (len(reports), passed, time.time() - start_time), file=sys.stderr)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print("", file=sys.stderr)
+
+    finally:
+        if pool is not None:
+            pool.close()
+
+        I2C.Sensors.close()
+
+    if not all(report.ok for report in reports):
+        exit(1)
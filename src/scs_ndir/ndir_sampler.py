@@ -17,13 +17,28 @@ NDIR microcontroller at any time to obtain the most recent value.
 
 Returned values are voltages when the -r (raw) flag is set, otherwise the values are gas concentrations.
 
+By default, each sample is read after the worst-case sample interval. With the -y (ready) flag, the sample is polled
+for, and is read as soon as the NDIR microcontroller has it - in verbose mode, the observed ready times are reported
+at the end of the run.
+
+With the -c (continuous) flag, the board is switched to continuous mode, and every on-board sample is reported as it
+appears, without the host triggering any lamp cycle. The number of samples is unbounded unless -n is given. A sample
+whose voltages are unchanged from the previous sample is reported with its repeat flag set. This mode is available on
+the x1 board only, and leaves the board in continuous mode.
+
+With the -p (pipelined) flag, samples are read on a fixed schedule of INTERVAL seconds, without drift. Each sample
+is triggered as soon as the previous sample has been read, and is timestamped at the middle of its sample interval.
+Where a sample is not ready in time for its tick - because INTERVAL is shorter than the lamp cycle, for example -
+the overrun is reported to stderr, and the sample is read at the following tick.
+
 When in single-shot mode, the -o (offset) mode can be used to find the time offset of REF and ACT maxima and minima.
 
 SYNOPSIS
-ndir_sampler.py { -m { 0 | 1 } | [-i INTERVAL [-n SAMPLES] [-r]] | -o } [-v]
+ndir_sampler.py { -m { 0 | 1 } | [-i INTERVAL [-n SAMPLES] [-r] [{ -y | -p }]] | -c [-n SAMPLES] | -o } [-v]
 
 EXAMPLES
 ./ndir_sampler.py -v -i 1.0
+./ndir_sampler.py -c -n 600
 
 DOCUMENT EXAMPLES - OUTPUT
 {"tag": "scs-be2-3", "rec": "2018-06-04T15:53:34.939+00:00",
@@ -32,6 +47,9 @@ DOCUMENT EXAMPLES - OUTPUT
 {"tag": "scs-be2-3", "rec": "2018-06-04T15:53:27.966+00:00",
 "val": {"CO2": {"tmp": 36.5, "cnc-raw": 432.1, "cnc": 468.2}}}
 
+{"tag": "scs-be2-3", "rec": "2026-10-18T10:12:31.204+00:00",
+"val": {"CO2": {"tmp": 36.5, "cnc-raw": 432.1, "cnc": 468.2}}, "repeat": false}
+
 SEE ALSO
 scs_ndir/ndir_measure
 scs_ndir/ndir_recorder
@@ -55,7 +73,9 @@ from scs_ndir.exception.ndir_exception import NDIRException
 
 from scs_ndir.gas.ndir.ndir_conf import NDIRConf
 
+from scs_ndir.sampler.ndir_pipelined_runner import NDIRPipelinedRunner
 from scs_ndir.sampler.ndir_sampler import NDIRSampler
+from scs_ndir.sampler.ndir_stream_sampler import NDIRStreamSampler
 from scs_ndir.sampler.ndir_voltage_sampler import NDIRVoltageSampler
 
 
@@ -125,9 +145,32 @@ if __name__ == '__main__':
             print(JSONify.dumps(datum))
             sys.stdout.flush()
 
+        elif cmd.continuous:
+            if not hasattr(ndir, 'get_sample_mode'):
+                print("ndir_sampler: continuous mode is not supported by %s." % ndir.__class__.__name__,
+                      file=sys.stderr)
+                exit(2)
+
+            sampler = NDIRStreamSampler(tag, ndir, sample_count=cmd.samples)
+
+            if cmd.verbose:
+                print("ndir_sampler: %s" % sampler, file=sys.stderr)
+                sys.stderr.flush()
+
+            for sample in sampler.samples():
+                print(JSONify.dumps(sample))
+                sys.stdout.flush()
+
         else:
-            runner = TimedRunner(cmd.interval, cmd.samples)
-            sampler = NDIRVoltageSampler(runner, tag, ndir) if cmd.raw else NDIRSampler(runner, tag, ndir)
+            if cmd.pipelined:
+                runner = NDIRPipelinedRunner(cmd.interval, cmd.samples, on_overrun=lambda tick, skipped, lateness:
+                                             print("ndir_sampler: overrun: tick:%d skipped:%d late:%0.3f" %
+                                                   (tick, skipped, lateness), file=sys.stderr))
+            else:
+                runner = TimedRunner(cmd.interval, cmd.samples)
+
+            sampler = NDIRVoltageSampler(runner, tag, ndir, ready=cmd.ready) if cmd.raw else \
+                NDIRSampler(runner, tag, ndir, ready=cmd.ready)
 
             if cmd.verbose:
                 print("ndir_sampler: %s" % sampler, file=sys.stderr)
@@ -137,6 +180,9 @@ if __name__ == '__main__':
                 print(JSONify.dumps(sample))
                 sys.stdout.flush()
 
+            if cmd.verbose and sampler.poller is not None:
+                print("ndir_sampler: ready: %s" % JSONify.dumps(sampler.poller), file=sys.stderr)
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
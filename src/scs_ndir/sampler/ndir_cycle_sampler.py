@@ -0,0 +1,92 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The sampling cycle shared by the NDIR samplers: a lamp cycle is triggered, the sampler then sleeps for the sample
+interval - or, if ready is set, polls for the reading - and the reading is then taken by readout(rec). The timestamp
+is that of the trigger.
+
+Subclasses implement readout(rec), and may override trigger(). Because trigger() and readout(rec) are offered
+separately, the samplers may also be driven by an NDIRPipelinedRunner.
+"""
+
+import time
+
+from abc import abstractmethod
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.sampler.sampler import Sampler
+
+from scs_ndir.sampler.ndir_ready_poller import NDIRReadyPoller
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRCycleSampler(Sampler):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, runner, ndir, ready=False):
+        """
+        Constructor
+        """
+        Sampler.__init__(self, runner)
+
+        self.__ndir = ndir
+
+        self.__interval = self.__ndir.get_sample_interval()
+        self.__poller = NDIRReadyPoller(self.__interval) if ready else None       # polls, rather than sleeps
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sample(self):
+        rec = LocalizedDatetime.now().utc()
+        start_time = time.time()
+
+        self.trigger()
+
+        if self.__poller is not None:
+            return self.__poller.poll(lambda: self._poll(rec), start_time)
+
+        try:
+            time.sleep(self.__interval)
+        except KeyboardInterrupt:
+            pass
+
+        return self.readout(rec)
+
+
+    def trigger(self):
+        self.__ndir.sample()
+
+
+    @abstractmethod
+    def readout(self, rec):
+        pass
+
+
+    def _poll(self, rec):
+        # the read that is polled for, until the board has the sample - by default, the readout itself...
+        return self.readout(rec)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ndir(self):
+        return self.__ndir
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def poller(self):
+        return self.__poller
@@ -0,0 +1,74 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads gas, amplitude voltages and barometric pressure - and, optionally, the board status - from a single lamp cycle.
+The readings are taken as one batch, under one lock acquisition, and are reported as one NDIRMultiDatum.
+
+Like the other NDIR samplers, the sampler is an NDIRCycleSampler, and so may be pipelined. The sampling scheme is
+decided by the model. A t1f1 board is triggered on each sample. An x1 board is put into continuous mode when
+the sampler is constructed, and is not triggered - the readings are those of its most recent lamp cycle.
+"""
+
+from scs_ndir.datum.ndir_multi_datum import NDIRMultiDatum
+from scs_ndir.datum.ndir_sampler_voltage_datum import NDIRSampleVoltageDatum
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1 import SPINDIRx1
+from scs_ndir.sampler.ndir_cycle_sampler import NDIRCycleSampler
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRMultiSampler(NDIRCycleSampler):
+    """
+    classdocs
+    """
+
+    __COMMANDS = ('gas', 'voltage', 'pressure')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, runner, tag, ndir, status=False, ready=False):
+        """
+        Constructor
+        """
+        self.__triggered = not isinstance(ndir, SPINDIRx1)
+
+        if not self.__triggered:
+            ndir.get_sample_mode(False)                 # continuous - a single-shot board would not be re-sampled
+
+        NDIRCycleSampler.__init__(self, runner, ndir, ready=ready)
+
+        self.__tag = tag
+        self.__status = status                          # if True, the board status is read with each sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def trigger(self):
+        if self.__triggered:
+            NDIRCycleSampler.trigger(self)
+
+
+    def readout(self, rec):
+        commands = self.__COMMANDS + ('status', ) if self.__status else self.__COMMANDS
+        results = self.ndir.batch(*commands)
+
+        voltage_datum = NDIRSampleVoltageDatum.construct_from_sample(results['voltage'])
+
+        return NDIRMultiDatum(self.__tag, rec, results['gas'], voltage_datum, results['pressure'],
+                              status=results.get('status'))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def status(self):
+        return self.__status
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRMultiSampler:{runner:%s, tag:%s, ndir:%s, status:%s, interval:%s, poller:%s}" % \
+               (self.runner, self.__tag, self.ndir, self.status, self.interval, self.poller)
@@ -0,0 +1,137 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Runs a triggered NDIR sampler on a fixed schedule. Each sample is read out at a tick, and the next sample is triggered
+immediately afterwards, so that its lamp cycle runs while the runner waits for the following tick.
+
+Ticks are scheduled at whole multiples of the interval from the start of the run, so that the cadence does not drift.
+A sample is timestamped at the middle of its sample interval, not at the tick.
+
+A sample cannot be read out before its sample interval has elapsed. Where this is later than the tick, the sample is
+read out at the next tick that follows it - the skipped ticks are reported as an overrun, and the schedule is held.
+
+The sampler must offer trigger(), readout(rec) and the sample interval. The NDIR samplers, as NDIRCycleSamplers, do so.
+"""
+
+import math
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.sync.runner import Runner
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRPipelinedRunner(Runner):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, interval, sample_count=None, on_overrun=None):
+        """
+        Constructor
+        """
+        self.__interval = interval                      # float seconds
+        self.__sample_count = sample_count              # int, or None for an unbounded run
+        self.__on_overrun = on_overrun                  # function of (tick, skipped_ticks, lateness), or None
+
+        self.__start_time = None                        # float timestamp of tick 0
+        self.__overruns = 0                             # int count of overrun events
+        self.__skipped_ticks = 0                        # int count of ticks skipped by overruns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def samples(self, sampler):
+        self.reset()
+
+        tick = 0
+        count = 0
+
+        trigger_time = self.__trigger(sampler)
+
+        try:
+            while self.__sample_count is None or count < self.__sample_count:
+                tick += 1
+                ready_time = trigger_time + sampler.interval
+
+                # overrun...
+                if ready_time > self.__tick_time(tick):
+                    lateness = ready_time - self.__tick_time(tick)
+                    skipped = math.ceil(lateness / self.__interval)
+
+                    self.__overruns += 1
+                    self.__skipped_ticks += skipped
+
+                    if self.__on_overrun is not None:
+                        self.__on_overrun(tick, skipped, lateness)
+
+                    tick += skipped
+
+                # wait...
+                time.sleep(max(self.__tick_time(tick) - time.time(), 0))
+
+                # read out, then trigger the next...
+                rec = LocalizedDatetime.construct_from_timestamp(trigger_time + sampler.interval / 2).utc()
+                sample = sampler.readout(rec)
+
+                trigger_time = self.__trigger(sampler)
+                count += 1
+
+                yield sample
+
+        except KeyboardInterrupt:
+            return
+
+
+    def reset(self):
+        self.__start_time = time.time()
+        self.__overruns = 0
+        self.__skipped_ticks = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __tick_time(self, tick):
+        return self.__start_time + tick * self.__interval
+
+
+    @staticmethod
+    def __trigger(sampler):
+        trigger_time = time.time()
+        sampler.trigger()
+
+        return trigger_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def sample_count(self):
+        return self.__sample_count
+
+
+    @property
+    def overruns(self):
+        return self.__overruns
+
+
+    @property
+    def skipped_ticks(self):
+        return self.__skipped_ticks
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRPipelinedRunner:{interval:%s, sample_count:%s, overruns:%s, skipped_ticks:%s}" % \
+               (self.interval, self.sample_count, self.overruns, self.skipped_ticks)
@@ -0,0 +1,60 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Each tick yields one NDIRPoolDatum per board, identified by dev path and NDIR serial number. A board that failed on
+the tick is reported in the same stream, with its error in place of a value.
+"""
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.sampler.sampler import Sampler
+
+from scs_ndir.datum.ndir_pool_datum import NDIRPoolDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRPoolSampler(Sampler):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, runner, tag, pool):
+        """
+        Constructor
+        """
+        Sampler.__init__(self, runner)
+
+        self.__tag = tag
+        self.__pool = pool
+
+        self.__report = []                              # list of NDIRPoolReading - the most recent tick
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sample(self):
+        rec = LocalizedDatetime.now().utc()
+
+        try:
+            self.__report = self.__pool.sample()
+        except KeyboardInterrupt:
+            return []
+
+        return [NDIRPoolDatum.construct_from_reading(self.__tag, rec, reading) for reading in self.__report]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def report(self):
+        return self.__report
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRPoolSampler:{runner:%s, tag:%s, pool:%s}" % (self.runner, self.__tag, self.__pool)
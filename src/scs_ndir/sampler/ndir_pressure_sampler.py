@@ -4,52 +4,42 @@ Created on 31 Jul 2018
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import time
-
-from scs_core.data.datetime import LocalizedDatetime
-from scs_core.sampler.sampler import Sampler
-
 from scs_ndir.datum.ndir_pressure_datum import NDIRPressureDatum
+from scs_ndir.sampler.ndir_cycle_sampler import NDIRCycleSampler
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class NDIRPressureSampler(Sampler):
+class NDIRPressureSampler(NDIRCycleSampler):
     """
     classdocs
     """
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, runner, ndir):
+    def __init__(self, runner, ndir, ready=False):
         """
         Constructor
         """
-        Sampler.__init__(self, runner)
-
-        self.__ndir = ndir
-
-        self.__interval = self.__ndir.get_sample_interval()
+        NDIRCycleSampler.__init__(self, runner, ndir, ready=ready)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def sample(self):
-        rec = LocalizedDatetime.now().utc()
+    def readout(self, rec):
+        p_a = self.ndir.get_sample_pressure()
 
-        self.__ndir.sample()
+        return NDIRPressureDatum(rec, p_a)
 
-        try:
-            time.sleep(self.__interval)
-        except KeyboardInterrupt:
-            pass
 
-        p_a = self.__ndir.get_sample_pressure()
+    def _poll(self, rec):
+        self.ndir.get_sample_gas()                      # the barometer is read with the gas
 
-        return NDIRPressureDatum(rec, p_a)
+        return self.readout(rec)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "NDIRPressureSampler:{runner:%s, ndir:%s, interval:%s}" % (self.runner, self.__ndir, self.__interval)
+        return "NDIRPressureSampler:{runner:%s, ndir:%s, interval:%s, poller:%s}" % \
+               (self.runner, self.ndir, self.interval, self.poller)
@@ -0,0 +1,103 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Waits for a triggered NDIR sample by polling for it, in place of sleeping for the whole sample interval. A read that is
+answered with BUSY (x1) or with no response (t1f1) is taken as "not yet", and is retried on a short, bounded backoff
+schedule. The sample interval is the deadline.
+
+The observed time from trigger to ready is recorded, so that polling starts shortly before the sample is expected.
+
+document example:
+{"count": 12, "avg": 1.2817, "min": 1.2604, "max": 1.3092}
+"""
+
+import time
+
+from scs_core.data.json import JSONable
+
+from scs_ndir.exception.ndir_exception import NDIRException
+from scs_ndir.gas.ndir.ndir_ack_poller import NDIRLatency
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRReadyPoller(JSONable):
+    """
+    classdocs
+    """
+
+    __NOT_READY = ('None received', 'BUSY received')
+
+    __MIN_BACKOFF =                     0.005           # seconds
+    __MAX_BACKOFF =                     0.050           # seconds
+
+    __LEAD_FACTOR =                     0.8             # first poll as a fraction of the learned ready time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, interval):
+        """
+        Constructor
+        """
+        self.__interval = interval                      # float seconds - the worst-case sample interval
+        self.__ready_time = NDIRLatency()               # the observed time from trigger to ready
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def poll(self, read, start_time=None):
+        # read is called until it returns - start_time is that of the trigger...
+        start_time = time.time() if start_time is None else start_time
+        deadline = start_time + self.__interval
+
+        time.sleep(max(start_time + self.initial_wait() - time.time(), 0))
+
+        backoff = self.__MIN_BACKOFF
+
+        while True:
+            try:
+                value = read()
+                self.__ready_time.append(time.time() - start_time)
+
+                return value
+
+            except NDIRException as ex:
+                if ex.problem not in self.__NOT_READY or time.time() + backoff > deadline:
+                    raise
+
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.__MAX_BACKOFF)
+
+
+    def initial_wait(self):
+        if self.__ready_time.avg is None:
+            return 0.0                                  # nothing learned yet - poll from the start
+
+        return min(self.__ready_time.min * self.__LEAD_FACTOR, self.__interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        return self.__ready_time.as_json()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def ready_time(self):
+        return self.__ready_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRReadyPoller:{interval:%s, ready_time:%s}" % (self.interval, self.ready_time)
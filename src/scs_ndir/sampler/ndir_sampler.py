@@ -4,48 +4,33 @@ Created on 21 Feb 2018
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import time
-
-from scs_core.data.datetime import LocalizedDatetime
-
 from scs_core.sample.gases_sample import GasesSample
-from scs_core.sampler.sampler import Sampler
+
+from scs_ndir.sampler.ndir_cycle_sampler import NDIRCycleSampler
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
-class NDIRSampler(Sampler):
+class NDIRSampler(NDIRCycleSampler):
     """
     classdocs
     """
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, runner, tag, ndir):
+    def __init__(self, runner, tag, ndir, ready=False):
         """
         Constructor
         """
-        Sampler.__init__(self, runner)
+        NDIRCycleSampler.__init__(self, runner, ndir, ready=ready)
 
         self.__tag = tag
-        self.__ndir = ndir
-
-        self.__interval = self.__ndir.get_sample_interval()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def sample(self):
-        rec = LocalizedDatetime.now().utc()
-
-        self.__ndir.sample()
-
-        try:
-            time.sleep(self.__interval)
-        except KeyboardInterrupt:
-            pass
-
-        co2_datum = self.__ndir.get_sample_gas()
+    def readout(self, rec):
+        co2_datum = self.ndir.get_sample_gas()
 
         return GasesSample(self.__tag, rec, co2_datum, None, None)
 
@@ -53,5 +38,5 @@ class NDIRSampler(Sampler):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "NDIRSampler:{runner:%s, tag:%s, ndir:%s, interval:%s}" % \
-               (self.runner, self.__tag, self.__ndir, self.__interval)
+        return "NDIRSampler:{runner:%s, tag:%s, ndir:%s, interval:%s, poller:%s}" % \
+               (self.runner, self.__tag, self.ndir, self.interval, self.poller)
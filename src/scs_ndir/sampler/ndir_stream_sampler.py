@@ -0,0 +1,170 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Streams the samples of an x1 board in continuous mode. The board is switched to continuous mode once, and then samples
+at the rate set by its lamp period - the host never triggers a cycle, and so is never blocked waiting for one.
+
+A new on-board sample is detected by a change in its pile and thermistor voltages, which are polled on a short,
+bounded backoff schedule. The nominal sample period is the lamp period of the board's calibration. The observed sample
+period is recorded, so that polling starts shortly before the next sample is expected. The gas reading is then read
+once for each new sample.
+
+The firmware reports no sample counter, and two samples may have identical voltages. If the board responds, but its
+voltages have not changed once the sample is overdue, the sample is reported with its repeat flag set. An error is
+raised if the board does not respond at all, or if more than a few consecutive samples are repeats.
+
+The board is left in continuous mode.
+
+example use:
+sampler = NDIRStreamSampler(tag, ndir, sample_count=100)
+
+for sample in sampler.samples():
+    print(JSONify.dumps(sample))
+"""
+
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_ndir.datum.ndir_stream_datum import NDIRStreamDatum
+from scs_ndir.exception.ndir_exception import NDIRException
+from scs_ndir.gas.ndir.ndir_ack_poller import NDIRLatency
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NDIRStreamSampler(object):
+    """
+    classdocs
+    """
+
+    __NOT_READY = ('None received', 'BUSY received')
+
+    __MIN_BACKOFF =                     0.005           # seconds
+    __MAX_BACKOFF =                     0.050           # seconds
+
+    __LEAD_FACTOR =                     0.9             # first poll as a fraction of the learned sample period
+    __REPEAT_FACTOR =                   1.5             # unchanged after this multiple of the interval: a repeat
+    __TIMEOUT_FACTOR =                  3.0             # deadline as a multiple of the nominal sample interval
+
+    __MAX_REPEATS =                     3               # consecutive repeats before the stream is deemed stalled
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tag, ndir, sample_count=None):
+        """
+        Constructor
+        """
+        self.__tag = tag                                # string
+        self.__ndir = ndir                              # SPINDIRx1
+        self.__sample_count = sample_count              # int, or None for an unbounded stream
+
+        self.__interval = self.__lamp_period()          # the nominal time between on-board samples
+        self.__period = NDIRLatency()                   # the observed time between on-board samples
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def samples(self):
+        self.__ndir.get_sample_mode(False)              # continuous
+
+        voltages = self.__read_voltages()
+        sampled_time = None
+        repeats = 0
+        count = 0
+
+        while self.__sample_count is None or count < self.__sample_count:
+            voltages, is_repeat = self.__await_change(voltages, sampled_time)
+
+            rec = LocalizedDatetime.now().utc()
+            now = time.time()
+
+            repeats = repeats + 1 if is_repeat else 0
+
+            if repeats > self.__MAX_REPEATS:
+                raise NDIRException.construct('Repeated sample', None, None, None, None)
+
+            if sampled_time is not None and not is_repeat:
+                self.__period.append(now - sampled_time)
+
+            sampled_time = None if is_repeat else now   # the time of a repeated sample is not known
+            count += 1
+
+            yield NDIRStreamDatum(self.__tag, rec, self.__ndir.sample(), is_repeat)
+
+
+    def initial_wait(self):
+        if self.__period.min is None:
+            return 0.0                                  # nothing learned yet - poll from the start
+
+        return self.__period.min * self.__LEAD_FACTOR
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __await_change(self, voltages, sampled_time):
+        # returns (voltages, is_repeat)...
+        start_time = time.time() if sampled_time is None else sampled_time
+        repeat_time = start_time + self.__interval * self.__REPEAT_FACTOR
+        deadline = start_time + self.__interval * self.__TIMEOUT_FACTOR
+
+        time.sleep(max(start_time + self.initial_wait() - time.time(), 0))
+
+        backoff = self.__MIN_BACKOFF
+
+        while True:
+            latest = self.__read_voltages()
+
+            if latest is not None and latest != voltages:
+                return latest, False
+
+            if latest is not None and time.time() >= repeat_time:
+                return latest, True                     # the board is sampling, with unchanged voltages
+
+            if time.time() + backoff > deadline:
+                raise NDIRException.construct('No new sample', None, None, None, None)
+
+            time.sleep(backoff)
+            backoff = min(backoff * 2, self.__MAX_BACKOFF)
+
+
+    def __lamp_period(self):
+        lamp_period = self.__ndir.calib_proxy().lamp_period
+
+        if not lamp_period:
+            return self.__ndir.get_sample_interval()    # no lamp period is set
+
+        return lamp_period / 1000                       # milliseconds
+
+
+    def __read_voltages(self):
+        try:
+            return self.__ndir.get_sample_voltage()
+
+        except NDIRException as ex:
+            if ex.problem not in self.__NOT_READY:
+                raise
+
+            return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sample_count(self):
+        return self.__sample_count
+
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NDIRStreamSampler:{tag:%s, ndir:%s, sample_count:%s, interval:%s, period:%s}" % \
+               (self.__tag, self.__ndir, self.sample_count, self.__interval, self.period)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_ndir.gas.ndir.emulator.ndir_emulator import NDIREmulator
+from scs_ndir.gas.ndir.emulator.ndir_emulator_interface import NDIREmulatorInterface
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+from scs_ndir.gas.ndir.spi_ndir_x1.spi_ndir_x1 import SPINDIRx1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+for ndir_class, model in ((SPINDIRx1, 'x1'), (SPINDIRt1f1, 't1f1')):
+    emulator = NDIREmulator(model, time_scale=0.1)
+    print(emulator)
+
+    ndir = ndir_class(NDIREmulatorInterface(emulator), emulator.dev_path, persistent=True, spi=emulator)
+    print("ndir: %s" % ndir)
+    print("-")
+
+    print("version: %s" % ndir.version())
+    print("status: %s" % ndir.status())
+
+    start_time = time.time()
+    calib = ndir.retrieve_calib()
+    print("retrieve_calib: %0.3f: %s" % (time.time() - start_time, JSONify.dumps(calib)))
+
+    start_time = time.time()
+    ndir.store_calib(calib)
+    ndir.reload_calib()
+    print("store_calib: %0.3f" % (time.time() - start_time))
+
+    time.sleep(0.2)
+
+    for _ in range(5):
+        if model == 'x1':
+            datum = ndir.sample()
+
+        else:
+            ndir.sample()
+            time.sleep(ndir.get_sample_interval() * emulator.time_scale)
+            datum = ndir.get_sample_gas()
+
+        print("sample: %s" % JSONify.dumps(datum))
+
+    start_time = time.time()
+    records = ndir.record_raw(0, 5, 250)
+    print("record_raw: %0.3f: %d records" % (time.time() - start_time, len(records)))
+
+    print("latency: %s" % JSONify.dumps(ndir.ack_poller))
+    print("=")
+
+    ndir.close()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Checks the ordering assumption of NDIRSharedRecord: a reader in one process never sees a torn record while a writer in
+another process is writing as fast as it can. Every field of a record holds the same value, so a torn read shows as
+a mismatch. Run on each target CPU - notably ARM.
+"""
+
+import time
+
+from multiprocessing import Process
+
+from scs_ndir.gas.ndir.ndir_shared_record import NDIRSharedRecord
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def write(shared_record):
+    i = 0
+
+    while True:
+        i += 1
+        shared_record.write({'a': i, 'b': i, 'c': None if i % 7 == 0 else i})
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+READS = 100000
+
+record = NDIRSharedRecord(('a', 'b', 'c'))
+print(record)
+
+print("before write: %s" % record.read())
+print("-")
+
+writer = Process(target=write, args=(record, ), daemon=True)
+writer.start()
+
+time.sleep(0.2)
+
+torn = 0
+start_time = time.time()
+
+for _ in range(READS):
+    jdict = record.read()
+
+    if jdict['a'] != jdict['b'] or (jdict['c'] is not None and jdict['c'] != jdict['a']):
+        torn += 1
+
+elapsed_time = time.time() - start_time
+
+writer.terminate()
+writer.join()
+
+print("reads: %d torn: %d mean read: %0.1f us" % (READS, torn, elapsed_time / READS * 1e6))
+print(record)
+
+assert torn == 0
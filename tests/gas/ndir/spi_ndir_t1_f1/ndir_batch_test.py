@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.Sensors.open()
+
+    # ------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    # Interface...
+    interface_conf = InterfaceConf.load(Host)
+
+    if interface_conf is None:
+        print("InterfaceConf not available.")
+        exit(1)
+
+    interface = interface_conf.interface()
+    print(interface)
+
+    # NDIR...
+    ndir = SPINDIRt1f1(interface, Host.ndir_spi_dev_path())
+    print("ndir: %s" % ndir)
+    print("-")
+
+    ndir.power_on()
+
+    interval = ndir.get_sample_interval()
+    print("interval: %s" % interval)
+    print("-")
+
+    # ------------------------------------------------------------------------------------------------------------
+    # run...
+
+    ndir.sample()
+
+    for _ in range(10):
+        time.sleep(interval)
+
+        start_time = time.time()
+        results = ndir.batch('gas', 'voltage', 'pressure', 'status', 'sample')
+        elapsed_time = time.time() - start_time
+
+        print("%0.3f: %s" % (elapsed_time, JSONify.dumps(results)))
+
+except KeyboardInterrupt:
+    pass
+
+finally:
+    I2C.Sensors.close()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_dfe.interface.interface_conf import InterfaceConf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+from scs_ndir.gas.ndir.spi_ndir_t1_f1.spi_ndir_t1_f1 import SPINDIRt1f1
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.Sensors.open()
+
+    # ------------------------------------------------------------------------------------------------------------
+    # resources...
+
+    # Interface...
+    interface_conf = InterfaceConf.load(Host)
+
+    if interface_conf is None:
+        print("InterfaceConf not available.")
+        exit(1)
+
+    interface = interface_conf.interface()
+    print(interface)
+
+    # NDIR...
+    ndir = SPINDIRt1f1(interface, Host.ndir_spi_dev_path())
+    print("ndir: %s" % ndir)
+    print("-")
+
+    ndir.power_on()
+
+    # ------------------------------------------------------------------------------------------------------------
+    # run...
+
+    for persistent in (False, True):
+        ndir = SPINDIRt1f1(interface, Host.ndir_spi_dev_path(), persistent=persistent)
+        print("ndir: %s" % ndir)
+
+        start_time = time.time()
+
+        for _ in range(100):
+            ndir.status()
+
+        elapsed_time = time.time() - start_time
+        print("persistent: %s status x 100: %0.3f" % (persistent, elapsed_time))
+
+        ndir.close()
+        print("-")
+
+except KeyboardInterrupt:
+    pass
+
+finally:
+    I2C.Sensors.close()